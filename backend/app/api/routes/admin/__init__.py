@@ -10,6 +10,7 @@ from app.api.routes.admin.usage_history import router as usage_history_router
 from app.api.routes.admin.maintenance_status import router as maintenance_status_router
 from app.api.routes.admin.maintenance_history import router as maintenance_history_router
 from app.api.routes.admin.dashboard import router as dashboard_router
+from app.api.routes.admin.monitoring import router as monitoring_router
 
 admin_router = APIRouter(prefix="/admin", tags=["Admin"])   
 
@@ -23,4 +24,5 @@ admin_router.include_router(usage_history_router)
 admin_router.include_router(maintenance_history_router)
 admin_router.include_router(maintenance_status_router)
 admin_router.include_router(module_type_router)
-admin_router.include_router(dashboard_router)
\ No newline at end of file
+admin_router.include_router(dashboard_router)
+admin_router.include_router(monitoring_router)
\ No newline at end of file
@@ -1,11 +1,13 @@
 from fastapi import APIRouter, Depends, Query
-from sqlmodel import Session
-from app.core.database import get_session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.core.database import get_async_session
 from app.core.jwt import JWTPayload, jwt_handler
+from app.core.response_cache import DashboardCacheTag, dashboard_cache
 from app.services.admin.dashboard_service import DashboardService
 from app.api.schemas.admin.dashboard_schema import (
     CountResponse,
     ChartListResponse,
+    DashboardSnapshotResponse,
     OptionPopularityResponse,
     RentalCountListResponse,
     MaintenanceCostListResponse,
@@ -14,6 +16,30 @@ from typing import List
 
 router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
 
+# 모든 엔드포인트는 dashboard_cache로 DASHBOARD_CACHE_TTL_SECONDS 동안 응답 데이터를 재사용합니다.
+# 렌트/정비/아이템 서비스가 커밋하면 관련 태그의 항목이 폐기됩니다.
+
+# ── 첫 화면 스냅샷 ──
+
+@router.get(
+    "/snapshot",
+    response_model=DashboardSnapshotResponse,
+    summary="대시보드 스냅샷 조회",
+    description="대시보드 첫 화면의 차량 카운터 4종과 차량/모듈/옵션 상태 차트를 한 번에 조회합니다.",
+    responses={
+        401: {"description": "인증 실패"},
+        500: {"description": "서버 오류"}
+    }
+)
+async def get_dashboard_snapshot(
+    session: AsyncSession = Depends(get_async_session),
+    token_data: JWTPayload = Depends(jwt_handler.jwt_auth_dependency(allowed_roles=["master", "semi"]))
+):
+    snapshot = await dashboard_cache.get_or_load(
+        "snapshot", lambda: DashboardService.get_snapshot(session), tags=(DashboardCacheTag.RENT, DashboardCacheTag.ITEMS)
+    )
+    return DashboardSnapshotResponse.success(message="Dashboard snapshot retrieved successfully", data=snapshot)
+
 # ── 차량 관련 엔드포인트 ──
 
 @router.get(
@@ -42,11 +68,13 @@ router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
         }
     }
 )
-def get_today_rented_vehicles(
-    session: Session = Depends(get_session),
+async def get_today_rented_vehicles(
+    session: AsyncSession = Depends(get_async_session),
     token_data: JWTPayload = Depends(jwt_handler.jwt_auth_dependency(allowed_roles=["master", "semi"]))
 ):
-    count = DashboardService.get_today_rented_vehicles_count(session)
+    count = await dashboard_cache.get_or_load(
+        "vehicles/today-rented-count", lambda: DashboardService.get_today_rented_vehicles_count(session), tags=(DashboardCacheTag.RENT,)
+    )
     return CountResponse.success(message="Today rented vehicles Count retrieved successfully", data=count)
 
 @router.get(
@@ -71,11 +99,13 @@ def get_today_rented_vehicles(
         500: {"description": "서버 오류"}
     }
 )
-def get_currently_renting_vehicles(
-    session: Session = Depends(get_session),
+async def get_currently_renting_vehicles(
+    session: AsyncSession = Depends(get_async_session),
     token_data: JWTPayload = Depends(jwt_handler.jwt_auth_dependency(allowed_roles=["master", "semi"]))
 ):
-    count = DashboardService.get_currently_renting_vehicles_count(session)
+    count = await dashboard_cache.get_or_load(
+        "vehicles/currently-renting-count", lambda: DashboardService.get_currently_renting_vehicles_count(session), tags=(DashboardCacheTag.RENT,)
+    )
     return CountResponse.success(message="Currently renting vehicles Count retrieved successfully", data=count)
 
 @router.get(
@@ -100,11 +130,13 @@ def get_currently_renting_vehicles(
         500: {"description": "서버 오류"}
     }
 )
-def get_today_expected_return_vehicles(
-    session: Session = Depends(get_session),
+async def get_today_expected_return_vehicles(
+    session: AsyncSession = Depends(get_async_session),
     token_data: JWTPayload = Depends(jwt_handler.jwt_auth_dependency(allowed_roles=["master", "semi"]))
 ):
-    count = DashboardService.get_today_expected_return_vehicles_count(session)
+    count = await dashboard_cache.get_or_load(
+        "vehicles/today-expected-return-count", lambda: DashboardService.get_today_expected_return_vehicles_count(session), tags=(DashboardCacheTag.RENT,)
+    )
     return CountResponse.success(message="Today expected return vehicles count retrieved", data=count)
 
 @router.get(
@@ -129,11 +161,13 @@ def get_today_expected_return_vehicles(
         500: {"description": "서버 오류"}
     }
 )
-def get_today_completed_returns(
-    session: Session = Depends(get_session),
+async def get_today_completed_returns(
+    session: AsyncSession = Depends(get_async_session),
     token_data: JWTPayload = Depends(jwt_handler.jwt_auth_dependency(allowed_roles=["master", "semi"]))
 ):
-    count = DashboardService.get_today_completed_returns_count(session)
+    count = await dashboard_cache.get_or_load(
+        "vehicles/today-completed-return-count", lambda: DashboardService.get_today_completed_returns_count(session), tags=(DashboardCacheTag.RENT,)
+    )
     return CountResponse.success(message="Today completed return vehicles count retrieved successfully", data=count)
 
 @router.get(
@@ -161,11 +195,13 @@ def get_today_completed_returns(
         500: {"description": "서버 오류"}
     }
 )
-def get_vehicle_state_chart(
-    session: Session = Depends(get_session),
+async def get_vehicle_state_chart(
+    session: AsyncSession = Depends(get_async_session),
     token_data: JWTPayload = Depends(jwt_handler.jwt_auth_dependency(allowed_roles=["master", "semi"]))
 ):
-    chart = DashboardService.get_vehicle_state_chart(session)
+    chart = await dashboard_cache.get_or_load(
+        "vehicles/state-chart", lambda: DashboardService.get_vehicle_state_chart(session), tags=(DashboardCacheTag.ITEMS,)
+    )
     return ChartListResponse.success(message="Vehicle state data retrieved successfully", data=chart)
 
 # ── 모듈 관련 엔드포인트 ──
@@ -195,11 +231,13 @@ def get_vehicle_state_chart(
         500: {"description": "서버 오류"}
     }
 )
-def get_module_state_chart(
-    session: Session = Depends(get_session),
+async def get_module_state_chart(
+    session: AsyncSession = Depends(get_async_session),
     token_data: JWTPayload = Depends(jwt_handler.jwt_auth_dependency(allowed_roles=["master", "semi"]))
 ):
-    chart = DashboardService.get_module_state_chart(session)
+    chart = await dashboard_cache.get_or_load(
+        "modules/state-chart", lambda: DashboardService.get_module_state_chart(session), tags=(DashboardCacheTag.ITEMS,)
+    )
     return ChartListResponse.success(message="Module state data retrieved successfully", data=chart)
 
 # ── 옵션 관련 엔드포인트 ──
@@ -229,11 +267,13 @@ def get_module_state_chart(
         500: {"description": "서버 오류"}
     }
 )
-def get_option_state_chart(
-    session: Session = Depends(get_session),
+async def get_option_state_chart(
+    session: AsyncSession = Depends(get_async_session),
     token_data: JWTPayload = Depends(jwt_handler.jwt_auth_dependency(allowed_roles=["master", "semi"]))
 ):
-    chart = DashboardService.get_option_state_chart(session)
+    chart = await dashboard_cache.get_or_load(
+        "options/state-chart", lambda: DashboardService.get_option_state_chart(session), tags=(DashboardCacheTag.ITEMS,)
+    )
     return ChartListResponse.success(message="Option state data retrieved successfully", data=chart)
 
 @router.get(
@@ -261,11 +301,13 @@ def get_option_state_chart(
         500: {"description": "서버 오류"}
     }
 )
-def get_popular_option_types(
-    session: Session = Depends(get_session),
+async def get_popular_option_types(
+    session: AsyncSession = Depends(get_async_session),
     token_data: JWTPayload = Depends(jwt_handler.jwt_auth_dependency(allowed_roles=["master", "semi"]))
 ):
-    popular_options = DashboardService.get_popular_option_types(session)
+    popular_options = await dashboard_cache.get_or_load(
+        "options/popular", lambda: DashboardService.get_popular_option_types(session), tags=(DashboardCacheTag.RENT, DashboardCacheTag.ITEMS)
+    )
     return OptionPopularityResponse(
         resultCode="SUCCESS",
         message="Popular option types retrieved successfully",
@@ -299,11 +341,13 @@ def get_popular_option_types(
         500: {"description": "서버 오류"}
     }
 )
-def get_rental_counts_by_date(
-    session: Session = Depends(get_session),
+async def get_rental_counts_by_date(
+    session: AsyncSession = Depends(get_async_session),
     token_data: JWTPayload = Depends(jwt_handler.jwt_auth_dependency(allowed_roles=["master", "semi"]))
 ):
-    counts = DashboardService.get_rental_counts_by_date(session)
+    counts = await dashboard_cache.get_or_load(
+        "sales/rental-counts", lambda: DashboardService.get_rental_counts_by_date(session), tags=(DashboardCacheTag.RENT,)
+    )
     return RentalCountListResponse.success(message="Rental counts by month retrieved successfully", data=counts)
 
 @router.get(
@@ -331,10 +375,12 @@ def get_rental_counts_by_date(
         500: {"description": "서버 오류"}
     }
 )
-def get_maintenance_cost_by_month(
-    session: Session = Depends(get_session),
+async def get_maintenance_cost_by_month(
+    session: AsyncSession = Depends(get_async_session),
     token_data: JWTPayload = Depends(jwt_handler.jwt_auth_dependency(allowed_roles=["master", "semi"]))
 ):
-    costs = DashboardService.get_maintenance_cost_by_month(session)
+    costs = await dashboard_cache.get_or_load(
+        "sales/maintenance-cost", lambda: DashboardService.get_maintenance_cost_by_month(session), tags=(DashboardCacheTag.MAINTENANCE,)
+    )
     return MaintenanceCostListResponse.success(message="Maintenance costs by month retrieved successfully", data=costs)
 
@@ -4,8 +4,10 @@ from sqlmodel import Session
 from app.core.database import get_session
 from app.core.jwt import JWTPayload, jwt_handler
 from app.services.admin.maintenance_history_service import MaintenanceHistoryService
+from app.utils.export import ExportFormat, export_response
 from app.api.schemas.admin.maintenance_history_schema import (
     MaintenanceHistoryGetResponse,
+    MaintenanceHistoryItem,
     MaintenanceHistoryPostRequest,
     MaintenanceHistoryPostResponse,
     MaintenanceHistoryPatchRequest,
@@ -115,6 +117,8 @@ def get_maintenance_histories(
     item_id: Optional[int] = Query(None, description="아이템 ID"),
     page: int = Query(1, description="페이지 번호", ge=1),
     pageSize: int = Query(10, description="한 페이지당 정비 기록 수", ge=1),
+    after: Optional[str] = Query(None, description="이전 응답의 pagination.nextCursor (지정 시 page 대신 커서 기준으로 조회)"),
+    include_total: bool = Query(True, description="전체 건수(totalItems, totalPages) 집계 여부"),
     session: Session = Depends(get_session),
     token_data: JWTPayload = Depends(jwt_handler.jwt_auth_dependency(allowed_roles=["master", "semi"]))
 ):
@@ -123,9 +127,39 @@ def get_maintenance_histories(
         itemType=item_type,
         itemId=item_id,
         page=page,
-        pageSize=pageSize
+        pageSize=pageSize,
+        after=after,
+        include_total=include_total
     )
 
+@router.get(
+    "/maintenance-history/export",
+    summary="정비 기록 내보내기",
+    description="""
+    목록 조회와 같은 필터로 정비 기록 전체를 CSV 또는 NDJSON으로 스트리밍합니다.
+    서버 측 커서로 500건씩 읽어 전송하므로 건수와 관계없이 메모리 사용량이 일정합니다.
+    - **format**: csv 또는 ndjson
+    - **item_type**, **item_id**: 목록 조회와 동일
+    """,
+    responses={
+        200: {
+            "description": "정비 기록 내보내기 성공",
+            "content": {"text/csv": {}, "application/x-ndjson": {}}
+        },
+        401: {"description": "인증 실패"},
+        409: {"description": "아이템 타입 없이 아이템 ID를 지정한 경우"}
+    }
+)
+def export_maintenance_histories(
+    format: ExportFormat = Query(ExportFormat.CSV, description="내보내기 형식 (csv, ndjson)"),
+    item_type: Optional[str] = Query(None, description="아이템 유형 (vehicle, module, option)"),
+    item_id: Optional[int] = Query(None, description="아이템 ID"),
+    session: Session = Depends(get_session),
+    token_data: JWTPayload = Depends(jwt_handler.jwt_auth_dependency(allowed_roles=["master", "semi"]))
+):
+    batches = MaintenanceHistoryService.export_maintenance_history(session, itemType=item_type, itemId=item_id)
+    return export_response(batches, MaintenanceHistoryItem, format, "maintenance_history")
+
 @router.post(
     "/maintenance-history",
     response_model=MaintenanceHistoryPostResponse,
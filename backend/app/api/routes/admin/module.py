@@ -1,3 +1,4 @@
+from typing import Optional
 from fastapi import APIRouter, Depends, Path, Query
 from sqlmodel import Session
 from app.core.database import get_session
@@ -54,10 +55,12 @@ router = APIRouter(
 def get_modules(
     page: int = Query(1, ge=1, description="결과 페이지 번호 (기본값: 1)"),
     pageSize: int = Query(10, ge=1, description="한 페이지당 반환할 모듈 개수 (기본값: 10)"),
+    after: Optional[str] = Query(None, description="이전 응답의 pagination.nextCursor (지정 시 page 대신 커서 기준으로 조회)"),
+    include_total: bool = Query(True, description="전체 건수(totalItems, totalPages) 집계 여부"),
     session: Session = Depends(get_session),
     token_data: JWTPayload = Depends(jwt_handler.jwt_auth_dependency(allowed_roles=["master", "semi"]))
 ):
-    return ModuleService.get_module_list(session, page, pageSize)
+    return ModuleService.get_module_list(session, page, pageSize, after, include_total)
 
 @router.post(
     "/modules",
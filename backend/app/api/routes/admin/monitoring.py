@@ -0,0 +1,57 @@
+from fastapi import APIRouter, Depends, Query
+from app.core.jwt import JWTPayload, jwt_handler
+from app.core.loop_monitor import loop_monitor
+from app.core.response_cache import dashboard_cache
+from app.api.schemas.admin.monitoring_schema import LoopLagResponse, ResponseCacheResponse
+
+router = APIRouter(prefix="/monitoring", tags=["Monitoring"])
+
+@router.get(
+    "/loop-lag",
+    response_model=LoopLagResponse,
+    summary="이벤트 루프 지연 리포트 조회",
+    description="""
+    이벤트 루프 지연(p50/p99/max)과 threshold를 넘는 지연을 유발한 요청 경로 상위 목록을 조회합니다.
+    모니터는 LOOP_MONITOR_ENABLED=true일 때만 동작합니다.
+    - **top**: 반환할 경로 수
+    - **reset**: 조회 후 수집된 통계 초기화 여부
+    """,
+    responses={
+        200: {"description": "이벤트 루프 지연 리포트 조회 성공"},
+        401: {"description": "인증 실패"},
+        403: {"description": "권한 없음"}
+    }
+)
+async def get_loop_lag_report(
+    top: int = Query(10, ge=1, le=100, description="반환할 경로 수"),
+    reset: bool = Query(False, description="조회 후 통계 초기화"),
+    token_data: JWTPayload = Depends(jwt_handler.jwt_auth_dependency(allowed_roles=["master", "semi"]))
+):
+    report = loop_monitor.report(top)
+    if reset:
+        loop_monitor.reset()
+    return LoopLagResponse.success(message="Event loop lag report retrieved successfully", data=report)
+
+@router.get(
+    "/dashboard-cache",
+    response_model=ResponseCacheResponse,
+    summary="대시보드 응답 캐시 통계 조회",
+    description="""
+    대시보드 응답 캐시의 엔드포인트별 적중(hit)/미적중(miss) 횟수와 적중률을 조회합니다.
+    TTL은 DASHBOARD_CACHE_TTL_SECONDS로 설정합니다.
+    - **reset**: 조회 후 캐시 항목과 통계 초기화 여부
+    """,
+    responses={
+        200: {"description": "대시보드 응답 캐시 통계 조회 성공"},
+        401: {"description": "인증 실패"},
+        403: {"description": "권한 없음"}
+    }
+)
+async def get_dashboard_cache_report(
+    reset: bool = Query(False, description="조회 후 캐시 및 통계 초기화"),
+    token_data: JWTPayload = Depends(jwt_handler.jwt_auth_dependency(allowed_roles=["master", "semi"]))
+):
+    report = dashboard_cache.report()
+    if reset:
+        dashboard_cache.clear()
+    return ResponseCacheResponse.success(message="Dashboard cache report retrieved successfully", data=report)
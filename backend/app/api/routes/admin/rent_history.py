@@ -1,10 +1,12 @@
+from typing import Optional
 from fastapi import APIRouter, Depends, Query, Path
 from sqlmodel import Session
 from app.services.admin.rent_history_service import RentHistoryService 
 from app.core.database import get_session
-from app.api.schemas.admin.rent_history_schema import RentHistoryResponse, RentVideoResponse
+from app.api.schemas.admin.rent_history_schema import RentHistoryItem, RentHistoryResponse, RentVideoResponse
 from app.core.jwt import JWTPayload, jwt_handler
 from app.utils.lut_constants import VideoType
+from app.utils.export import ExportFormat, export_response
 
 router = APIRouter()
 
@@ -113,10 +115,37 @@ router = APIRouter()
 async def get_rent_history(
     page: int = Query(1, description="현재 페이지 (최소 1)", gt=0),
     page_size: int = Query(10, description="페이지 크기 (최소 1)", gt=0),
+    after: Optional[str] = Query(None, description="이전 응답의 pagination.nextCursor (지정 시 page 대신 커서 기준으로 조회)"),
+    include_total: bool = Query(True, description="전체 건수(totalItems, totalPages) 집계 여부"),
     session: Session = Depends(get_session),
     token_data: JWTPayload = Depends(jwt_handler.jwt_auth_dependency(allowed_roles=["master", "semi"]))
 ):
-    return RentHistoryService.get_rent_history(session, page, page_size)
+    return RentHistoryService.get_rent_history(session, page, page_size, after, include_total)
+
+
+
+@router.get(
+    "/rent-history/export",
+    summary="🚀 대여 로그 내보내기",
+    description="""
+    대여 로그 전체를 CSV 또는 NDJSON으로 스트리밍합니다.
+    서버 측 커서로 500건씩 읽어 전송하므로 건수와 관계없이 메모리 사용량이 일정합니다.
+    - **format**: csv 또는 ndjson
+    """,
+    responses={
+        200: {
+            "description": "대여 로그 내보내기 성공",
+            "content": {"text/csv": {}, "application/x-ndjson": {}}
+        },
+        401: {"description": "인증 실패"}
+    }
+)
+def export_rent_history(
+    format: ExportFormat = Query(ExportFormat.CSV, description="내보내기 형식 (csv, ndjson)"),
+    session: Session = Depends(get_session),
+    token_data: JWTPayload = Depends(jwt_handler.jwt_auth_dependency(allowed_roles=["master", "semi"]))
+):
+    return export_response(RentHistoryService.export_rent_history(session), RentHistoryItem, format, "rent_history")
 
 
 @router.get(
@@ -1,9 +1,11 @@
+from typing import Optional
 from fastapi import APIRouter, Depends, Query
 from sqlmodel import Session
-from app.api.schemas.admin.usage_history_schema import UsageHistoryGetResponse
+from app.api.schemas.admin.usage_history_schema import UsageHistoryGetResponse, UsageHistoryItem
 from app.core.database import get_session
 from app.core.jwt import JWTPayload, jwt_handler
 from app.services.admin.usage_history_service import UsageHistoryService
+from app.utils.export import ExportFormat, export_response
 
 router = APIRouter()
 
@@ -58,7 +60,33 @@ def get_usage_history(
     page: int = Query(1, gt=0, description="현재 페이지 번호"),
     page_size: int = Query(10, gt=0, description="한 페이지 당 사용 이력 수"),
     include_deleted: bool = Query(False, description="삭제된 항목 포함 여부"),
+    after: Optional[str] = Query(None, description="이전 응답의 pagination.nextCursor (지정 시 page 대신 커서 기준으로 조회)"),
+    include_total: bool = Query(True, description="전체 건수(totalItems, totalPages) 집계 여부"),
     session: Session = Depends(get_session),
     token_data: JWTPayload = Depends(jwt_handler.jwt_auth_dependency(allowed_roles=["master", "semi"]))
 ):
-    return UsageHistoryService.get_usage_history(session, page, page_size)
\ No newline at end of file
+    return UsageHistoryService.get_usage_history(session, page, page_size, after, include_total)
+
+
+@router.get(
+    "/usage-history/export",
+    summary="사용 이력 내보내기",
+    description="""
+    사용 이력 전체를 CSV 또는 NDJSON으로 스트리밍합니다.
+    서버 측 커서로 500건씩 읽어 전송하므로 건수와 관계없이 메모리 사용량이 일정합니다.
+    - **format**: csv 또는 ndjson
+    """,
+    responses={
+        200: {
+            "description": "사용 이력 내보내기 성공",
+            "content": {"text/csv": {}, "application/x-ndjson": {}}
+        },
+        401: {"description": "인증 실패"}
+    }
+)
+def export_usage_history(
+    format: ExportFormat = Query(ExportFormat.CSV, description="내보내기 형식 (csv, ndjson)"),
+    session: Session = Depends(get_session),
+    token_data: JWTPayload = Depends(jwt_handler.jwt_auth_dependency(allowed_roles=["master", "semi"]))
+):
+    return export_response(UsageHistoryService.export_usage_history(session), UsageHistoryItem, format, "usage_history")
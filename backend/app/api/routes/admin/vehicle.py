@@ -1,4 +1,4 @@
-from typing import Annotated
+from typing import Annotated, Optional
 from fastapi import APIRouter, Depends, Query, Path
 from sqlmodel import Session
 from app.core.database import get_session
@@ -79,10 +79,12 @@ router = APIRouter()
 async def get_vehicle_list(
     page: int = Query(1, gt=0, description="현재 페이지 (최소 1)"),
     pageSize: int = Query(10, gt=0, description="페이지 당 차량 개수 (최소 1)"),
+    after: Optional[str] = Query(None, description="이전 응답의 pagination.nextCursor (지정 시 page 대신 커서 기준으로 조회)"),
+    include_total: bool = Query(True, description="전체 건수(totalItems, totalPages) 집계 여부"),
     session: Session = Depends(get_session),
     token_data: JWTPayload = Depends(jwt_handler.jwt_auth_dependency(allowed_roles=["semi", "master"]))
 ):
-    return VehicleService.get_vehicle_list(session, page, pageSize)
+    return VehicleService.get_vehicle_list(session, page, pageSize, after, include_total)
 
 @router.post(
     "/vehicles",
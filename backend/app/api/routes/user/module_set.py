@@ -1,15 +1,20 @@
-from fastapi import APIRouter, Query, Depends
+from fastapi import APIRouter, Header, Query, Depends, Response
 from typing import Optional
+from app.core.catalog_version import Catalog, catalog_cache_headers, catalog_versions, etag_matches
 from app.services.user.module_set_service import ModuleSetService
 from app.api.schemas.user.module_set_schema import ModuleSetsResponse
-from app.core.database import Session, get_session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.core.database import get_async_session
 
 router = APIRouter()
 
 @router.get(
     "/module-sets",
     summary="📦 모듈 세트 목록 조회",
-    description="사용자가 선택 가능한 모듈 세트 목록을 조회합니다. **페이지네이션을 지원합니다.**",
+    description="""
+    사용자가 선택 가능한 모듈 세트 목록을 조회합니다. **페이지네이션을 지원합니다.**
+    응답의 ETag를 If-None-Match로 보내면 카탈로그가 바뀌지 않은 경우 304를 반환합니다. (DB 조회 없음)
+    """,
     response_model=ModuleSetsResponse,
     responses={
         200: {
@@ -56,6 +61,7 @@ router = APIRouter()
                 }
             }
         },
+        304: {"description": "카탈로그 변경 없음 (If-None-Match 일치)"},
         422: {
             "description": "유효성 검사 오류",
             "content": {
@@ -113,8 +119,16 @@ router = APIRouter()
     }
 )
 async def get_module_sets(
+    response: Response,
     page: int = Query(1, description="페이지 번호 (최소 1)", gt=0), 
     page_size: int = Query(10, description="페이지 크기 (기본값: 10, 최소 1)", gt=0),
-    session: Session = Depends(get_session)
+    if_none_match: Optional[str] = Header(None),
+    session: AsyncSession = Depends(get_async_session)
 ):
-    return ModuleSetService.get_all_module_sets(session, page, page_size)
+    # 모듈 세트 응답은 옵션 타입 이름도 포함하므로 두 카탈로그 version으로 ETag 생성 (조회 전에 계산)
+    etag = catalog_versions.etag((Catalog.MODULE_SETS, Catalog.OPTION_TYPES), page, page_size)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=catalog_cache_headers(etag))
+    result = await ModuleSetService.get_all_module_sets(session, page, page_size)
+    response.headers.update(catalog_cache_headers(etag))
+    return result
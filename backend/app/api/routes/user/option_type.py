@@ -1,15 +1,20 @@
-from fastapi import APIRouter, Path, Query, Depends
-from sqlmodel import Session
+from typing import Optional
+from fastapi import APIRouter, Header, Path, Query, Depends, Response
+from sqlmodel.ext.asyncio.session import AsyncSession
 from app.services.user.option_type_service import OptionTypeService
 from app.api.schemas.user import option_type_schema
-from app.core.database import get_session
+from app.core.catalog_version import Catalog, catalog_cache_headers, catalog_versions, etag_matches
+from app.core.database import get_async_session
 
 router = APIRouter()
 
 @router.get(
     "/option-types",
     summary="🛠️ 옵션 타입 목록 조회",
-    description="사용자가 선택할 수 있는 **옵션 타입 목록**을 조회합니다. **페이지네이션을 지원합니다.**",
+    description="""
+    사용자가 선택할 수 있는 **옵션 타입 목록**을 조회합니다. **페이지네이션을 지원합니다.**
+    응답의 ETag를 If-None-Match로 보내면 카탈로그(재고 포함)가 바뀌지 않은 경우 304를 반환합니다. (DB 조회 없음)
+    """,
     response_model=option_type_schema.OptionTypesResponse,
     responses={
         200: {
@@ -51,6 +56,7 @@ router = APIRouter()
                 }
             }
         },
+        304: {"description": "카탈로그 변경 없음 (If-None-Match 일치)"},
         422: {
             "description": "유효성 검사 오류",
             "content": {
@@ -92,17 +98,24 @@ router = APIRouter()
     }
 )
 async def get_option_types(
+    response: Response,
     page: int = Query(1,  description="페이지 번호 (최소 1)",gt=0), 
     page_size: int = Query(10, description="페이지 크기 (기본값: 10, 최소 1)", gt=0),
-    session: Session = Depends(get_session)
+    if_none_match: Optional[str] = Header(None),
+    session: AsyncSession = Depends(get_async_session)
 ):
-    return OptionTypeService.get_all_option_types(session, page, page_size)
+    etag = catalog_versions.etag((Catalog.OPTION_TYPES,), page, page_size)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=catalog_cache_headers(etag))
+    result = await OptionTypeService.get_all_option_types(session, page, page_size)
+    response.headers.update(catalog_cache_headers(etag))
+    return result
 
 
 @router.get(
     "/option-types/{option_type_id}",
     summary="🛠️ 옵션 타입 상세 조회",
-    description="특정 옵션 타입의 상세 정보를 조회합니다.",
+    description="특정 옵션 타입의 상세 정보를 조회합니다. If-None-Match가 현재 ETag와 같으면 304를 반환합니다.",
     response_model=option_type_schema.OptionTypesResponse,
     responses={
         200: {
@@ -140,6 +153,7 @@ async def get_option_types(
                 }
             }
         },
+        304: {"description": "카탈로그 변경 없음 (If-None-Match 일치)"},
         422: {
             "description": "유효성 검사 오류",
             "content": {
@@ -179,7 +193,14 @@ async def get_option_types(
     }
 )
 async def get_option_type_by_id(
+  response: Response,
   option_type_id: int = Path(..., description="옵션 타입 ID (최소 1)", gt=0),
-  session: Session = Depends(get_session)
+  if_none_match: Optional[str] = Header(None),
+  session: AsyncSession = Depends(get_async_session)
 ):
-  return OptionTypeService.get_option_type_by_id(session, option_type_id)
+  etag = catalog_versions.etag((Catalog.OPTION_TYPES,), option_type_id)
+  if etag_matches(if_none_match, etag):
+    return Response(status_code=304, headers=catalog_cache_headers(etag))
+  result = await OptionTypeService.get_option_type_by_id(session, option_type_id)
+  response.headers.update(catalog_cache_headers(etag))
+  return result
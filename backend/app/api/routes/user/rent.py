@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends, Path, Query
-from sqlmodel import Session
-from app.core.database import get_session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.core.database import get_async_session
 from app.services.user.rent_service import RentService
+from app.services.user.quote_service import QuoteService
 from app.api.schemas.user import rent_schema
 from app.core.jwt import JWTPayload, jwt_handler
 from datetime import date
@@ -112,10 +113,10 @@ router = APIRouter()
 )
 async def get_rent_status(
     rent_id: int = Path(..., description="조회할 렌트 ID (1 이상)", gt=0),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
     token_data: JWTPayload = Depends(jwt_handler.jwt_auth_dependency())
 ) -> rent_schema.RentStatusResponse:
-    return RentService.get_rent_status(session, rent_id, token_data.user_pk)
+    return await RentService.get_rent_status(session, rent_id, token_data.user_pk)
   
 @router.post(
     "/rent",
@@ -240,10 +241,10 @@ async def get_rent_status(
 )
 async def rent_vehicle(
     rent_request: rent_schema.RentRequest,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
     token_data: JWTPayload = Depends(jwt_handler.jwt_auth_dependency())
 ):
-    rent_result = RentService.create_rent(session, rent_request, token_data.user_pk)
+    rent_result = await RentService.create_rent(session, rent_request, token_data.user_pk)
     return rent_result
 
 
@@ -374,10 +375,10 @@ async def rent_vehicle(
 )
 async def cancel_rent(
     rent_id: int = Path(..., description="렌트 ID (최소 1)", gt=0),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
     token_data: JWTPayload = Depends(jwt_handler.jwt_auth_dependency())
 ):
-    rent_result = RentService.cancel_rent(session, rent_id, token_data.user_pk)
+    rent_result = await RentService.cancel_rent(session, rent_id, token_data.user_pk)
     return rent_result
 
 @router.post(
@@ -455,10 +456,10 @@ async def cancel_rent(
 )
 async def complete_rent(
     rent_id: int = Path(..., description="완료할 렌트 ID (최소 1)", gt=0),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
     token_data: JWTPayload = Depends(jwt_handler.jwt_auth_dependency())
 ) -> rent_schema.CompleteRentResponse:
-    return RentService.complete_rent(session, rent_id, token_data.user_pk)
+    return await RentService.complete_rent(session, rent_id, token_data.user_pk)
 
 
 
@@ -476,3 +477,17 @@ async def get_rent_cost(
     cost = RentService.calculate_rental_cost(rent_request.rentStartDate, rent_request.rentEndDate) 
     rent_cost_data = rent_schema.RentCostResponseData(cost=cost)
     return rent_schema.RentCostResponse.success(message="Rental cost calculated successfully", data=rent_cost_data)
+
+
+# 렌트 견적 일괄 계산
+@router.post(
+    "/rent/quotes",
+    summary="🚀 렌트 견적 일괄 계산",
+    description="여러 (모듈 타입, 옵션, 대여 기간) 조합의 **렌트 비용을 한 번에 계산**하는 API입니다. 렌트 생성 시 비용 검증과 같은 비용표를 사용합니다.",
+    response_model=rent_schema.RentQuoteResponse,
+)
+async def get_rent_quotes(
+    quote_request: rent_schema.RentQuoteRequest,
+    session: AsyncSession = Depends(get_async_session)
+) -> rent_schema.RentQuoteResponse:
+    return await QuoteService.get_quotes(session, quote_request)
@@ -1,4 +1,5 @@
 from pydantic import BaseModel
+from datetime import datetime
 from typing import List, Generic, TypeVar
 from app.api.schemas.common import ResponseBase
 
@@ -78,3 +79,42 @@ class OptionPopularityResponse(BaseModel):
     resultCode: str
     message: str
     data: List[OptionPopularityItem]
+
+class DashboardCounters(BaseModel):
+    today_rented: int
+    currently_renting: int
+    today_expected_return: int
+    today_completed_returns: int
+
+class DashboardStateCharts(BaseModel):
+    vehicle: List[ChartItem]
+    module: List[ChartItem]
+    option: List[ChartItem]
+
+class DashboardSnapshot(BaseModel):
+    counters: DashboardCounters
+    state_charts: DashboardStateCharts
+    generated_at: datetime
+
+class DashboardSnapshotResponse(ResponseBase[DashboardSnapshot]):
+    class Config:
+        schema_extra = {
+            "example": {
+                "resultCode": "SUCCESS",
+                "message": "Dashboard snapshot retrieved successfully",
+                "data": {
+                    "counters": {
+                        "today_rented": 5,
+                        "currently_renting": 3,
+                        "today_expected_return": 4,
+                        "today_completed_returns": 2
+                    },
+                    "state_charts": {
+                        "vehicle": [{"state": "active", "count": 3, "ratio": 60.0}, {"state": "inactive", "count": 2, "ratio": 40.0}],
+                        "module": [{"state": "inactive", "count": 2, "ratio": 100.0}],
+                        "option": [{"state": "inactive", "count": 30, "ratio": 100.0}]
+                    },
+                    "generated_at": "2025-02-01T09:00:00"
+                }
+            }
+        }
@@ -0,0 +1,83 @@
+from pydantic import BaseModel
+from typing import List
+from app.api.schemas.common import ResponseBase
+
+
+class LoopLagOffender(BaseModel):
+    path: str
+    count: int
+    totalMs: float
+    maxMs: float
+    stack: List[str]
+
+class LoopLagReport(BaseModel):
+    enabled: bool
+    intervalMs: float
+    thresholdMs: float
+    sampleCount: int
+    p50Ms: float
+    p99Ms: float
+    maxMs: float
+    stallCount: int
+    topOffenders: List[LoopLagOffender]
+
+class LoopLagResponse(ResponseBase[LoopLagReport]):
+    class Config:
+        schema_extra = {
+            "example": {
+                "resultCode": "SUCCESS",
+                "message": "Event loop lag report retrieved successfully",
+                "data": {
+                    "enabled": True,
+                    "intervalMs": 100.0,
+                    "thresholdMs": 100.0,
+                    "sampleCount": 1200,
+                    "p50Ms": 0.4,
+                    "p99Ms": 182.3,
+                    "maxMs": 640.1,
+                    "stallCount": 7,
+                    "topOffenders": [
+                        {
+                            "path": "POST /api/auth/login",
+                            "count": 4,
+                            "totalMs": 910.2,
+                            "maxMs": 640.1,
+                            "stack": ["  File \"app/services/auth_service.py\", line 42, in login"]
+                        }
+                    ]
+                }
+            }
+        }
+
+
+class ResponseCacheEndpoint(BaseModel):
+    key: str
+    hits: int
+    misses: int
+
+class ResponseCacheReport(BaseModel):
+    ttlSeconds: float
+    size: int
+    hits: int
+    misses: int
+    hitRatio: float
+    endpoints: List[ResponseCacheEndpoint]
+
+class ResponseCacheResponse(ResponseBase[ResponseCacheReport]):
+    class Config:
+        schema_extra = {
+            "example": {
+                "resultCode": "SUCCESS",
+                "message": "Dashboard cache report retrieved successfully",
+                "data": {
+                    "ttlSeconds": 10.0,
+                    "size": 3,
+                    "hits": 42,
+                    "misses": 6,
+                    "hitRatio": 0.875,
+                    "endpoints": [
+                        {"key": "snapshot", "hits": 30, "misses": 3}
+                    ]
+                }
+            }
+        }
@@ -23,9 +23,10 @@ class UsageHistoryItem(BaseModel):
 
 class Pagination(BaseModel):
     currentPage: int = Field(..., example=1)
-    totalPages: int = Field(..., example=3)
-    totalItems: int = Field(..., example=25)
+    totalPages: Optional[int] = Field(None, example=3, description="include_total=false이면 null")
+    totalItems: Optional[int] = Field(None, example=25, description="include_total=false이면 null")
     pageSize: int = Field(..., example=10)
+    nextCursor: Optional[str] = Field(None, description="다음 페이지 조회용 커서 (after 파라미터로 전달, 마지막 페이지면 null)")
 
 class UsageHistoryData(BaseModel):
     usage_history: List[UsageHistoryItem]
@@ -35,9 +35,10 @@ class ResponseBase(GenericModel, Generic[T]):
 class Pagination(BaseModel):
     """📌 페이지네이션 정보 모델"""
     currentPage: int = Field(..., example=1)
-    totalPages: int = Field(..., example=5)
-    totalItems: int = Field(..., example=50)
+    totalPages: Optional[int] = Field(None, example=5, description="include_total=false이면 null")
+    totalItems: Optional[int] = Field(None, example=50, description="include_total=false이면 null")
     pageSize: int = Field(..., example=10)
+    nextCursor: Optional[str] = Field(None, description="다음 페이지 조회용 커서 (after 파라미터로 전달, 마지막 페이지면 null)")
 
 class PaginatedResponse(BaseModel, Generic[T]):
     """📌 페이지네이션이 적용된 응답 모델"""
@@ -167,5 +167,49 @@ class RentCostResponse(ResponseBase[RentCostResponseData]):
                     "cost": 50000
                 }
             }
-        } 
+        }
+
+
+# 견적 요청 1건당 최대 조합 수
+MAX_QUOTE_ITEMS = 100
+
+class RentQuoteItem(BaseModel):
+    """견적 요청 항목 (모듈 타입 + 옵션 + 대여 기간)"""
+    moduleTypeId: int = Field(..., example=1, gt=0)
+    selectedOptionTypes: List[SelectedOptionType] = Field(default_factory=list, example=[
+        {"optionTypeId": 1, "quantity": 1}
+    ])
+    rentStartDate: datetime = Field(..., example="2025-01-15T09:00:00")
+    rentEndDate: datetime = Field(..., example="2025-01-20T18:00:00")
+
+class RentQuoteRequest(BaseModel):
+    """렌트 견적 일괄 요청 모델"""
+    quotes: List[RentQuoteItem] = Field(..., min_items=1, max_items=MAX_QUOTE_ITEMS)
+
+class RentQuoteResponseItem(BaseModel):
+    """렌트 견적 응답 항목 (요청 순서와 동일)"""
+    moduleTypeCost: int = Field(..., example=10000)
+    optionCost: int = Field(..., example=10000)
+    dateCost: int = Field(..., example=60000)
+    totalCost: int = Field(..., example=80000)
 
+class RentQuoteResponseData(BaseModel):
+    """렌트 견적 응답 데이터 모델"""
+    catalogVersion: int = Field(..., example=3)
+    quotes: List[RentQuoteResponseItem]
+
+class RentQuoteResponse(ResponseBase[RentQuoteResponseData]):
+    """렌트 견적 응답 모델"""
+    class Config:
+        schema_extra = {
+            "example": {
+                "resultCode": "SUCCESS",
+                "message": "Rent quotes calculated successfully",
+                "data": {
+                    "catalogVersion": 3,
+                    "quotes": [
+                        {"moduleTypeCost": 10000, "optionCost": 10000, "dateCost": 60000, "totalCost": 80000}
+                    ]
+                }
+            }
+        }
@@ -0,0 +1,74 @@
+import threading
+import uuid
+from typing import Any, Dict, Iterable, Optional, Union
+
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.utils.handle_transaction import on_commit
+
+
+class Catalog:
+    """공개 카탈로그 이름. 사용자 카탈로그 응답은 의존하는 카탈로그 version으로 ETag를 만듭니다."""
+    MODULE_SETS = "module_sets"
+    # 옵션 타입 이름/비용과 재고 수량(stockQuantity)
+    OPTION_TYPES = "option_types"
+
+
+class CatalogVersions:
+    """카탈로그별 version 카운터
+
+    관리자 변경(모듈 세트/옵션 타입/옵션)과 재고 변경이 커밋되면 해당 카탈로그 version이 증가합니다.
+    ETag에는 프로세스 시작 시 생성한 epoch가 포함되어, 재시작 후 version이 0부터 다시 시작해도
+    이전 프로세스가 발급한 ETag와 겹치지 않습니다.
+    """
+    def __init__(self):
+        self.epoch = uuid.uuid4().hex[:8]
+        self._versions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def version(self, name: str) -> int:
+        return self._versions.get(name, 0)
+
+    def bump(self, *names: str) -> None:
+        """names 카탈로그의 version을 올립니다."""
+        with self._lock:
+            for name in names:
+                self._versions[name] = self._versions.get(name, 0) + 1
+
+    def etag(self, names: Iterable[str], *parts: Any) -> str:
+        """카탈로그 version과 요청 구분값(parts)으로 강한(strong) ETag를 생성합니다."""
+        versions = ".".join(str(self.version(name)) for name in names)
+        return '"' + "-".join([self.epoch, versions, *map(str, parts)]) + '"'
+
+    # ── 트랜잭션 연동 ──
+
+    def bump_on_commit(self, session: Union[Session, AsyncSession], *names: str) -> None:
+        """현재 트랜잭션이 커밋되면 names 카탈로그의 version을 올리도록 예약합니다. (롤백 시 취소)"""
+        if names:
+            on_commit(session, self.bump, *names)
+
+
+catalog_versions = CatalogVersions()
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 etag와 일치하는지 확인합니다. (GET은 약한 비교: W/ 접두사 무시)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+def catalog_cache_headers(etag: str) -> Dict[str, str]:
+    """카탈로그 응답의 ETag/Cache-Control 헤더"""
+    return {
+        "ETag": etag,
+        "Cache-Control": (
+            f"public, max-age={settings.CATALOG_CACHE_MAX_AGE_SECONDS}, "
+            f"stale-while-revalidate={settings.CATALOG_STALE_WHILE_REVALIDATE_SECONDS}"
+        ),
+    }
@@ -21,15 +21,50 @@ class Settings(BaseSettings):
     # 데이터베이스 설정
     DATABASE_URL: str = Field(default=os.getenv("DATABASE_URL", "sqlite:///database.db"))
 
+    # SQLite 엔진 프로파일 (연결마다 PRAGMA로 적용)
+    SQLITE_JOURNAL_MODE: str = Field(default=os.getenv("SQLITE_JOURNAL_MODE", "WAL"))
+    SQLITE_SYNCHRONOUS: str = Field(default=os.getenv("SQLITE_SYNCHRONOUS", "NORMAL"))
+    SQLITE_BUSY_TIMEOUT_MS: int = Field(default=int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", 5000)))
+    SQLITE_CACHE_SIZE_KB: int = Field(default=int(os.getenv("SQLITE_CACHE_SIZE_KB", 65536)))
+    SQLITE_MMAP_SIZE: int = Field(default=int(os.getenv("SQLITE_MMAP_SIZE", 268435456)))
+    SQLITE_TEMP_STORE: str = Field(default=os.getenv("SQLITE_TEMP_STORE", "MEMORY"))
+
+    # 커넥션 풀 설정 (PostgreSQL / MySQL)
+    DB_POOL_SIZE: int = Field(default=int(os.getenv("DB_POOL_SIZE", 10)))
+    DB_MAX_OVERFLOW: int = Field(default=int(os.getenv("DB_MAX_OVERFLOW", 20)))
+    DB_POOL_TIMEOUT: int = Field(default=int(os.getenv("DB_POOL_TIMEOUT", 30)))
+    DB_POOL_RECYCLE: int = Field(default=int(os.getenv("DB_POOL_RECYCLE", 1800)))
+
+    # 이벤트 루프 지연 모니터 (opt-in)
+    LOOP_MONITOR_ENABLED: bool = Field(default=os.getenv("LOOP_MONITOR_ENABLED", "False").lower() == "true")
+    LOOP_MONITOR_INTERVAL_MS: int = Field(default=int(os.getenv("LOOP_MONITOR_INTERVAL_MS", 100)))
+    LOOP_MONITOR_THRESHOLD_MS: int = Field(default=int(os.getenv("LOOP_MONITOR_THRESHOLD_MS", 100)))
+
+    # 대시보드 응답 캐시 TTL(초, 0이면 캐시하지 않음)
+    DASHBOARD_CACHE_TTL_SECONDS: float = Field(default=float(os.getenv("DASHBOARD_CACHE_TTL_SECONDS", 10)))
+
+    # 사용자 카탈로그(모듈 세트/옵션 타입) 응답 Cache-Control (초)
+    CATALOG_CACHE_MAX_AGE_SECONDS: int = Field(default=int(os.getenv("CATALOG_CACHE_MAX_AGE_SECONDS", 60)))
+    CATALOG_STALE_WHILE_REVALIDATE_SECONDS: int = Field(default=int(os.getenv("CATALOG_STALE_WHILE_REVALIDATE_SECONDS", 300)))
+
     # Redis 설정
     UPSTASH_REDIS_REST_URL: str
     UPSTASH_REDIS_REST_TOKEN: str
+    # Redis REST 연결 풀 크기, 타임아웃(초), 재시도 횟수
+    REDIS_POOL_SIZE: int = Field(default=int(os.getenv("REDIS_POOL_SIZE", 10)))
+    REDIS_CONNECT_TIMEOUT_SECONDS: float = Field(default=float(os.getenv("REDIS_CONNECT_TIMEOUT_SECONDS", 3)))
+    REDIS_READ_TIMEOUT_SECONDS: float = Field(default=float(os.getenv("REDIS_READ_TIMEOUT_SECONDS", 5)))
+    REDIS_MAX_RETRIES: int = Field(default=int(os.getenv("REDIS_MAX_RETRIES", 2)))
+    # 차량 미연결 상태 캐시 TTL(초, 0이면 캐시하지 않음)
+    VEHICLE_PRESENCE_NEGATIVE_TTL_SECONDS: float = Field(default=float(os.getenv("VEHICLE_PRESENCE_NEGATIVE_TTL_SECONDS", 2)))
 
     # JWT 설정
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_SECONDS: int = Field(default=int(os.getenv("ACCESS_TOKEN_EXPIRE_SECONDS", 600)))
     REFRESH_TOKEN_EXPIRE_SECONDS: int = Field(default=int(os.getenv("REFRESH_TOKEN_EXPIRE_SECONDS", 1200)))
+    # 검증된 access 토큰 캐시 크기 (0이면 캐시하지 않음)
+    JWT_CACHE_SIZE: int = Field(default=int(os.getenv("JWT_CACHE_SIZE", 4096)))
 
     ROLE_ENCRYPTION_KEY: str
     
@@ -51,7 +86,8 @@ class Settings(BaseSettings):
             )
         return v
 
-    @validator("ACCESS_TOKEN_EXPIRE_SECONDS", "REFRESH_TOKEN_EXPIRE_SECONDS")
+    @validator("ACCESS_TOKEN_EXPIRE_SECONDS", "REFRESH_TOKEN_EXPIRE_SECONDS", "LOOP_MONITOR_INTERVAL_MS", "LOOP_MONITOR_THRESHOLD_MS",
+               "REDIS_POOL_SIZE", "REDIS_CONNECT_TIMEOUT_SECONDS", "REDIS_READ_TIMEOUT_SECONDS")
     def validate_positive_number(cls, v: int, field: str) -> int:
         """양수 값 검증"""
         if v <= 0:
@@ -65,6 +101,39 @@ class Settings(BaseSettings):
             )
         return v
 
+    @validator("SQLITE_JOURNAL_MODE")
+    def validate_sqlite_journal_mode(cls, v: str) -> str:
+        """SQLite journal_mode 검증"""
+        allowed = ["DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"]
+        if v.upper() not in allowed:
+            raise ConfigError(
+                message="Invalid SQLITE_JOURNAL_MODE",
+                detail={"value": v, "allowed": allowed}
+            )
+        return v.upper()
+
+    @validator("SQLITE_SYNCHRONOUS")
+    def validate_sqlite_synchronous(cls, v: str) -> str:
+        """SQLite synchronous 검증"""
+        allowed = ["OFF", "NORMAL", "FULL", "EXTRA"]
+        if v.upper() not in allowed:
+            raise ConfigError(
+                message="Invalid SQLITE_SYNCHRONOUS",
+                detail={"value": v, "allowed": allowed}
+            )
+        return v.upper()
+
+    @validator("SQLITE_TEMP_STORE")
+    def validate_sqlite_temp_store(cls, v: str) -> str:
+        """SQLite temp_store 검증"""
+        allowed = ["DEFAULT", "FILE", "MEMORY"]
+        if v.upper() not in allowed:
+            raise ConfigError(
+                message="Invalid SQLITE_TEMP_STORE",
+                detail={"value": v, "allowed": allowed}
+            )
+        return v.upper()
+
     @validator("DATABASE_URL")
     def validate_database_url(cls, v: str) -> str:
         """데이터베이스 URL 검증"""
@@ -1,8 +1,12 @@
 from sqlmodel import create_engine, SQLModel, Session, select
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import NullPool
+from sqlmodel.ext.asyncio.session import AsyncSession
 from app.core.config import settings
 from app.utils.exceptions import DatabaseError
 import logging
-from typing import Any, Dict, Generator
+from typing import Any, AsyncGenerator, Dict, Generator, Optional
 from datetime import datetime
 import time
 import os
@@ -14,14 +18,63 @@ from app.db.models import (
 
 logger = logging.getLogger(__name__)
 
-def create_db_engine():
-    """데이터베이스 엔진 생성"""
+def sqlite_pragmas() -> Dict[str, Any]:
+    """설정에서 SQLite 연결마다 적용할 PRAGMA 목록을 구성합니다."""
+    return {
+        "journal_mode": settings.SQLITE_JOURNAL_MODE,
+        "synchronous": settings.SQLITE_SYNCHRONOUS,
+        "busy_timeout": settings.SQLITE_BUSY_TIMEOUT_MS,
+        # 음수 값은 페이지 수가 아닌 KiB 단위를 의미
+        "cache_size": -settings.SQLITE_CACHE_SIZE_KB,
+        "mmap_size": settings.SQLITE_MMAP_SIZE,
+        "temp_store": settings.SQLITE_TEMP_STORE,
+    }
+
+def apply_sqlite_pragmas(dbapi_connection: Any, pragmas: Dict[str, Any]) -> None:
+    """DBAPI 연결에 PRAGMA를 적용합니다."""
+    cursor = dbapi_connection.cursor()
     try:
-        engine = create_engine(
-            settings.DATABASE_URL,
-            # echo=settings.DEBUG,
-            connect_args={"check_same_thread": False} if settings.DATABASE_URL.startswith("sqlite") else {}
-        )
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+def read_sqlite_pragmas(session: Session) -> Dict[str, Any]:
+    """현재 연결에 실제로 적용된 PRAGMA 값을 조회합니다."""
+    connection = session.connection()
+    return {
+        name: connection.exec_driver_sql(f"PRAGMA {name}").scalar()
+        for name in sqlite_pragmas()
+    }
+
+def create_db_engine(database_url: Optional[str] = None):
+    """데이터베이스 엔진 생성
+
+    SQLite는 연결마다 WAL/synchronous/busy_timeout 등의 PRAGMA를 적용하고,
+    PostgreSQL/MySQL은 설정값으로 커넥션 풀 크기를 지정합니다.
+    """
+    database_url = database_url or settings.DATABASE_URL
+    try:
+        if database_url.startswith("sqlite"):
+            engine = create_engine(
+                database_url,
+                # echo=settings.DEBUG,
+                connect_args={"check_same_thread": False}
+            )
+            pragmas = sqlite_pragmas()
+
+            @event.listens_for(engine, "connect")
+            def _set_sqlite_pragmas(dbapi_connection, connection_record):
+                apply_sqlite_pragmas(dbapi_connection, pragmas)
+        else:
+            engine = create_engine(
+                database_url,
+                pool_size=settings.DB_POOL_SIZE,
+                max_overflow=settings.DB_MAX_OVERFLOW,
+                pool_timeout=settings.DB_POOL_TIMEOUT,
+                pool_recycle=settings.DB_POOL_RECYCLE,
+                pool_pre_ping=True
+            )
         logger.info("✅ 데이터베이스 엔진 생성 완료")
         return engine
     except Exception as e:
@@ -29,12 +82,63 @@ def create_db_engine():
             message="Failed to create database engine",
             detail={
                 "error": str(e),
-                "database_url": settings.DATABASE_URL
+                "database_url": database_url
             }
         )
 
 engine = create_db_engine()
 
+# 동기 URL 스킴 → 비동기 드라이버 스킴
+ASYNC_DRIVERS = {
+    "sqlite:///": "sqlite+aiosqlite:///",
+    "postgresql://": "postgresql+asyncpg://",
+    "mysql://": "mysql+aiomysql://",
+}
+
+def to_async_database_url(database_url: str) -> str:
+    """동기 드라이버 URL을 비동기 드라이버(aiosqlite/asyncpg/aiomysql) URL로 변환합니다."""
+    for prefix, async_prefix in ASYNC_DRIVERS.items():
+        if database_url.startswith(prefix):
+            return async_prefix + database_url[len(prefix):]
+    return database_url
+
+def create_async_db_engine(database_url: Optional[str] = None) -> AsyncEngine:
+    """비동기 데이터베이스 엔진 생성
+
+    동기 엔진과 같은 SQLite PRAGMA / 커넥션 풀 설정을 사용합니다.
+    aiosqlite 연결은 이벤트 루프에 묶이므로 SQLite는 연결을 풀링하지 않습니다.
+    """
+    database_url = to_async_database_url(database_url or settings.DATABASE_URL)
+    try:
+        if database_url.startswith("sqlite"):
+            async_engine = create_async_engine(database_url, poolclass=NullPool)
+            pragmas = sqlite_pragmas()
+
+            @event.listens_for(async_engine.sync_engine, "connect")
+            def _set_sqlite_pragmas(dbapi_connection, connection_record):
+                apply_sqlite_pragmas(dbapi_connection, pragmas)
+        else:
+            async_engine = create_async_engine(
+                database_url,
+                pool_size=settings.DB_POOL_SIZE,
+                max_overflow=settings.DB_MAX_OVERFLOW,
+                pool_timeout=settings.DB_POOL_TIMEOUT,
+                pool_recycle=settings.DB_POOL_RECYCLE,
+                pool_pre_ping=True
+            )
+        logger.info("✅ 비동기 데이터베이스 엔진 생성 완료")
+        return async_engine
+    except Exception as e:
+        raise DatabaseError(
+            message="Failed to create async database engine",
+            detail={
+                "error": str(e),
+                "database_url": database_url
+            }
+        )
+
+async_engine = create_async_db_engine()
+
 def get_session() -> Generator[Session, None, None]:
     """데이터베이스 세션 제공"""
     session = Session(engine)
@@ -44,6 +148,11 @@ def get_session() -> Generator[Session, None, None]:
     finally:
         session.close()
 
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    """비동기 데이터베이스 세션 제공 (쿼리 대기 중에도 이벤트 루프를 점유하지 않음)"""
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
+
 async def initialize_database() -> None:
     """데이터베이스 초기화 및 시드 데이터 삽입"""
     try:
@@ -58,6 +167,14 @@ async def initialize_database() -> None:
         logger.info("🔹 데이터베이스 스키마 생성 중...")
         SQLModel.metadata.create_all(engine)
         logger.info("✅ 데이터베이스 스키마 생성 완료")
+
+        # 기존 DB 파일에도 스키마 변경(인덱스 등)을 적용
+        from app.db.migrations import run_migrations, find_missing_indexes
+        applied_versions = run_migrations(engine)
+        if applied_versions:
+            logger.info(f"✅ 마이그레이션 적용 완료: {applied_versions}")
+        for table_name, index_name in find_missing_indexes(engine):
+            logger.warning(f"⚠️ 인덱스 누락: {table_name}.{index_name}")
         
         # 데이터베이스 파일이 처음 생성된 경우에만 seed_data()를 호출합니다.
         if seed_required:
@@ -74,6 +191,13 @@ async def initialize_database() -> None:
                         message="Failed to insert seed data",
                         detail={"error": str(e)}
                     )
+
+        # 옵션 재고 카운터를 option 테이블 기준으로 재계산 (기존 DB에 카운터 테이블이 새로 생긴 경우 포함)
+        with Session(engine) as session:
+            from app.db.crud.option_stock import option_stock_crud
+            option_stock_crud.rebuild(session)
+            session.commit()
+            logger.info("✅ 옵션 재고 카운터 동기화 완료")
                 
     except Exception as e:
         if isinstance(e, DatabaseError):
@@ -86,6 +210,20 @@ async def initialize_database() -> None:
             }
         )
 
+def load_lookup_tables() -> None:
+    """LUT 테이블 전체를 메모리에 적재합니다. LUT 조회는 이후 DB 조회 없이 처리됩니다."""
+    from app.db.crud.lut import lut_registry
+    with Session(engine) as session:
+        mismatches = lut_registry.load(session)
+    logger.info(f"✅ LUT 캐시 적재 완료 (불일치 {len(mismatches)}건)")
+
+def load_free_pool() -> None:
+    """INACTIVE 차량/모듈/옵션 ID를 인메모리 인덱스에 적재합니다. 이후 렌트 선점은 인덱스의 후보 ID로 처리됩니다."""
+    from app.db.crud.free_pool import free_pool
+    with Session(engine) as session:
+        sizes = free_pool.rebuild(session)
+    logger.info(f"✅ 사용 가능 아이템 인덱스 적재 완료 ({sum(sizes.values())}건)")
+
 def verify_database_connection(max_retries: int = 3, retry_delay: int = 1) -> Dict[str, Any]:
     start_time = datetime.now()
     
@@ -95,6 +233,7 @@ def verify_database_connection(max_retries: int = 3, retry_delay: int = 1) -> Di
                 query_start = time.time()
                 session.exec(select(1)).first()
                 response_time = (time.time() - query_start) * 1000
+                pragmas = read_sqlite_pragmas(session) if engine.dialect.name == "sqlite" else None
 
                 return {
                     "status": True,
@@ -104,7 +243,8 @@ def verify_database_connection(max_retries: int = 3, retry_delay: int = 1) -> Di
                     "engine_info": {
                         "url": str(engine.url),
                         "pool_size": engine.pool.size(),
-                        "pool_overflow": engine.pool.overflow()
+                        "pool_overflow": engine.pool.overflow(),
+                        "pragmas": pragmas
                     },
                     "attempts": attempt + 1
                 }
@@ -1,8 +1,12 @@
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from collections import OrderedDict
 from datetime import datetime, timedelta
+import hashlib
 import jwt
 import logging
-from typing import Optional, List, Tuple
+import threading
+import time
+from typing import Dict, Optional, List, Set, Tuple
 from fastapi import Depends
 from app.core.config import settings
 from app.core.redis import redis_handler
@@ -25,11 +29,82 @@ class JWTPayload(BaseModel):
     def to_dict(self) -> dict:
         return self.dict()
 
+class VerifiedTokenCache:
+    """검증된 access 토큰 LRU 캐시
+
+    토큰 해시를 키로 복호화된 JWTPayload를 토큰 만료(exp)까지 보관하여, 같은 토큰의 반복 요청은
+    서명 검증(jwt.decode)과 역할 복호화(Fernet)를 건너뜁니다. 최대 max_size개를 유지하며(0이면 캐시하지 않음)
+    로그아웃/토큰 갱신 시 revoke()로 해당 사용자의 항목을 폐기합니다.
+    """
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[bytes, Tuple[float, JWTPayload]]" = OrderedDict()
+        self._by_user: Dict[Tuple[int, str], Set[bytes]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def _discard(self, key: bytes) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        payload = entry[1]
+        keys = self._by_user.get((payload.user_pk, payload.role))
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_user[(payload.user_pk, payload.role)]
+
+    def get(self, token: str) -> Optional[JWTPayload]:
+        """캐시된 페이로드 사본을 반환합니다. (없거나 만료되었으면 None)"""
+        if self.max_size <= 0:
+            return None
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                self._discard(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[1].copy()
+
+    def put(self, token: str, payload: JWTPayload, expires_at: float) -> None:
+        """검증된 페이로드를 expires_at(Unix timestamp)까지 저장합니다."""
+        if self.max_size <= 0:
+            return
+        key = self._key(token)
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = (expires_at, payload.copy())
+            self._by_user.setdefault((payload.user_pk, payload.role), set()).add(key)
+            while len(self._entries) > self.max_size:
+                self._discard(next(iter(self._entries)))
+
+    def revoke(self, user_pk: int, role: str) -> None:
+        """사용자의 캐시된 토큰을 모두 폐기합니다."""
+        with self._lock:
+            for key in list(self._by_user.get((user_pk, role), ())):
+                self._discard(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_user.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class JWTHandler:
     def __init__(self):
         self.settings = settings
         self.bearer_scheme = HTTPBearer()
         self.fernet = settings.fernet_instance
+        self.token_cache = VerifiedTokenCache(max_size=settings.JWT_CACHE_SIZE)
         logger.info("✅ JWTHandler 초기화 완료")
 
     def encrypt_role(self, role: str) -> str:
@@ -52,9 +127,8 @@ class JWTHandler:
 
     def create_token(self, user_pk: int, role: str) -> Tuple[str, str]:
         encrypted_role = self.encrypt_role(role)
-        self.delete_refresh_token(user_pk, role)  # 기존 리프레시 토큰 삭제
         refresh_token = self._create_refresh_token(user_pk, role)
-        self.save_refresh_token(user_pk, role, refresh_token)
+        self.rotate_refresh_token(user_pk, role, refresh_token)  # 기존 리프레시 토큰 교체
         access_token = self._create_access_token(user_pk, encrypted_role)
         return access_token, refresh_token
 
@@ -98,8 +172,19 @@ class JWTHandler:
                 detail={"error": str(e)}
             )
 
+    def _refresh_token_key(self, user_pk: int, role: str) -> str:
+        return f"user:{role}:{user_pk}:refresh_token"
+
+    def rotate_refresh_token(self, user_pk: int, role: str, refresh_token: str):
+        """기존 리프레시 토큰 삭제와 새 토큰 저장을 한 번의 Redis 트랜잭션(MULTI/EXEC) 요청으로 처리합니다."""
+        redis_key = self._refresh_token_key(user_pk, role)
+        redis_handler.multi_exec([
+            ["DEL", redis_key],
+            ["SET", redis_key, refresh_token, "EX", int(self.settings.REFRESH_TOKEN_EXPIRE_SECONDS)],
+        ])
+
     def save_refresh_token(self, user_pk: int, role: str, refresh_token: str):
-        redis_key = f"user:{role}:{user_pk}:refresh_token"
+        redis_key = self._refresh_token_key(user_pk, role)
         redis_handler.setex(
             redis_key,
             refresh_token,
@@ -107,11 +192,11 @@ class JWTHandler:
         )
 
     def get_refresh_token(self, user_pk: int, role: str) -> Optional[str]:
-        redis_key = f"user:{role}:{user_pk}:refresh_token"
+        redis_key = self._refresh_token_key(user_pk, role)
         return redis_handler.get(redis_key)
 
     def delete_refresh_token(self, user_pk: int, role: str):
-        redis_key = f"user:{role}:{user_pk}:refresh_token"
+        redis_key = self._refresh_token_key(user_pk, role)
         if not redis_handler.delete(redis_key):
             logger.warning(f"⚠️ Redis에서 리프레시 토큰 삭제 실패: {redis_key}")
 
@@ -139,9 +224,9 @@ class JWTHandler:
                     detail={"error": "Stored token does not match provided token"}
                 )
 
-            self.delete_refresh_token(user_pk, role)
             new_refresh_token = self._create_refresh_token(user_pk, role)
-            self.save_refresh_token(user_pk, role, new_refresh_token)
+            self.rotate_refresh_token(user_pk, role, new_refresh_token)
+            self.revoke_cached_tokens(user_pk, role)
             new_access_token = self._create_access_token(user_pk, self.encrypt_role(role))
 
             return new_access_token, new_refresh_token
@@ -160,6 +245,12 @@ class JWTHandler:
               message="Token is required",
               detail={"error": "No token provided"}
           )
+        # 이미 검증한 토큰은 서명 검증/역할 복호화 없이 역할만 확인
+        cached_payload = self.token_cache.get(token)
+        if cached_payload is not None:
+            self._check_allowed_roles(cached_payload, allowed_roles)
+            return cached_payload
+
         try:
             decoded_payload = jwt.decode(
                 token,
@@ -185,15 +276,8 @@ class JWTHandler:
                     detail={"error": str(e)}
                 )
 
-            if allowed_roles and payload.role not in allowed_roles:
-                raise ForbiddenError(
-                    message="Permission denied",
-                    detail={
-                        "user_role": payload.role,
-                        "allowed_roles": allowed_roles
-                    }
-                )
-
+            self.token_cache.put(token, payload, float(decoded_payload["exp"]))
+            self._check_allowed_roles(payload, allowed_roles)
             return payload
 
         except jwt.ExpiredSignatureError:
@@ -219,6 +303,20 @@ class JWTHandler:
         except Exception as e:
             raise e
 
+    def _check_allowed_roles(self, payload: JWTPayload, allowed_roles: Optional[List[str]]) -> None:
+        if allowed_roles and payload.role not in allowed_roles:
+            raise ForbiddenError(
+                message="Permission denied",
+                detail={
+                    "user_role": payload.role,
+                    "allowed_roles": allowed_roles
+                }
+            )
+
+    def revoke_cached_tokens(self, user_pk: int, role: str) -> None:
+        """검증 토큰 캐시에서 사용자의 access 토큰을 폐기합니다. (로그아웃/토큰 갱신 시 호출)"""
+        self.token_cache.revoke(user_pk, role)
+
     def jwt_auth_dependency(self, allowed_roles: Optional[List[str]] = None):
         """FastAPI 의존성 함수: JWT 인증 및 역할 검증"""
         bearer = HTTPBearer(auto_error=False)  # auto_error를 False로 설정
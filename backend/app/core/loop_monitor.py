@@ -0,0 +1,202 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class LoopLagMonitor:
+    """이벤트 루프 지연(lag) 모니터
+
+    루프 안의 샘플러 태스크가 interval마다 깨어나 예정 시각 대비 지연을 기록하고,
+    별도 감시 스레드가 샘플러가 늦어지는 순간 루프 스레드의 스택과 실행 중인 요청 경로를 캡처합니다.
+    threshold를 넘은 지연은 요청 경로(또는 WebSocket 경로)별로 집계됩니다.
+    """
+    def __init__(self, interval_ms: float = 100, threshold_ms: float = 100, max_samples: int = 2000, stack_limit: int = 15):
+        self.interval = interval_ms / 1000
+        self.threshold = threshold_ms / 1000
+        self.stack_limit = stack_limit
+        self.samples: Deque[float] = deque(maxlen=max_samples)
+        self.offenders: Dict[str, Dict[str, Any]] = {}
+        self.stall_count = 0
+        self._in_flight: Dict[asyncio.Task, str] = {}
+        self._pending_stall: Optional[Dict[str, Any]] = None
+        self._heartbeat = 0.0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    # ── 수명 주기 ──
+
+    def start(self) -> None:
+        """현재 이벤트 루프에서 샘플러 태스크와 감시 스레드를 시작합니다."""
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stop_event.clear()
+        self._task = self._loop.create_task(self._sample())
+        self._watchdog = threading.Thread(target=self._watch, name="loop-lag-watchdog", daemon=True)
+        self._watchdog.start()
+        logger.info(f"✅ 이벤트 루프 지연 모니터 시작 (interval={self.interval * 1000:.0f}ms, threshold={self.threshold * 1000:.0f}ms)")
+
+    async def stop(self) -> None:
+        """샘플러 태스크와 감시 스레드를 종료합니다."""
+        self._stop_event.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        self._in_flight.clear()
+
+    def reset(self) -> None:
+        """수집된 샘플과 집계를 초기화합니다."""
+        with self._lock:
+            self.samples.clear()
+            self.offenders.clear()
+            self.stall_count = 0
+            self._pending_stall = None
+
+    # ── 요청 추적 ──
+
+    def track(self, task: Optional[asyncio.Task], label: str) -> None:
+        """요청을 처리 중인 태스크와 경로를 등록합니다."""
+        if task is not None:
+            self._in_flight[task] = label
+
+    def untrack(self, task: Optional[asyncio.Task]) -> None:
+        """요청 처리가 끝난 태스크를 제거합니다."""
+        if task is not None:
+            self._in_flight.pop(task, None)
+
+    # ── 샘플링 ──
+
+    async def _sample(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            scheduled = loop.time() + self.interval
+            self._heartbeat = time.monotonic()
+            await asyncio.sleep(self.interval)
+            lag = max(loop.time() - scheduled, 0.0)
+            self._heartbeat = time.monotonic()
+            self._record(lag)
+
+    def _record(self, lag: float) -> None:
+        with self._lock:
+            self.samples.append(lag)
+            stall = self._pending_stall
+            self._pending_stall = None
+            if lag < self.threshold:
+                return
+            self.stall_count += 1
+            label = stall["label"] if stall else "<unknown>"
+            stack = stall["stack"] if stall else []
+            offender = self.offenders.setdefault(label, {"count": 0, "total": 0.0, "max": 0.0, "stack": []})
+            offender["count"] += 1
+            offender["total"] += lag
+            if lag >= offender["max"]:
+                offender["max"] = lag
+                offender["stack"] = stack
+        logger.warning(f"⚠️ 이벤트 루프 지연 {lag * 1000:.1f}ms: {label}")
+
+    def _watch(self) -> None:
+        """루프 스레드가 멈춘 동안 스택과 실행 중인 요청을 캡처합니다 (감시 스레드)."""
+        poll = max(self.threshold / 4, 0.005)
+        while not self._stop_event.wait(poll):
+            if time.monotonic() - self._heartbeat < self.interval + self.threshold:
+                continue
+            with self._lock:
+                if self._pending_stall is not None:
+                    continue
+                self._pending_stall = self._capture()
+
+    def _capture(self) -> Dict[str, Any]:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        stack = traceback.format_stack(frame, limit=self.stack_limit) if frame else []
+        task = asyncio.current_task(self._loop) if self._loop else None
+        if task is None:
+            label = "<loop callback>"
+        else:
+            label = self._in_flight.get(task) or f"<task {task.get_name()}>"
+        return {"label": label, "stack": [line.rstrip() for line in stack]}
+
+    # ── 리포트 ──
+
+    @staticmethod
+    def _percentile(ordered: List[float], percentile: float) -> float:
+        if not ordered:
+            return 0.0
+        index = min(int(round(percentile / 100 * (len(ordered) - 1))), len(ordered) - 1)
+        return ordered[index]
+
+    def report(self, top: int = 10) -> Dict[str, Any]:
+        """p50/p99 지연과 지연을 가장 많이 유발한 경로 목록을 반환합니다."""
+        with self._lock:
+            ordered = sorted(self.samples)
+            offenders = sorted(self.offenders.items(), key=lambda item: item[1]["total"], reverse=True)[:top]
+            stall_count = self.stall_count
+        return {
+            "enabled": self.running,
+            "intervalMs": round(self.interval * 1000, 2),
+            "thresholdMs": round(self.threshold * 1000, 2),
+            "sampleCount": len(ordered),
+            "p50Ms": round(self._percentile(ordered, 50) * 1000, 2),
+            "p99Ms": round(self._percentile(ordered, 99) * 1000, 2),
+            "maxMs": round(ordered[-1] * 1000, 2) if ordered else 0.0,
+            "stallCount": stall_count,
+            "topOffenders": [
+                {
+                    "path": label,
+                    "count": stats["count"],
+                    "totalMs": round(stats["total"] * 1000, 2),
+                    "maxMs": round(stats["max"] * 1000, 2),
+                    "stack": stats["stack"],
+                }
+                for label, stats in offenders
+            ],
+        }
+
+
+class LoopLagMiddleware:
+    """요청/WebSocket을 처리 중인 태스크를 모니터에 등록하는 ASGI 미들웨어"""
+    def __init__(self, app: ASGIApp, monitor: "LoopLagMonitor"):
+        self.app = app
+        self.monitor = monitor
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket") or not self.monitor.running:
+            await self.app(scope, receive, send)
+            return
+        task = asyncio.current_task()
+        label = f"{scope.get('method', 'WS')} {scope['path']}"
+        self.monitor.track(task, label)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.monitor.untrack(task)
+
+
+loop_monitor = LoopLagMonitor(
+    interval_ms=settings.LOOP_MONITOR_INTERVAL_MS,
+    threshold_ms=settings.LOOP_MONITOR_THRESHOLD_MS
+)
@@ -1,6 +1,6 @@
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from app.core.responses import APIResponse
 from typing import Dict, List, Callable, Any, Awaitable
 from starlette.middleware.base import RequestResponseEndpoint
 import time
@@ -8,6 +8,7 @@ import logging
 from app.core.config import settings
 from app.utils.exceptions import ConfigError
 from app.api.schemas.common import ResponseBase
+from app.core.loop_monitor import LoopLagMiddleware, loop_monitor
 
 logger = logging.getLogger(__name__)
 
@@ -103,7 +104,7 @@ async def request_logging_middleware(
             },
             exc_info=True
         )
-        return JSONResponse(
+        return APIResponse(
             status_code=500,
             content=ResponseBase(
                 resultCode="ERROR",
@@ -119,6 +120,8 @@ async def request_logging_middleware(
 def setup_middlewares(app: FastAPI) -> None:
     """미들웨어 설정"""
     try:
+        # 루프 지연 모니터는 핸들러와 같은 태스크에서 실행되도록 가장 안쪽에 등록
+        app.add_middleware(LoopLagMiddleware, monitor=loop_monitor)
         setup_cors_middleware(app)
         app.middleware("http")(request_logging_middleware)
         logger.info("✅ 전체 미들웨어 설정 완료")
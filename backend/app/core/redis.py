@@ -1,68 +1,257 @@
-from typing import Optional
+from typing import Any, List, Optional, Sequence
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from app.core.config import settings, logger
 from app.utils.exceptions import RedisError
 
+# Upstash REST 명령 형식: ["SET", "key", "value", "EX", 1200]
+Command = Sequence[Any]
+
+# 일시적인 게이트웨이 오류는 재시도 (SET/GET/DEL만 사용하므로 재전송해도 결과가 같음)
+RETRY_STATUS_CODES = (502, 503, 504)
+
+
+def _set_command(key: str, value: str, ttl: Optional[int] = None) -> List[Any]:
+    command: List[Any] = ["SET", key, value]
+    if ttl is not None:
+        command += ["EX", int(ttl)]  # TTL이 정수인지 검증
+    return command
+
+
+def _parse_result(body: Any) -> Any:
+    """단일 명령 응답({"result": ...} 또는 {"error": ...})에서 결과를 꺼냅니다."""
+    if isinstance(body, dict) and "error" in body:
+        raise RedisError(message="Redis command failed", detail={"error": body["error"]})
+    return body.get("result") if isinstance(body, dict) else None
+
+
+def _parse_results(body: Any) -> List[Any]:
+    """/pipeline, /multi-exec 응답(명령별 결과 목록)에서 결과 목록을 꺼냅니다."""
+    if not isinstance(body, list):
+        # multi-exec는 트랜잭션 전체가 실패하면 단일 {"error": ...}를 반환
+        _parse_result(body)
+        raise RedisError(message="Redis command failed", detail={"error": "Unexpected response", "body": body})
+    errors = [item["error"] for item in body if isinstance(item, dict) and "error" in item]
+    if errors:
+        raise RedisError(message="Redis command failed", detail={"error": errors})
+    return [item.get("result") for item in body]
+
+
 class RedisHandler:
+    """Upstash Redis REST 클라이언트
+
+    keep-alive 세션(커넥션 풀)을 재사용하고, 모든 요청에 연결/읽기 타임아웃과 재시도를 적용합니다.
+    명령은 JSON 배열로 전송하며, 여러 명령은 pipeline()/multi_exec()로 한 번의 왕복에 보냅니다.
+    """
 
     def __init__(self):
-        self.base_url = settings.UPSTASH_REDIS_REST_URL
+        self.base_url = settings.UPSTASH_REDIS_REST_URL.rstrip("/")
         self.token = settings.UPSTASH_REDIS_REST_TOKEN
         self.headers = {
             "Authorization": f"Bearer {self.token}",
             "Content-Type": "application/json"
         }
+        self.timeout = (settings.REDIS_CONNECT_TIMEOUT_SECONDS, settings.REDIS_READ_TIMEOUT_SECONDS)
+        self.session = self._create_session()
         logger.info("✅ RedisHandler 초기화 완료")
 
+    def _create_session(self) -> requests.Session:
+        retry = Retry(
+            total=settings.REDIS_MAX_RETRIES,
+            backoff_factor=0.1,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset({"GET", "POST"}),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=settings.REDIS_POOL_SIZE,
+            max_retries=retry,
+        )
+        session = requests.Session()
+        session.headers.update(self.headers)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _post(self, path: str, payload: Any) -> Any:
+        try:
+            response = self.session.post(f"{self.base_url}{path}", json=payload, timeout=self.timeout)
+            body = response.json() if response.content else None
+            if response.status_code >= 400 and not (isinstance(body, dict) and "error" in body):
+                response.raise_for_status()
+            return body
+        except (requests.exceptions.RequestException, ValueError) as e:
+            raise RedisError(message="Redis request failed", detail={"error": str(e)})
+
+    def execute(self, *command: Any) -> Any:
+        """명령 하나를 실행하고 결과를 반환합니다."""
+        return _parse_result(self._post("", list(command)))
+
+    def pipeline(self, commands: Sequence[Command]) -> List[Any]:
+        """여러 명령을 한 번의 요청으로 순서대로 실행합니다. (원자성 없음)"""
+        return _parse_results(self._post("/pipeline", [list(c) for c in commands]))
+
+    def multi_exec(self, commands: Sequence[Command]) -> List[Any]:
+        """여러 명령을 한 번의 요청으로 트랜잭션(MULTI/EXEC) 안에서 실행합니다."""
+        return _parse_results(self._post("/multi-exec", [list(c) for c in commands]))
+
     def set(self, key: str, value: str) -> bool:
         try:
-            url = f"{self.base_url}/set/{key}/{value}"
-            response = requests.post(url, headers=self.headers)
-            response.raise_for_status()  # 오류 발생 시 예외 처리
+            self.execute(*_set_command(key, value))
             logger.info(f"✅ Redis SET 저장 성공: {key} = {value}")
             return True
-        except requests.exceptions.RequestException as e:
-            logger.error(f"🚨 Redis SET 저장 실패: {e}")
-            raise RedisError(message=f"Redis set failed", detail={"error": str(e)})
+        except RedisError as e:
+            logger.error(f"🚨 Redis SET 저장 실패: {e.detail}")
+            raise
 
     def setex(self, key: str, value: str, ttl: int = 1200) -> bool:
         try:
-            ttl = int(ttl)  # TTL이 정수인지 검증
-            url = f"{self.base_url}/set/{key}/{value}?EX={ttl}"
-            response = requests.post(url, headers=self.headers)
-            response.raise_for_status()
+            self.execute(*_set_command(key, value, ttl))
             logger.info(f"✅ Redis SETEX 저장 성공: {key} = {value}, TTL={ttl}")
             return True
-        except (ValueError, requests.exceptions.RequestException) as e:
+        except ValueError as e:
             logger.error(f"🚨 Redis SETEX 오류: {e}")
             raise RedisError(message=f"Redis store failed", detail={"error": str(e)})
+        except RedisError as e:
+            logger.error(f"🚨 Redis SETEX 오류: {e.detail}")
+            raise
 
     def get(self, key: str) -> Optional[str]:
         try:
-            url = f"{self.base_url}/get/{key}"
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            result = response.json().get("result", None)
-
-            if result:
-                logger.info(f"🔹 Redis GET 요청 성공: {key} = {result}")
-                return result
-            else:
-                logger.warning(f"⚠️ Redis GET 요청: {key} 값 없음")
-                return None
-        except requests.exceptions.RequestException as e:
-            logger.error(f"🚨 Redis GET 요청 실패: {e}")
-            raise RedisError(f"Redis get failed", detail={"error": str(e)})
+            result = self.execute("GET", key)
+        except RedisError as e:
+            logger.error(f"🚨 Redis GET 요청 실패: {e.detail}")
+            raise
+
+        if result:
+            logger.info(f"🔹 Redis GET 요청 성공: {key} = {result}")
+            return result
+        logger.warning(f"⚠️ Redis GET 요청: {key} 값 없음")
+        return None
 
     def delete(self, key: str) -> bool:
         try:
-            url = f"{self.base_url}/del/{key}"
-            response = requests.post(url, headers=self.headers)
-            response.raise_for_status()
+            self.execute("DEL", key)
             logger.info(f"✅ Redis DELETE 성공: {key}")
             return True
-        except requests.exceptions.RequestException as e:
-            logger.error(f"🚨 Redis DELETE 실패: {e}")
-            raise RedisError(f"Redis delete failed", detail={"error": str(e)})
+        except RedisError as e:
+            logger.error(f"🚨 Redis DELETE 실패: {e.detail}")
+            raise
+
+    def close(self) -> None:
+        """풀링된 연결을 닫습니다. (이후 요청 시 다시 연결)"""
+        self.session.close()
+
+
+class AsyncRedisHandler:
+    """비동기 라우트용 Upstash Redis REST 클라이언트 (httpx.AsyncClient)
+
+    클라이언트는 처음 사용할 때 현재 이벤트 루프에서 생성되며, 앱 종료 시 aclose()로 닫습니다.
+    연결 실패는 transport 수준에서 재시도합니다.
+    """
+
+    def __init__(self):
+        self.base_url = settings.UPSTASH_REDIS_REST_URL.rstrip("/")
+        self.headers = {
+            "Authorization": f"Bearer {settings.UPSTASH_REDIS_REST_TOKEN}",
+            "Content-Type": "application/json"
+        }
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self.headers,
+                timeout=httpx.Timeout(
+                    settings.REDIS_READ_TIMEOUT_SECONDS,
+                    connect=settings.REDIS_CONNECT_TIMEOUT_SECONDS
+                ),
+                transport=httpx.AsyncHTTPTransport(
+                    retries=settings.REDIS_MAX_RETRIES,
+                    limits=httpx.Limits(
+                        max_connections=settings.REDIS_POOL_SIZE,
+                        max_keepalive_connections=settings.REDIS_POOL_SIZE
+                    )
+                ),
+            )
+        return self._client
+
+    async def _post(self, path: str, payload: Any) -> Any:
+        try:
+            response = await self.client.post(path or "/", json=payload)
+            body = response.json() if response.content else None
+            if response.status_code >= 400 and not (isinstance(body, dict) and "error" in body):
+                response.raise_for_status()
+            return body
+        except (httpx.HTTPError, ValueError) as e:
+            raise RedisError(message="Redis request failed", detail={"error": str(e)})
+
+    async def execute(self, *command: Any) -> Any:
+        """명령 하나를 실행하고 결과를 반환합니다."""
+        return _parse_result(await self._post("", list(command)))
+
+    async def pipeline(self, commands: Sequence[Command]) -> List[Any]:
+        """여러 명령을 한 번의 요청으로 순서대로 실행합니다. (원자성 없음)"""
+        return _parse_results(await self._post("/pipeline", [list(c) for c in commands]))
+
+    async def multi_exec(self, commands: Sequence[Command]) -> List[Any]:
+        """여러 명령을 한 번의 요청으로 트랜잭션(MULTI/EXEC) 안에서 실행합니다."""
+        return _parse_results(await self._post("/multi-exec", [list(c) for c in commands]))
+
+    async def set(self, key: str, value: str) -> bool:
+        try:
+            await self.execute(*_set_command(key, value))
+            logger.info(f"✅ Redis SET 저장 성공: {key} = {value}")
+            return True
+        except RedisError as e:
+            logger.error(f"🚨 Redis SET 저장 실패: {e.detail}")
+            raise
+
+    async def setex(self, key: str, value: str, ttl: int = 1200) -> bool:
+        try:
+            await self.execute(*_set_command(key, value, ttl))
+            logger.info(f"✅ Redis SETEX 저장 성공: {key} = {value}, TTL={ttl}")
+            return True
+        except ValueError as e:
+            logger.error(f"🚨 Redis SETEX 오류: {e}")
+            raise RedisError(message=f"Redis store failed", detail={"error": str(e)})
+        except RedisError as e:
+            logger.error(f"🚨 Redis SETEX 오류: {e.detail}")
+            raise
+
+    async def get(self, key: str) -> Optional[str]:
+        try:
+            result = await self.execute("GET", key)
+        except RedisError as e:
+            logger.error(f"🚨 Redis GET 요청 실패: {e.detail}")
+            raise
+
+        if result:
+            logger.info(f"🔹 Redis GET 요청 성공: {key} = {result}")
+            return result
+        logger.warning(f"⚠️ Redis GET 요청: {key} 값 없음")
+        return None
+
+    async def delete(self, key: str) -> bool:
+        try:
+            await self.execute("DEL", key)
+            logger.info(f"✅ Redis DELETE 성공: {key}")
+            return True
+        except RedisError as e:
+            logger.error(f"🚨 Redis DELETE 실패: {e.detail}")
+            raise
+
+    async def aclose(self) -> None:
+        """풀링된 연결을 닫습니다. (다음 사용 시 현재 이벤트 루프에서 다시 생성)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
 
 redis_handler = RedisHandler()
+async_redis_handler = AsyncRedisHandler()
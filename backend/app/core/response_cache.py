@@ -0,0 +1,114 @@
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Set, Tuple, TypeVar, Union
+
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.utils.handle_transaction import on_commit
+
+T = TypeVar("T")
+
+
+class DashboardCacheTag:
+    """대시보드 캐시 태그. 쓰기 서비스는 변경한 데이터의 태그를 커밋 시 폐기합니다."""
+    RENT = "rent"
+    MAINTENANCE = "maintenance"
+    ITEMS = "items"
+
+
+class ResponseCache:
+    """엔드포인트별 TTL 응답 캐시
+
+    키마다 조회 결과를 ttl초 동안 보관하여, TTL 안의 반복 조회는 DB를 조회하지 않습니다.
+    각 항목은 태그(예: "rent", "maintenance", "items")를 가지며, 서비스가 쓰기 트랜잭션을 커밋하면
+    invalidate_on_commit()으로 예약한 태그의 항목이 즉시 폐기됩니다.
+    조회 도중 폐기가 일어나면 그 결과는 저장하지 않습니다. (generation 비교)
+    """
+    def __init__(self, default_ttl: float):
+        self.default_ttl = default_ttl
+        self._entries: Dict[str, Tuple[float, Any, Set[str]]] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def _count(self, key: str, field: str) -> None:
+        stats = self._stats.setdefault(key, {"hits": 0, "misses": 0})
+        stats[field] += 1
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[T]],
+        tags: Iterable[str] = (),
+        ttl: Optional[float] = None
+    ) -> T:
+        """캐시된 값을 반환하고, 없거나 만료되었으면 loader()로 조회하여 저장합니다. (ttl <= 0이면 캐시하지 않음)"""
+        ttl = self.default_ttl if ttl is None else ttl
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._count(key, "hits")
+                return entry[1]
+            self._count(key, "misses")
+            generation = self._generation
+
+        value = await loader()
+        if ttl > 0:
+            with self._lock:
+                if self._generation == generation:
+                    self._entries[key] = (time.monotonic() + ttl, value, set(tags))
+        return value
+
+    def invalidate(self, *tags: str) -> int:
+        """태그가 하나라도 겹치는 항목을 폐기하고 폐기한 항목 수를 반환합니다. (태그 미지정 시 전체)"""
+        with self._lock:
+            self._generation += 1
+            if not tags:
+                removed = len(self._entries)
+                self._entries.clear()
+                return removed
+            stale = [key for key, (_, _, entry_tags) in self._entries.items() if entry_tags & set(tags)]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    # ── 트랜잭션 연동 ──
+
+    def invalidate_on_commit(self, session: Union[Session, AsyncSession], *tags: str) -> None:
+        """현재 트랜잭션이 커밋되면 tags 항목을 폐기하도록 예약합니다. (롤백 시 취소)"""
+        if tags:
+            on_commit(session, self.invalidate, *tags)
+
+    # ── 리포트 ──
+
+    def clear(self) -> None:
+        """캐시 항목과 적중 통계를 초기화합니다."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._stats.clear()
+
+    def report(self) -> Dict[str, Any]:
+        """키별 적중(hit)/미적중(miss) 횟수와 전체 적중률을 반환합니다."""
+        with self._lock:
+            stats = {key: dict(value) for key, value in self._stats.items()}
+            size = len(self._entries)
+        hits = sum(value["hits"] for value in stats.values())
+        misses = sum(value["misses"] for value in stats.values())
+        return {
+            "ttlSeconds": self.default_ttl,
+            "size": size,
+            "hits": hits,
+            "misses": misses,
+            "hitRatio": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+            "endpoints": [
+                {"key": key, "hits": value["hits"], "misses": value["misses"]}
+                for key, value in sorted(stats.items())
+            ],
+        }
+
+
+dashboard_cache = ResponseCache(default_ttl=settings.DASHBOARD_CACHE_TTL_SECONDS)
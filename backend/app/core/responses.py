@@ -0,0 +1,29 @@
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+def _orjson_default(value: Any) -> Any:
+    """orjson이 직접 직렬화하지 못하는 값 변환 (pydantic 모델, set, Decimal 등)"""
+    if isinstance(value, BaseModel):
+        return value.dict()
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    if isinstance(value, Decimal):
+        return float(value)
+    # 예외 객체 등 나머지는 문자열로 (stdlib 인코더는 TypeError로 500을 반환했음)
+    return str(value)
+
+
+class APIResponse(ORJSONResponse):
+    """앱 기본 응답 클래스 (orjson 직렬화)
+
+    datetime은 orjson 기본 동작대로 ISO 8601로 직렬화되며, timezone이 없는 값은 오프셋 없이
+    isoformat()과 같은 형식("2025-02-01T10:00:00")으로 출력됩니다.
+    에러 응답의 detail처럼 정수 키나 set이 섞인 dict도 직렬화합니다.
+    """
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
@@ -0,0 +1,62 @@
+import time
+from typing import Dict, Set
+
+from app.core.config import settings
+from app.core.redis import async_redis_handler
+
+
+class VehiclePresence:
+    """차량 네트워크 연결 상태 near cache
+
+    WebSocket을 가진 프로세스는 차량 연결/해제를 직접 알고 있으므로 로컬 상태를 먼저 확인하고,
+    다른 프로세스에 연결된 차량만 Redis(`vehicle:{vin}`)로 확인합니다.
+    Redis에서 연결되지 않은 것으로 확인된 결과는 negative_ttl초 동안 캐시하여 반복 조회를 줄입니다.
+    """
+    def __init__(self, negative_ttl: float):
+        self.negative_ttl = negative_ttl
+        self._connected: Set[str] = set()
+        self._negative: Dict[str, float] = {}
+
+    @staticmethod
+    def redis_key(vin: str) -> str:
+        return f"vehicle:{vin}"
+
+    def mark_connected(self, vin: str) -> None:
+        """이 프로세스에 연결된 차량으로 기록합니다."""
+        self._connected.add(vin)
+        self._negative.pop(vin, None)
+
+    def mark_disconnected(self, vin: str) -> None:
+        """연결 해제된 차량으로 기록합니다. (다른 프로세스 재연결은 negative_ttl 이후 Redis로 확인)"""
+        self._connected.discard(vin)
+        self._remember_disconnected(vin)
+
+    def forget(self, vin: str) -> None:
+        """캐시된 미연결 결과를 버립니다. (다음 확인 시 Redis 조회)"""
+        self._negative.pop(vin, None)
+
+    def _remember_disconnected(self, vin: str) -> None:
+        if self.negative_ttl > 0:
+            self._negative[vin] = time.monotonic() + self.negative_ttl
+
+    async def is_connected(self, vin: str) -> bool:
+        """차량이 네트워크에 연결되어 있는지 확인합니다. (로컬 상태 → 미연결 캐시 → Redis 순)"""
+        if vin in self._connected:
+            return True
+        expires_at = self._negative.get(vin)
+        if expires_at is not None:
+            if expires_at > time.monotonic():
+                return False
+            self._negative.pop(vin, None)
+
+        connected = await async_redis_handler.get(self.redis_key(vin)) == "connected"
+        if not connected:
+            self._remember_disconnected(vin)
+        return connected
+
+    def clear(self) -> None:
+        self._connected.clear()
+        self._negative.clear()
+
+
+vehicle_presence = VehiclePresence(negative_ttl=settings.VEHICLE_PRESENCE_NEGATIVE_TTL_SECONDS)
@@ -0,0 +1,182 @@
+from typing import Any, Dict, Iterable, List, Optional
+from sqlmodel import select, func
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from datetime import datetime
+from app.db.crud.base import CRUDQueryBase, T
+from app.utils.exceptions import DatabaseError, NotFoundError
+
+
+class AsyncCRUDBase(CRUDQueryBase[T]):
+    """AsyncSession용 CRUDBase.
+
+    쿼리 생성은 CRUDBase와 공유하고, 실행만 await로 처리하여 쿼리 대기 중 이벤트 루프를 점유하지 않습니다.
+    모델별 CRUD 메서드(예: module_set_crud.calculate_base_prices)는 session.run_sync로 재사용합니다.
+    """
+
+    async def get_by_field(self, session: AsyncSession, id_value: Any, id_field: str = "id") -> Optional[T]:
+        """주어진 필드와 값을 기준으로 객체를 조회합니다."""
+        result = await session.exec(self.base_query().where(getattr(self.model, id_field) == id_value))
+        return result.first()
+
+    async def get_by_ids(
+        self,
+        session: AsyncSession,
+        id_values: Iterable[Any],
+        id_field: str = "id",
+        include_deleted: bool = False
+    ) -> Dict[Any, T]:
+        """여러 값을 IN 쿼리 한 번으로 조회하여 {필드 값: 객체} 딕셔너리로 반환합니다."""
+        id_values = set(id_values)
+        if not id_values:
+            return {}
+        query = select(self.model) if include_deleted else self.base_query()
+        column = getattr(self.model, id_field)
+        result = await session.exec(query.where(column.in_(id_values)))
+        return {getattr(obj, id_field): obj for obj in result.all()}
+
+    async def save(self, session: AsyncSession, obj: T, refresh: bool = True) -> T:
+        """객체를 DB에 저장하고 새 객체로 refresh하여 반환합니다. (refresh=False이면 refresh SELECT 생략)"""
+        session.add(obj)
+        await session.flush()
+        if refresh:
+            await session.refresh(obj)
+        return obj
+
+    async def create(self, session: AsyncSession, obj_in, refresh: bool = True) -> T:
+        """객체를 생성합니다."""
+        try:
+            db_obj = self.model(**obj_in.dict())
+            return await self.save(session, db_obj, refresh=refresh)
+        except IntegrityError as e:
+            await session.rollback()
+            raise DatabaseError(
+                message="객체 생성 오류.",
+                detail={"origin": str(e)}
+            )
+
+    async def update(self, session: AsyncSession, id_value: Any, obj_in, id_field: str = "id") -> Optional[T]:
+        """객체를 업데이트합니다."""
+        db_obj = await self.get_by_field(session, id_value, id_field)
+        if not db_obj:
+            raise NotFoundError(f"{self.model.__name__} with {id_field}={id_value} not found")
+        # obj_in이 딕셔너리이면 그대로 사용, 아니면 .dict()로 변환
+        update_data = obj_in.dict(exclude_unset=True) if hasattr(obj_in, "dict") else obj_in
+        for field, value in update_data.items():
+            setattr(db_obj, field, value)
+        return await self.save(session, db_obj)
+
+    async def bulk_update(self, session: AsyncSession, id_values: Iterable[Any], values: Dict[str, Any], id_field: str = "id") -> int:
+        """여러 객체를 UPDATE ... WHERE id IN (...) 한 번으로 갱신하고 갱신된 행 수를 반환합니다."""
+        id_values = set(id_values)
+        if not id_values or not values:
+            return 0
+        result = await session.execute(self.build_bulk_update(id_values, values, id_field))
+        if result.rowcount != len(id_values):
+            raise NotFoundError(
+                message=f"{self.model.__name__} not found",
+                detail={id_field: sorted(id_values), "updated": result.rowcount}
+            )
+        return result.rowcount
+
+    async def claim(
+        self,
+        session: AsyncSession,
+        filters: Dict[str, Any],
+        values: Dict[str, Any],
+        count: int = 1,
+        id_values: Optional[Iterable[Any]] = None
+    ) -> List[T]:
+        """filters 조건을 만족하는 객체 최대 count개를 원자적으로 선점(values로 갱신)하여 반환합니다."""
+        if count <= 0:
+            return []
+        return list((await session.scalars(self.build_claim(filters, values, count, id_values))).all())
+
+    async def soft_delete(self, session: AsyncSession, id_value: Any, id_field: str = "id") -> Optional[T]:
+        """객체를 논리적으로 삭제합니다."""
+        db_obj = await self.get_by_field(session, id_value, id_field)
+        if not db_obj:
+            raise NotFoundError(f"{self.model.__name__} with {id_field}={id_value} not found")
+        if not hasattr(db_obj, "deleted_at"):
+            raise DatabaseError(
+                message="Soft delete 기능 미구성 (deleted_at 없음).",
+                detail={"model": self.model.__name__}
+            )
+        setattr(db_obj, "deleted_at", datetime.now())
+        return await self.save(session, db_obj)
+
+    async def hard_delete(self, session: AsyncSession, id_value: Any, id_field: str = "id") -> None:
+        """객체를 영구적으로 삭제합니다."""
+        db_obj = await self.get_by_field(session, id_value, id_field)
+        if not db_obj:
+            raise NotFoundError(f"{self.model.__name__} with {id_field}={id_value} not found")
+        await session.delete(db_obj)
+        await session.flush()
+
+    async def count(self, session: AsyncSession, query: Any = None) -> int:
+        """쿼리 결과 건수를 조회합니다. (query 미지정 시 전체 객체 수)"""
+        base_query = query if query is not None else self.base_query()
+        result = await session.exec(select(func.count()).select_from(base_query.subquery()))
+        return result.one()
+
+    async def count_all(self, session: AsyncSession) -> int:
+        """전체 객체 수를 조회합니다."""
+        return await self.count(session)
+
+    async def paginate(
+        self,
+        session: AsyncSession,
+        page: int = 1,
+        page_size: int = 10,
+        query: Any = None,
+        after: Optional[str] = None,
+        include_total: bool = True,
+        sort_by: Optional[str] = None,
+        order: str = "asc"
+    ) -> Dict[str, Any]:
+        """쿼리 결과를 페이지네이션합니다. (CRUDBase.paginate와 동일한 응답 형식)"""
+        try:
+            page = max(page, 1)
+            page_size = max(page_size, 1)
+            base_query = query if query is not None else self.base_query()
+            if sort_by and not hasattr(self.model, sort_by):
+                sort_by = None
+
+            total_count = await self.count(session, base_query) if include_total else None
+
+            page_query = self.build_page_query(base_query, page, page_size, after, sort_by, order)
+            results = list((await session.exec(page_query)).all())
+            return self.build_page(results, total_count, page, page_size, sort_by)
+        except SQLAlchemyError as e:
+            raise DatabaseError(
+                message="페이지네이션 처리 오류.",
+                detail={"error": str(e), "page": page, "page_size": page_size}
+            )
+
+    async def get_list(
+        self,
+        session: AsyncSession,
+        filters: Optional[Dict[str, Any]] = None,
+        sort_by: Optional[str] = None,
+        order: str = "asc",
+        search: Optional[str] = None,
+        search_fields: Optional[list] = None,
+        page: int = 1,
+        page_size: int = 10,
+        include_deleted: bool = False,
+        after: Optional[str] = None,
+        include_total: bool = True
+    ) -> Dict[str, Any]:
+        """필터링, 정렬, 검색을 적용하여 페이지네이션된 결과를 반환합니다. (검색 시 관련도 정렬은 CRUDBase.get_list와 동일)"""
+        order_by_relevance = bool(search) and not sort_by and not after
+        query = self.build_list_query(
+            filters, search, search_fields, include_deleted,
+            dialect=session.get_bind().dialect.name, order_by_relevance=order_by_relevance
+        )
+        result = await self.paginate(
+            session, page, page_size, query,
+            after=after, include_total=include_total, sort_by=sort_by, order=order
+        )
+        if order_by_relevance:
+            result["pagination"]["nextCursor"] = None
+        return result
@@ -1,12 +1,20 @@
-from typing import Dict, Optional, TypeVar, Type, Generic, Any
-from sqlmodel import SQLModel, Session, or_, select, func
+from typing import Dict, Iterable, Iterator, List, Optional, TypeVar, Type, Generic, Any, Tuple
+from sqlmodel import SQLModel, Session, or_, select, func, update
+from sqlalchemy import insert, tuple_
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from datetime import datetime
-from app.utils.exceptions import DatabaseError, NotFoundError
+import base64
+import binascii
+import json
+from app.db.search_index import get_search_index
+from app.utils.exceptions import BadRequestError, DatabaseError, NotFoundError
 
 T = TypeVar("T", bound=SQLModel)
 
-class CRUDBase(Generic[T]):
+class CRUDQueryBase(Generic[T]):
+    """동기/비동기 CRUD가 공유하는 쿼리 생성 로직 (DB 입출력 없음)."""
     def __init__(self, model: Type[T]):
         self.model = model
 
@@ -17,23 +25,247 @@ class CRUDBase(Generic[T]):
             query = query.where(getattr(self.model, "deleted_at").is_(None))
         return query
 
+    @property
+    def pk_column(self) -> Any:
+        """모델의 기본 키 컬럼을 반환합니다 (복합 키인 경우 첫 번째 컬럼)."""
+        return getattr(self.model, list(self.model.__table__.primary_key.columns)[0].name)
+
+    def encode_cursor(self, obj: T, sort_by: Optional[str] = None) -> str:
+        """마지막 행의 정렬 키와 기본 키를 불투명한 커서 문자열로 인코딩합니다."""
+        sort_value = getattr(obj, sort_by) if sort_by else None
+        if isinstance(sort_value, datetime):
+            sort_value = sort_value.isoformat()
+        raw = json.dumps([sort_by, sort_value, getattr(obj, self.pk_column.key)])
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, cursor: str, sort_by: Optional[str] = None) -> Tuple[Any, Any]:
+        """커서 문자열을 (정렬 키 값, 기본 키 값)으로 디코딩합니다."""
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            cursor_sort_by, sort_value, pk_value = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        except (ValueError, TypeError, binascii.Error):
+            raise BadRequestError(message="Invalid cursor", detail={"after": cursor})
+        if cursor_sort_by != sort_by:
+            raise BadRequestError(
+                message="Cursor does not match sort order",
+                detail={"after": cursor, "sort_by": sort_by}
+            )
+        if sort_by and sort_value is not None and getattr(self.model, sort_by).type.python_type is datetime:
+            sort_value = datetime.fromisoformat(sort_value)
+        return sort_value, pk_value
+
+    def build_bulk_update(self, id_values: Iterable[Any], values: Dict[str, Any], id_field: str = "id") -> Any:
+        """id_field IN (id_values)인 행(soft delete 제외)을 한 번에 갱신하는 UPDATE 문을 생성합니다."""
+        statement = update(self.model).where(getattr(self.model, id_field).in_(id_values)).values(**values)
+        if hasattr(self.model, "deleted_at"):
+            statement = statement.where(getattr(self.model, "deleted_at").is_(None))
+        # 세션에 이미 로드된 객체에도 변경 값을 반영
+        return statement.execution_options(synchronize_session="evaluate")
+
+    def build_counter_update(self, key: Dict[str, Any], deltas: Dict[str, Any]) -> Any:
+        """key 행의 카운터 컬럼에 deltas를 더하는 UPDATE 문을 생성합니다."""
+        return (
+            update(self.model)
+            .where(*[getattr(self.model, field) == value for field, value in key.items()])
+            .values(**{field: getattr(self.model, field) + delta for field, delta in deltas.items()})
+        )
+
+    def build_counter_upsert(self, key: Dict[str, Any], deltas: Dict[str, Any], dialect: Optional[str]) -> Any:
+        """key 행이 없으면 deltas 값으로 생성하고, 있으면 카운터에 deltas를 더하는 INSERT ... ON CONFLICT DO UPDATE 문을 생성합니다.
+
+        key는 기본 키(또는 유니크 키) 컬럼이어야 합니다. SQLite/PostgreSQL이 아니면 None을 반환합니다.
+        """
+        if dialect == "sqlite":
+            statement = sqlite_insert(self.model.__table__)
+        elif dialect == "postgresql":
+            statement = postgresql_insert(self.model.__table__)
+        else:
+            return None
+        statement = statement.values(**key, **deltas)
+        table = self.model.__table__
+        return statement.on_conflict_do_update(
+            index_elements=list(key),
+            set_={field: table.c[field] + statement.excluded[field] for field in deltas}
+        )
+
+    def build_claim(
+        self,
+        filters: Dict[str, Any],
+        values: Dict[str, Any],
+        count: int = 1,
+        id_values: Optional[Iterable[Any]] = None
+    ) -> Any:
+        """filters 조건을 만족하는 행 최대 count개를 values로 갱신하고 갱신된 행을 반환하는 UPDATE ... RETURNING 문을 생성합니다.
+
+        후보 선택과 갱신이 한 문장에서 이루어지며, 외부 WHERE에서 조건을 다시 확인하므로 동시에 실행되어도
+        같은 행이 두 번 선점되지 않습니다. PostgreSQL에서는 후보 조회가 FOR UPDATE SKIP LOCKED로 실행되어
+        다른 트랜잭션이 잠근 행을 기다리지 않고 건너뜁니다. (SQLite는 FOR UPDATE를 생략하고 쓰기 잠금으로 직렬화)
+        id_values를 지정하면 해당 기본 키 중에서만 후보를 고릅니다.
+        """
+        conditions = [getattr(self.model, field) == value for field, value in filters.items()]
+        if hasattr(self.model, "deleted_at"):
+            conditions.append(getattr(self.model, "deleted_at").is_(None))
+        pk = self.pk_column
+        if id_values is not None:
+            conditions.append(pk.in_(id_values))
+        candidates = (
+            select(pk)
+            .where(*conditions)
+            .order_by(pk)
+            .limit(count)
+            .with_for_update(skip_locked=True)
+        )
+        statement = (
+            update(self.model)
+            .where(pk.in_(candidates.scalar_subquery()), *conditions)
+            .values(**values)
+            .returning(self.model)
+        )
+        # 세션에 이미 로드된 객체는 RETURNING 값으로 덮어씀
+        return statement.execution_options(synchronize_session=False, populate_existing=True)
+
+    def build_search(
+        self,
+        query: Any,
+        search: str,
+        search_fields: list,
+        dialect: Optional[str] = None
+    ) -> Tuple[Any, Optional[Any]]:
+        """검색 조건을 적용한 (쿼리, 관련도 정렬식)을 반환합니다.
+
+        모델에 전문 검색 인덱스가 있고 dialect가 지정되면 인덱스로 검색하고,
+        그 외(인덱스 없는 컬럼, 짧은 검색어 등)에는 ILIKE '%검색어%'로 검색합니다. (관련도 정렬식 None)
+        """
+        fields = [field for field in search_fields if hasattr(self.model, field)]
+        if not fields:
+            return query, None
+        index = get_search_index(self.model)
+        indexed = index.apply(query, search, fields, dialect) if index is not None else None
+        if indexed is not None:
+            return indexed
+        return query.where(or_(*[getattr(self.model, field).ilike(f"%{search}%") for field in fields])), None
+
+    def build_list_query(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        search: Optional[str] = None,
+        search_fields: Optional[list] = None,
+        include_deleted: bool = False,
+        dialect: Optional[str] = None,
+        order_by_relevance: bool = False
+    ) -> Any:
+        """필터와 검색 조건을 적용한 목록 조회 쿼리를 생성합니다.
+
+        order_by_relevance=True이면 인덱스 검색 결과를 관련도 순으로 먼저 정렬합니다.
+        """
+        # 기본 쿼리 생성
+        if include_deleted:
+            query = select(self.model)
+        else:
+            query = self.base_query()
+
+        # 필터 적용
+        if filters:
+            for field, value in filters.items():
+                if hasattr(self.model, field):
+                    query = query.where(getattr(self.model, field) == value)
+
+        # 검색 조건 적용 (검색할 필드가 지정되었을 경우)
+        if search and search_fields:
+            query, relevance = self.build_search(query, search, search_fields, dialect)
+            if order_by_relevance and relevance is not None:
+                query = query.order_by(relevance)
+        return query
+
+    def build_page_query(
+        self,
+        query: Any,
+        page: int,
+        page_size: int,
+        after: Optional[str] = None,
+        sort_by: Optional[str] = None,
+        order: str = "asc"
+    ) -> Any:
+        """정렬/커서/오프셋을 적용하고, 다음 페이지 확인을 위해 page_size + 1건을 조회하는 쿼리를 생성합니다."""
+        # 정렬 조건 적용 (기본 키를 보조 정렬 키로 사용하여 순서를 고정)
+        descending = order.lower() == "desc"
+        pk = self.pk_column
+        sort_columns = [getattr(self.model, sort_by), pk] if sort_by else [pk]
+        page_query = query.order_by(*[col.desc() if descending else col.asc() for col in sort_columns])
+
+        if after:
+            sort_value, pk_value = self.decode_cursor(after, sort_by)
+            if sort_by:
+                key, bound = tuple_(*sort_columns), tuple_(sort_value, pk_value)
+            else:
+                key, bound = pk, pk_value
+            page_query = page_query.where(key < bound if descending else key > bound)
+        else:
+            page_query = page_query.offset((page - 1) * page_size)
+
+        return page_query.limit(page_size + 1)
+
+    def build_page(
+        self,
+        results: list,
+        total_count: Optional[int],
+        page: int,
+        page_size: int,
+        sort_by: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """page_size + 1건의 조회 결과로 페이지네이션 응답을 구성합니다."""
+        has_next = len(results) > page_size
+        results = results[:page_size]
+        return {
+            "items": results,
+            "pagination": {
+                "totalItems": total_count,
+                "totalPages": (total_count + page_size - 1) // page_size if total_count is not None else None,
+                "currentPage": page,
+                "pageSize": page_size,
+                "nextCursor": self.encode_cursor(results[-1], sort_by) if has_next else None,
+            }
+        }
+
+
+class CRUDBase(CRUDQueryBase[T]):
+
     def get_by_field(self, session: Session, id_value: Any, id_field: str = "id") -> Optional[T]:
         """주어진 필드와 값을 기준으로 객체를 조회합니다."""
         return session.exec(self.base_query().where(getattr(self.model, id_field) == id_value)).first()
 
+    def get_by_ids(
+        self,
+        session: Session,
+        id_values: Iterable[Any],
+        id_field: str = "id",
+        include_deleted: bool = False
+    ) -> Dict[Any, T]:
+        """여러 값을 IN 쿼리 한 번으로 조회하여 {필드 값: 객체} 딕셔너리로 반환합니다."""
+        id_values = set(id_values)
+        if not id_values:
+            return {}
+        query = select(self.model) if include_deleted else self.base_query()
+        column = getattr(self.model, id_field)
+        return {getattr(obj, id_field): obj for obj in session.exec(query.where(column.in_(id_values))).all()}
 
-    def save(self, session: Session, obj: T) -> T:
-        """객체를 DB에 저장하고 새 객체로 refresh하여 반환합니다."""
+    def save(self, session: Session, obj: T, refresh: bool = True) -> T:
+        """객체를 DB에 저장하고 새 객체로 refresh하여 반환합니다.
+
+        refresh=False이면 refresh SELECT를 생략합니다. eager_defaults가 설정된 모델은
+        INSERT ... RETURNING으로 생성된 키와 server_default 값(created_at 등)이 flush 시점에 채워집니다.
+        """
         session.add(obj)
         session.flush()
-        session.refresh(obj)
+        if refresh:
+            session.refresh(obj)
         return obj
 
-    def create(self, session: Session, obj_in) -> T:
+    def create(self, session: Session, obj_in, refresh: bool = True) -> T:
         """객체를 생성합니다."""
         try:
             db_obj = self.model(**obj_in.dict())
-            return self.save(session, db_obj)
+            return self.save(session, db_obj, refresh=refresh)
         except IntegrityError as e:
             session.rollback()
             raise DatabaseError(
@@ -52,6 +284,58 @@ class CRUDBase(Generic[T]):
             setattr(db_obj, field, value)
         return self.save(session, db_obj)
 
+    def bulk_update(self, session: Session, id_values: Iterable[Any], values: Dict[str, Any], id_field: str = "id") -> int:
+        """여러 객체를 UPDATE ... WHERE id IN (...) 한 번으로 갱신하고 갱신된 행 수를 반환합니다.
+
+        update()와 달리 조회/refresh를 하지 않으며, 대상 중 하나라도 없으면 NotFoundError를 발생시킵니다.
+        """
+        id_values = set(id_values)
+        if not id_values or not values:
+            return 0
+        result = session.execute(self.build_bulk_update(id_values, values, id_field))
+        if result.rowcount != len(id_values):
+            raise NotFoundError(
+                message=f"{self.model.__name__} not found",
+                detail={id_field: sorted(id_values), "updated": result.rowcount}
+            )
+        return result.rowcount
+
+    def increment_counter(self, session: Session, key: Dict[str, Any], deltas: Dict[str, Any]) -> None:
+        """key 행의 카운터를 deltas만큼 증감합니다. 행이 없으면 deltas 값으로 생성합니다.
+
+        UPDATE 후 INSERT하는 방식은 같은 key의 첫 쓰기가 동시에 일어나면 둘 다 INSERT하여 한쪽이 기본 키 충돌로 실패하므로
+        upsert 한 문장으로 처리합니다. upsert를 지원하지 않는 DB는 savepoint 안에서 INSERT하고, 충돌하면 UPDATE를 다시 실행합니다.
+        """
+        statement = self.build_counter_upsert(key, deltas, session.get_bind().dialect.name)
+        if statement is not None:
+            session.execute(statement)
+            return
+        counter_update = self.build_counter_update(key, deltas)
+        if session.execute(counter_update).rowcount:
+            return
+        try:
+            with session.begin_nested():
+                session.execute(insert(self.model.__table__).values(**key, **deltas))
+        except IntegrityError:
+            session.execute(counter_update)
+
+    def claim(
+        self,
+        session: Session,
+        filters: Dict[str, Any],
+        values: Dict[str, Any],
+        count: int = 1,
+        id_values: Optional[Iterable[Any]] = None
+    ) -> List[T]:
+        """filters 조건을 만족하는 객체 최대 count개를 원자적으로 선점(values로 갱신)하여 반환합니다.
+
+        SELECT 후 UPDATE하는 방식과 달리 동시 요청이 같은 객체를 선점하지 않습니다.
+        조건을 만족하는 객체가 부족하면 count보다 적은 수를 반환합니다.
+        """
+        if count <= 0:
+            return []
+        return list(session.scalars(self.build_claim(filters, values, count, id_values)).all())
+
     def soft_delete(self, session: Session, id_value: Any, id_field: str = "id") -> Optional[T]:
         """객체를 논리적으로 삭제합니다."""
         db_obj = self.get_by_field(session, id_value, id_field)
@@ -73,32 +357,53 @@ class CRUDBase(Generic[T]):
         session.delete(db_obj)
         session.flush()
 
-    def paginate(self, session: Session, page: int = 1, page_size: int = 10, query: Any = None) -> Dict[str, Any]:
-        """쿼리 결과를 페이지네이션합니다."""
+    def paginate(
+        self,
+        session: Session,
+        page: int = 1,
+        page_size: int = 10,
+        query: Any = None,
+        after: Optional[str] = None,
+        include_total: bool = True,
+        sort_by: Optional[str] = None,
+        order: str = "asc"
+    ) -> Dict[str, Any]:
+        """쿼리 결과를 페이지네이션합니다.
+
+        after 커서가 주어지면 OFFSET 대신 (정렬 컬럼, 기본 키) 기준 seek 방식으로 다음 페이지를 조회하므로
+        깊은 페이지도 첫 페이지와 같은 비용으로 조회됩니다. include_total=False이면 COUNT 쿼리를 생략합니다.
+        """
         try:
             page = max(page, 1)
             page_size = max(page_size, 1)
             base_query = query if query is not None else self.base_query()
-            count_query = select(func.count()).select_from(base_query.subquery())
-            total_count = session.exec(count_query).one()
-            results = session.exec(
-                base_query.offset((page - 1) * page_size).limit(page_size)
-            ).all()
-            return {
-                "items": results,
-                "pagination": {
-                    "totalItems": total_count,
-                    "totalPages": (total_count + page_size - 1) // page_size,
-                    "currentPage": page,
-                    "pageSize": page_size,
-                }
-            }
+            if sort_by and not hasattr(self.model, sort_by):
+                sort_by = None
+
+            total_count: Optional[int] = None
+            if include_total:
+                count_query = select(func.count()).select_from(base_query.subquery())
+                total_count = session.exec(count_query).one()
+
+            page_query = self.build_page_query(base_query, page, page_size, after, sort_by, order)
+            results = list(session.exec(page_query).all())
+            return self.build_page(results, total_count, page, page_size, sort_by)
         except SQLAlchemyError as e:
             raise DatabaseError(
                 message="페이지네이션 처리 오류.",
                 detail={"error": str(e), "page": page, "page_size": page_size}
             )
 
+    def iter_batches(self, session: Session, query: Any = None, batch_size: int = 500) -> Iterator[List[T]]:
+        """쿼리 결과를 서버 측 커서(yield_per)로 batch_size개씩 읽어 기본 키 순으로 반환합니다.
+
+        전체 결과를 메모리에 올리지 않으므로 내보내기처럼 건수가 많은 조회에 사용합니다. (COUNT 쿼리 없음)
+        """
+        base_query = query if query is not None else self.base_query()
+        result = session.scalars(base_query.order_by(self.pk_column).execution_options(yield_per=batch_size))
+        for partition in result.partitions():
+            yield list(partition)
+
     def count_all(self, session: Session) -> int:
         """전체 객체 수를 조회합니다."""
         base_query = self.base_query()
@@ -115,35 +420,25 @@ class CRUDBase(Generic[T]):
         search_fields: Optional[list] = None,
         page: int = 1,
         page_size: int = 10,
-        include_deleted: bool = False
+        include_deleted: bool = False,
+        after: Optional[str] = None,
+        include_total: bool = True
     ) -> Dict[str, Any]:
-        """필터링, 정렬, 검색을 적용하여 페이지네이션된 결과를 반환합니다."""
-        # 기본 쿼리 생성
-        if include_deleted:
-            query = select(self.model)
-        else:
-            query = self.base_query()
+        """필터링, 정렬, 검색을 적용하여 페이지네이션된 결과를 반환합니다.
 
-        # 필터 적용
-        if filters:
-            for field, value in filters.items():
-                if hasattr(self.model, field):
-                    query = query.where(getattr(self.model, field) == value)
+        검색어가 있고 sort_by/after가 없으면 관련도 순으로 정렬하며, 이때 다음 페이지는 page 번호로 조회합니다. (커서 미발급)
+        """
+        order_by_relevance = bool(search) and not sort_by and not after
+        query = self.build_list_query(
+            filters, search, search_fields, include_deleted,
+            dialect=session.get_bind().dialect.name, order_by_relevance=order_by_relevance
+        )
 
-        # 검색 조건 적용 (검색할 필드가 지정되었을 경우)
-        if search and search_fields:
-            conditions = [
-                getattr(self.model, field).ilike(f"%{search}%")
-                for field in search_fields if hasattr(self.model, field)
-            ]
-            if conditions:
-                query = query.where(or_(*conditions))
-
-        # 정렬 조건 적용
-        if sort_by and hasattr(self.model, sort_by):
-            column = getattr(self.model, sort_by)
-            column = column.desc() if order.lower() == "desc" else column.asc()
-            query = query.order_by(column)
-
-        # 페이지네이션 처리
-        return self.paginate(session, page, page_size, query) 
\ No newline at end of file
+        # 정렬 및 페이지네이션 처리
+        result = self.paginate(
+            session, page, page_size, query,
+            after=after, include_total=include_total, sort_by=sort_by, order=order
+        )
+        if order_by_relevance:
+            result["pagination"]["nextCursor"] = None
+        return result
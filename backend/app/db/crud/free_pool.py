@@ -0,0 +1,233 @@
+from collections import defaultdict
+from sqlalchemy import event, inspect, literal
+from sqlmodel import Session, select
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+import logging
+import threading
+from app.utils.lut_constants import ItemStatus
+
+logger = logging.getLogger(__name__)
+
+# (item_type_id, 그룹 ID: 모듈은 module_type_id, 옵션은 option_type_id, 차량은 None)
+PoolKey = Tuple[int, Optional[int]]
+
+_PENDING_KEY = "free_pool_pending"
+_LISTENING_KEY = "free_pool_listening"
+
+
+class FreePoolIndex:
+    """아이템 종류/타입별 사용 가능(INACTIVE) 아이템 ID 인메모리 인덱스.
+
+    렌트 시 후보 ID를 O(1)로 꺼내 기본 키로 선점하므로 테이블을 스캔하지 않습니다.
+    인덱스는 힌트일 뿐이며 선점은 항상 DB의 조건부 UPDATE로 확정되므로, 인덱스가 오래되어도 중복 할당되지 않습니다.
+    상태 변경은 트랜잭션이 커밋된 뒤에 반영되고, 선점 후 롤백되면 꺼냈던 ID를 되돌립니다.
+    """
+    def __init__(self):
+        self._pools: Dict[PoolKey, Set[int]] = defaultdict(set)
+        self._sources: List["FreePoolCRUDMixin"] = []
+        self.loaded = False
+        self._lock = threading.Lock()
+
+    def register(self, crud: "FreePoolCRUDMixin") -> None:
+        """rebuild() 시 적재할 CRUD를 등록합니다."""
+        self._sources.append(crud)
+
+    def rebuild(self, session: Session) -> Dict[PoolKey, int]:
+        """등록된 테이블에서 INACTIVE 아이템을 조회하여 인덱스 전체를 다시 구성하고 키별 개수를 반환합니다."""
+        pools: Dict[PoolKey, Set[int]] = defaultdict(set)
+        for crud in self._sources:
+            for item_id, group in session.exec(crud.build_free_query()).all():
+                pools[(crud.pool_item_type, group)].add(item_id)
+        with self._lock:
+            self._pools = pools
+            self.loaded = True
+        return {key: len(ids) for key, ids in pools.items()}
+
+    def clear(self) -> None:
+        """인덱스를 비웁니다. (선점은 테이블 스캔으로 처리)"""
+        with self._lock:
+            self._pools = defaultdict(set)
+            self.loaded = False
+
+    def size(self, key: PoolKey) -> int:
+        return len(self._pools.get(key, ()))
+
+    def __contains__(self, entry: Tuple[PoolKey, int]) -> bool:
+        key, item_id = entry
+        return item_id in self._pools.get(key, ())
+
+    def take(self, key: PoolKey, count: int) -> List[int]:
+        """후보 ID를 최대 count개 꺼냅니다. 꺼낸 ID는 다른 요청의 후보에서 제외됩니다."""
+        with self._lock:
+            pool = self._pools.get(key)
+            if not pool:
+                return []
+            return [pool.pop() for _ in range(min(count, len(pool)))]
+
+    def _apply(self, moves: Iterable[Tuple[int, Optional[PoolKey], Optional[PoolKey]]]) -> None:
+        with self._lock:
+            for item_id, old_key, new_key in moves:
+                if old_key is not None:
+                    self._pools[old_key].discard(item_id)
+                if new_key is not None:
+                    self._pools[new_key].add(item_id)
+
+    # ── 트랜잭션 연동 ──
+
+    def _pending(self, session: Session) -> Dict[str, list]:
+        if not session.info.get(_LISTENING_KEY):
+            session.info[_LISTENING_KEY] = True
+            event.listen(session, "after_commit", self._after_commit)
+            event.listen(session, "after_rollback", self._after_rollback)
+        return session.info.setdefault(_PENDING_KEY, {"commit": [], "rollback": []})
+
+    def _after_commit(self, session: Session) -> None:
+        pending = session.info.pop(_PENDING_KEY, None)
+        if pending:
+            self._apply(pending["commit"])
+
+    def _after_rollback(self, session: Session) -> None:
+        pending = session.info.pop(_PENDING_KEY, None)
+        if pending:
+            self._apply(pending["rollback"])
+
+    def move(self, session: Session, item_id: int, old_key: Optional[PoolKey], new_key: Optional[PoolKey]) -> None:
+        """현재 트랜잭션이 커밋되면 아이템을 old_key에서 new_key로 옮기도록 예약합니다. (None은 사용 불가 상태)"""
+        if old_key != new_key:
+            self._pending(session)["commit"].append((item_id, old_key, new_key))
+
+    def restore(self, session: Session, item_id: int, key: PoolKey) -> None:
+        """현재 트랜잭션이 롤백되면 아이템을 key로 되돌리도록 예약합니다."""
+        self._pending(session)["rollback"].append((item_id, None, key))
+
+
+class FreePoolCRUDMixin:
+    """상태 변경(save/bulk_update/claim/hard_delete)을 free_pool에 반영하는 CRUD 믹스인.
+
+    pool_item_type과 pool_group_field(그룹 없음은 None)를 지정하여 CRUDBase와 함께 상속합니다.
+    """
+    pool_item_type: int
+    pool_group_field: Optional[str] = None
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        free_pool.register(self)
+
+    def _pool_key(self, group: Optional[int]) -> PoolKey:
+        return (self.pool_item_type, group)
+
+    def _free_key(self, group: Optional[int], item_status_id: Optional[int], deleted_at: Any) -> Optional[PoolKey]:
+        """사용 가능한 상태이면 인덱스 키를, 아니면 None을 반환합니다."""
+        if item_status_id == ItemStatus.INACTIVE.ID and deleted_at is None:
+            return self._pool_key(group)
+        return None
+
+    def _group_column(self) -> Any:
+        return getattr(self.model, self.pool_group_field) if self.pool_group_field else literal(None)
+
+    def build_free_query(self) -> Any:
+        """인덱스 적재용 (ID, 그룹) 조회 쿼리를 생성합니다."""
+        return select(self.pk_column, self._group_column()).where(
+            self.model.item_status_id == ItemStatus.INACTIVE.ID,
+            self.model.deleted_at == None
+        )
+
+    def _state_keys(self, obj: Any) -> Tuple[Optional[PoolKey], Optional[PoolKey]]:
+        """저장 전/후 아이템의 인덱스 키를 반환합니다."""
+        state = inspect(obj)
+
+        def _previous(attr: Optional[str]) -> Any:
+            if attr is None:
+                return None
+            history = state.attrs[attr].load_history()
+            if history.deleted:
+                return history.deleted[0]
+            return history.unchanged[0] if history.unchanged else getattr(obj, attr)
+
+        def _current(attr: Optional[str]) -> Any:
+            return getattr(obj, attr) if attr else None
+
+        old_key = None
+        if state.persistent:
+            old_key = self._free_key(_previous(self.pool_group_field), _previous("item_status_id"), _previous("deleted_at"))
+        new_key = self._free_key(_current(self.pool_group_field), obj.item_status_id, obj.deleted_at)
+        return old_key, new_key
+
+    def save(self, session: Session, obj: Any, refresh: bool = True) -> Any:
+        """객체를 저장하고, 사용 가능 여부나 그룹이 바뀌었으면 커밋 후 인덱스에 반영합니다."""
+        old_key, new_key = self._state_keys(obj)
+        saved = super().save(session, obj, refresh=refresh)
+        free_pool.move(session, getattr(saved, self.pk_column.key), old_key, new_key)
+        return saved
+
+    def bulk_update(self, session: Session, id_values: Iterable[Any], values: Dict[str, Any], id_field: str = "id") -> int:
+        """UPDATE 한 번으로 갱신하고, 상태/그룹/삭제 여부가 바뀌면 커밋 후 인덱스에 반영합니다."""
+        id_values = set(id_values)
+        tracked = {"item_status_id", "deleted_at", self.pool_group_field} - {None}
+        if not (values.keys() & tracked) or not id_values:
+            return super().bulk_update(session, id_values, values, id_field)
+
+        # 갱신 전 (ID, 그룹, 상태)
+        rows = session.exec(
+            select(self.pk_column, self._group_column(), self.model.item_status_id)
+            .where(getattr(self.model, id_field).in_(id_values), self.model.deleted_at == None)
+        ).all()
+        updated = super().bulk_update(session, id_values, values, id_field)
+
+        for item_id, group, item_status_id in rows:
+            old_key = self._free_key(group, item_status_id, None)
+            new_key = self._free_key(
+                values.get(self.pool_group_field, group) if self.pool_group_field else None,
+                values.get("item_status_id", item_status_id),
+                values.get("deleted_at")
+            )
+            free_pool.move(session, item_id, old_key, new_key)
+        return updated
+
+    def claim(
+        self,
+        session: Session,
+        filters: Dict[str, Any],
+        values: Dict[str, Any],
+        count: int = 1,
+        id_values: Optional[Iterable[Any]] = None
+    ) -> List[Any]:
+        """인덱스에서 꺼낸 후보 ID로 먼저 선점하고, 부족하면 테이블 스캔으로 나머지를 선점합니다.
+
+        인덱스 후보는 사용 가능한(INACTIVE) 아이템을 그룹 조건으로만 찾는 경우에 사용합니다.
+        """
+        key = None
+        if (
+            id_values is None
+            and filters.get("item_status_id") == ItemStatus.INACTIVE.ID
+            and filters.keys() <= {"item_status_id", self.pool_group_field}
+        ):
+            key = self._pool_key(filters.get(self.pool_group_field))
+
+        claimed: List[Any] = []
+        if key is not None:
+            # 꺼냈지만 선점되지 않은 후보는 이미 사용 중이므로 버림
+            hints = free_pool.take(key, count)
+            if hints:
+                claimed += super().claim(session, filters, values, len(hints), hints)
+        if len(claimed) < count:
+            claimed += super().claim(session, filters, values, count - len(claimed), id_values)
+
+        for obj in claimed:
+            item_id = getattr(obj, self.pk_column.key)
+            group = getattr(obj, self.pool_group_field) if self.pool_group_field else None
+            free_pool.move(session, item_id, self._pool_key(group), self._free_key(group, obj.item_status_id, obj.deleted_at))
+            if key is not None:
+                free_pool.restore(session, item_id, key)
+        return claimed
+
+    def hard_delete(self, session: Session, id_value: Any, id_field: str = "id") -> None:
+        """객체를 영구 삭제하고 커밋 후 인덱스에서 제외합니다."""
+        obj = self.get_by_field(session, id_value, id_field)
+        super().hard_delete(session, id_value, id_field)
+        if obj is not None:
+            group = getattr(obj, self.pool_group_field) if self.pool_group_field else None
+            free_pool.move(session, getattr(obj, self.pk_column.key), self._pool_key(group), None)
+
+
+free_pool = FreePoolIndex()
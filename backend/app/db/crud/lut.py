@@ -1,34 +1,117 @@
 from sqlmodel import Session, select, SQLModel
-from typing import Optional, Type, TypeVar, Generic, List
+from types import MappingProxyType
+from typing import Optional, Type, TypeVar, Generic, List, Mapping
+import logging
 from app.db.models.lut import Role, ItemStatus, ItemType, ModuleType, MaintenanceStatus, UsageStatus, RentStatus, VideoType, PaymentStatus, PaymentMethod
+from app.utils import lut_constants
+from app.utils.lut_constants import BaseConstant
+
+logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=SQLModel)
 
 class LookUpTableCRUD(Generic[T]):
-    def __init__(self, model: Type[T], id_field: str, name_field: str):
+    def __init__(self, model: Type[T], id_field: str, name_field: str, constants: Optional[Type[BaseConstant]] = None):
         self.model = model
         self.id_field = id_field
         self.name_field = name_field
+        self.constants = constants
+        # load() 이후에는 아래 스냅샷에서 조회하며 DB를 조회하지 않음
+        self._by_id: Optional[Mapping[int, T]] = None
+        self._by_name: Optional[Mapping[str, T]] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._by_id is not None
+
+    def load(self, session: Session) -> None:
+        """테이블 전체를 읽어 세션과 분리된 읽기 전용 스냅샷으로 교체합니다."""
+        rows = [self.model(**row.dict()) for row in session.exec(select(self.model)).all()]
+        self._by_id = MappingProxyType({getattr(row, self.id_field): row for row in rows})
+        self._by_name = MappingProxyType({getattr(row, self.name_field): row for row in rows})
+
+    def clear(self) -> None:
+        """스냅샷을 제거하여 다시 DB를 조회하도록 합니다."""
+        self._by_id = None
+        self._by_name = None
+
+    def verify_constants(self) -> List[str]:
+        """스냅샷과 lut_constants의 ID/NAME 매핑이 일치하는지 확인하고 불일치 내역을 반환합니다."""
+        if self.constants is None or self._by_id is None:
+            return []
+        table = self.model.__tablename__
+        actual = {id_: getattr(row, self.name_field) for id_, row in self._by_id.items()}
+        mismatches = []
+        for id_, name in self.constants.as_dict().items():
+            if id_ not in actual:
+                mismatches.append(f"{table}: id {id_} ({name}) missing in database")
+            elif actual[id_] != name:
+                mismatches.append(f"{table}: id {id_} is '{actual[id_]}' in database but '{name}' in constants")
+        for id_ in actual.keys() - self.constants.as_dict().keys():
+            mismatches.append(f"{table}: id {id_} ({actual[id_]}) missing in constants")
+        return mismatches
         
     def get_all(self, session: Session) -> List[T]:
+        # 목록 조회 API는 항상 DB 기준으로 응답 (캐시는 ID/이름 단건 조회에만 사용)
         return list(session.exec(select(self.model)).all())
 
+    def snapshot(self, session: Session) -> Mapping[int, T]:
+        """{ID: 행} 스냅샷을 반환합니다. 적재 전이면 DB에서 조회한 결과를 반환합니다. (캐시하지 않음)"""
+        if self._by_id is not None:
+            return self._by_id
+        return MappingProxyType({getattr(row, self.id_field): row for row in self.get_all(session)})
+
     def get_by_id(self, session: Session, id: int) -> Optional[T]:
+        if self._by_id is not None:
+            return self._by_id.get(id)
         result = session.exec(select(self.model).where(getattr(self.model, self.id_field) == id)).first()
         return result
       
     def get_by_name(self, session: Session, name: str) -> Optional[T]:
+        if self._by_name is not None:
+            return self._by_name.get(name)
         result = session.exec(select(self.model).where(getattr(self.model, self.name_field) == name)).first()
         return result
 
 
-role = LookUpTableCRUD(Role, "role_id", "role_name")
-item_status = LookUpTableCRUD(ItemStatus, "item_status_id", "item_status_name")
-item_type = LookUpTableCRUD(ItemType, "item_type_id", "item_type_name")
-module_type = LookUpTableCRUD(ModuleType, "module_type_id", "module_type_name")
-maintenance_status = LookUpTableCRUD(MaintenanceStatus, "maintenance_status_id", "maintenance_status_name")
-usage_status = LookUpTableCRUD(UsageStatus, "usage_status_id", "usage_status_name") 
-rent_status = LookUpTableCRUD(RentStatus, "rent_status_id", "rent_status_name")
-video_type = LookUpTableCRUD(VideoType, "video_type_id", "video_type_name")
-payment_status = LookUpTableCRUD(PaymentStatus, "payment_status_id", "payment_status_name")
-payment_method = LookUpTableCRUD(PaymentMethod, "payment_method_id", "payment_method_name")
\ No newline at end of file
+class LookUpTableRegistry:
+    """전체 LUT 캐시를 한 번에 적재/갱신합니다. (애플리케이션 시작 시 lifespan에서 적재)"""
+    def __init__(self, tables: List[LookUpTableCRUD]):
+        self.tables = tables
+
+    def load(self, session: Session) -> List[str]:
+        """모든 LUT를 적재하고 lut_constants와의 불일치 내역을 반환합니다."""
+        for table in self.tables:
+            table.load(session)
+        mismatches = self.verify_constants()
+        for mismatch in mismatches:
+            logger.warning(f"⚠️ LUT 불일치: {mismatch}")
+        return mismatches
+
+    def refresh(self, session: Session) -> List[str]:
+        """LUT 데이터가 변경된 경우 스냅샷을 다시 적재합니다."""
+        return self.load(session)
+
+    def clear(self) -> None:
+        for table in self.tables:
+            table.clear()
+
+    def verify_constants(self) -> List[str]:
+        return [mismatch for table in self.tables for mismatch in table.verify_constants()]
+
+
+role = LookUpTableCRUD(Role, "role_id", "role_name", lut_constants.Role)
+item_status = LookUpTableCRUD(ItemStatus, "item_status_id", "item_status_name", lut_constants.ItemStatus)
+item_type = LookUpTableCRUD(ItemType, "item_type_id", "item_type_name", lut_constants.ItemType)
+module_type = LookUpTableCRUD(ModuleType, "module_type_id", "module_type_name", lut_constants.ModuleType)
+maintenance_status = LookUpTableCRUD(MaintenanceStatus, "maintenance_status_id", "maintenance_status_name", lut_constants.MaintenanceStatus)
+usage_status = LookUpTableCRUD(UsageStatus, "usage_status_id", "usage_status_name", lut_constants.UsageStatus)
+rent_status = LookUpTableCRUD(RentStatus, "rent_status_id", "rent_status_name", lut_constants.RentStatus)
+video_type = LookUpTableCRUD(VideoType, "video_type_id", "video_type_name", lut_constants.VideoType)
+payment_status = LookUpTableCRUD(PaymentStatus, "payment_status_id", "payment_status_name", lut_constants.PaymentStatus)
+payment_method = LookUpTableCRUD(PaymentMethod, "payment_method_id", "payment_method_name", lut_constants.PaymentMethod)
+
+lut_registry = LookUpTableRegistry([
+    role, item_status, item_type, module_type, maintenance_status,
+    usage_status, rent_status, video_type, payment_status, payment_method
+])
@@ -1,12 +1,35 @@
 from app.db.models.maintenance_history import MaintenanceHistory
 from app.db.crud.base import CRUDBase
+from app.db.crud.stats_rollup import maintenance_daily_stat_crud
+from sqlalchemy import inspect
 from sqlmodel import Session, select
-from typing import List
+from typing import Any, List, Optional, Tuple
 
 class MaintenanceHistoryCRUD(CRUDBase[MaintenanceHistory]):
     def __init__(self):
         super().__init__(MaintenanceHistory)
-        
+
+    @staticmethod
+    def _stat_keys(history: MaintenanceHistory) -> Tuple[Optional[tuple], tuple]:
+        """저장 전/후 정비 기록의 (예정일, 비용)을 반환합니다. (새로 생성된 경우 저장 전은 None)"""
+        state = inspect(history)
+
+        def _previous(attr: str) -> Any:
+            attr_history = state.attrs[attr].load_history()
+            if attr_history.deleted:
+                return attr_history.deleted[0]
+            return attr_history.unchanged[0] if attr_history.unchanged else getattr(history, attr)
+
+        old = (_previous("scheduled_at"), _previous("cost")) if state.persistent else None
+        return old, (history.scheduled_at, history.cost)
+
+    def save(self, session: Session, obj: MaintenanceHistory, refresh: bool = True) -> MaintenanceHistory:
+        """정비 기록을 저장하고, 예정일/비용이 바뀌었으면 일별 정비 집계를 함께 갱신합니다."""
+        old, new = self._stat_keys(obj)
+        saved = super().save(session, obj, refresh=refresh)
+        maintenance_daily_stat_crud.apply_change(session, old, new)
+        return saved
+
     def get_item_maintenance_history(self, session: Session, item_id: int, item_type_id: int) -> List[MaintenanceHistory]:
         query = (
             select(self.model)
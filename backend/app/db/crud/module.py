@@ -2,11 +2,15 @@ from sqlmodel import Session, select
 from sqlalchemy.exc import SQLAlchemyError
 from app.db.models.module import Module
 from app.db.crud.base import CRUDBase
+from app.db.crud.free_pool import FreePoolCRUDMixin
 from app.utils.exceptions import DatabaseError, NotFoundError
-from app.utils.lut_constants import ItemStatus
+from app.utils.lut_constants import ItemStatus, ItemType
 from typing import Optional
 
-class ModuleCRUD(CRUDBase[Module]):
+class ModuleCRUD(FreePoolCRUDMixin, CRUDBase[Module]):
+    pool_item_type = ItemType.MODULE.ID
+    pool_group_field = "module_type_id"
+
     def __init__(self):
         super().__init__(Module)    
     
@@ -1,7 +1,11 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from sqlmodel import Session, select
+from app.db.models.lut import ModuleType
 from app.db.models.module_set import ModuleSet
+from app.db.models.module_set_option_types import ModuleSetOptionTypes
+from app.db.models.option_type import OptionType
 from app.db.crud.base import CRUDBase
+from app.db.crud.async_base import AsyncCRUDBase
 from app.db.crud.module_set_option_type import module_set_option_type_crud
 from app.db.crud.option_type import option_type_crud
 from app.db.crud.lut import module_type as module_type_crud
@@ -42,5 +46,44 @@ class ModuleSetCRUD(CRUDBase[ModuleSet]):
         )
         
         return base_cost + option_cost
-      
+
+    def calculate_base_prices(self, session: Session, module_set_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """여러 모듈 세트의 기본 가격과 옵션 타입 구성을 한 번의 조인 쿼리로 계산합니다.
+
+        module_set ⨝ lut_module_type ⟕ module_set_option_types ⟕ option_type 결과를 모듈 세트별로 묶어
+        {module_set_id: {"module_type", "base_price", "option_types": [(option_type_id, option_type_name, quantity)]}}
+        형태로 반환합니다. 가격 계산 방식은 calculate_base_price와 동일합니다.
+        """
+        if not module_set_ids:
+            return {}
+
+        statement = (
+            select(
+                ModuleSet.module_set_id,
+                ModuleType,
+                ModuleSetOptionTypes.option_type_id,
+                ModuleSetOptionTypes.option_quantity,
+                OptionType.option_type_name,
+                OptionType.option_type_cost
+            )
+            .join(ModuleType, ModuleType.module_type_id == ModuleSet.module_type_id)
+            .outerjoin(ModuleSetOptionTypes, ModuleSetOptionTypes.module_set_id == ModuleSet.module_set_id)
+            .outerjoin(OptionType, OptionType.option_type_id == ModuleSetOptionTypes.option_type_id)
+            .where(ModuleSet.module_set_id.in_(module_set_ids))  # type: ignore[union-attr]
+        )
+
+        pricing: Dict[int, Dict[str, Any]] = {}
+        for module_set_id, module_type_info, option_type_id, quantity, option_type_name, option_type_cost in session.exec(statement).all():
+            entry = pricing.setdefault(module_set_id, {
+                "module_type": module_type_info,
+                "base_price": float(module_type_info.module_type_cost),
+                "option_types": []
+            })
+            if option_type_id is None:
+                continue
+            entry["base_price"] += float(int(option_type_cost) if option_type_cost is not None else 0) * (quantity or 1)
+            entry["option_types"].append((option_type_id, option_type_name, quantity))
+        return pricing
+
 module_set_crud = ModuleSetCRUD()
+async_module_set_crud = AsyncCRUDBase(ModuleSet)
@@ -1,16 +1,101 @@
-from sqlalchemy import func
+from collections import Counter
+from sqlalchemy import func, inspect
 from sqlmodel import Session, select
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 from app.db.models.option import Option
 from sqlalchemy.exc import SQLAlchemyError
 from app.db.crud.base import CRUDBase
+from app.db.crud.free_pool import FreePoolCRUDMixin
+from app.db.crud.option_stock import option_stock_crud, StockKey
 from app.utils.exceptions import DatabaseError, NotFoundError, ValidationError
-from app.utils.lut_constants import ItemStatus
+from app.utils.lut_constants import ItemStatus, ItemType
+
+class OptionCRUD(FreePoolCRUDMixin, CRUDBase[Option]):
+    pool_item_type = ItemType.OPTION.ID
+    pool_group_field = "option_type_id"
 
-class OptionCRUD(CRUDBase[Option]):
     def __init__(self):
         super().__init__(Option)
         
+    @staticmethod
+    def _stock_keys(option: Option) -> tuple[Optional[StockKey], Optional[StockKey]]:
+        """저장 전/후 옵션이 속한 재고 카운터 키를 반환합니다. (삭제되었거나 새로 생성된 경우 None)"""
+        state = inspect(option)
+
+        def _previous(attr: str) -> Any:
+            history = state.attrs[attr].load_history()
+            if history.deleted:
+                return history.deleted[0]
+            return history.unchanged[0] if history.unchanged else getattr(option, attr)
+
+        old_key = None
+        if state.persistent and _previous("deleted_at") is None:
+            old_key = (_previous("option_type_id"), _previous("item_status_id"))
+        new_key = (option.option_type_id, option.item_status_id) if option.deleted_at is None else None
+        return old_key, new_key
+
+    def save(self, session: Session, obj: Option, refresh: bool = True) -> Option:
+        """옵션을 저장하고, 타입/상태/삭제 여부가 바뀌었으면 재고 카운터를 함께 갱신합니다."""
+        old_key, new_key = self._stock_keys(obj)
+        saved = super().save(session, obj, refresh=refresh)
+        option_stock_crud.apply_transition(session, old_key, new_key)
+        return saved
+
+    def bulk_update(self, session: Session, id_values: Iterable[Any], values: Dict[str, Any], id_field: str = "id") -> int:
+        """옵션을 UPDATE 한 번으로 갱신하고, 타입/상태/삭제 여부가 바뀌면 재고 카운터를 (타입, 상태) 그룹 단위로 갱신합니다."""
+        id_values = set(id_values)
+        if not (values.keys() & {"option_type_id", "item_status_id", "deleted_at"}) or not id_values:
+            return super().bulk_update(session, id_values, values, id_field)
+
+        # 갱신 전 (타입, 상태)별 옵션 수
+        groups = session.exec(
+            select(self.model.option_type_id, self.model.item_status_id, func.count())
+            .where(getattr(self.model, id_field).in_(id_values), self.model.deleted_at == None)
+            .group_by(self.model.option_type_id, self.model.item_status_id)
+        ).all()
+        updated = super().bulk_update(session, id_values, values, id_field)
+
+        for option_type_id, item_status_id, count in groups:
+            new_key = None
+            if values.get("deleted_at") is None:
+                new_key = (values.get("option_type_id", option_type_id), values.get("item_status_id", item_status_id))
+            option_stock_crud.apply_transition(session, (option_type_id, item_status_id), new_key, count)
+        return updated
+
+    def claim(
+        self,
+        session: Session,
+        filters: Dict[str, Any],
+        values: Dict[str, Any],
+        count: int = 1,
+        id_values: Optional[Iterable[Any]] = None
+    ) -> List[Option]:
+        """옵션을 원자적으로 선점하고, 상태가 바뀐 만큼 재고 카운터를 (타입, 상태) 그룹 단위로 갱신합니다.
+
+        선점 전 상태는 filters의 item_status_id로 판단하므로, 상태를 바꾸는 선점은 item_status_id 조건을 포함해야 합니다.
+        """
+        if "item_status_id" in values and "item_status_id" not in filters:
+            raise DatabaseError(
+                message="Option claim requires item_status_id filter",
+                detail={"filters": filters, "values": values}
+            )
+        claimed = super().claim(session, filters, values, count, id_values)
+        transitions = Counter(
+            ((option.option_type_id, filters["item_status_id"]), (option.option_type_id, option.item_status_id))
+            for option in claimed
+            if "item_status_id" in filters
+        )
+        for (old_key, new_key), moved in transitions.items():
+            option_stock_crud.apply_transition(session, old_key, new_key, moved)
+        return claimed
+
+    def hard_delete(self, session: Session, id_value: Any, id_field: str = "id") -> None:
+        """옵션을 영구 삭제하고 재고 카운터에서 제외합니다."""
+        option = self.get_by_field(session, id_value, id_field)
+        super().hard_delete(session, id_value, id_field)
+        if option is not None:
+            option_stock_crud.apply_transition(session, (option.option_type_id, option.item_status_id), None)
+
     def get_by_id(self, session: Session, option_id: int) -> Optional[Option]:
         """주어진 ID에 해당하는 옵션을 조회합니다"""
         option = self.get_by_field(session, option_id, "option_id")
@@ -0,0 +1,86 @@
+from sqlmodel import Session, select, delete, func
+from typing import Dict, List, Optional, Tuple
+from app.db.models.option import Option
+from app.db.models.option_stock import OptionStock
+from app.core.catalog_version import Catalog, catalog_versions
+from app.db.crud.base import CRUDBase
+from app.utils.lut_constants import ItemStatus
+
+# (option_type_id, item_status_id)
+StockKey = Tuple[int, int]
+
+class OptionStockCRUD(CRUDBase[OptionStock]):
+    """옵션 타입/상태별 재고 카운터.
+
+    option 테이블의 item_status_id, option_type_id, deleted_at이 바뀔 때마다 같은 트랜잭션 안에서 갱신되며,
+    카탈로그는 option 행을 세지 않고 이 테이블을 기본 키로 조회합니다.
+    """
+    def __init__(self):
+        super().__init__(OptionStock)
+
+    def adjust(self, session: Session, option_type_id: int, item_status_id: int, delta: int) -> None:
+        """카운터를 delta만큼 증감합니다. 행이 없으면 새로 생성합니다.
+
+        사용자 카탈로그에 노출되는 재고(INACTIVE)가 바뀌면 커밋 시 옵션 타입 카탈로그 version을 올립니다.
+        """
+        if delta == 0:
+            return
+        if item_status_id == ItemStatus.INACTIVE.ID:
+            catalog_versions.bump_on_commit(session, Catalog.OPTION_TYPES)
+        # 같은 키의 첫 쓰기가 동시에 일어나도 기본 키 충돌이 없도록 upsert로 처리
+        self.increment_counter(
+            session,
+            {"option_type_id": option_type_id, "item_status_id": item_status_id},
+            {"quantity": delta}
+        )
+
+    def apply_transition(
+        self,
+        session: Session,
+        old_key: Optional[StockKey],
+        new_key: Optional[StockKey],
+        count: int = 1
+    ) -> None:
+        """옵션이 old_key에서 new_key로 이동한 만큼 카운터를 갱신합니다. (None은 재고에서 제외된 상태)"""
+        if old_key == new_key:
+            return
+        if old_key is not None:
+            self.adjust(session, *old_key, -count)
+        if new_key is not None:
+            self.adjust(session, *new_key, count)
+
+    def get_quantities(
+        self,
+        session: Session,
+        option_type_ids: List[int],
+        item_status_id: int = ItemStatus.INACTIVE.ID
+    ) -> Dict[int, int]:
+        """여러 옵션 타입의 재고 수량을 한 번에 조회합니다. 카운터가 없는 타입은 0으로 반환합니다."""
+        quantities = {option_type_id: 0 for option_type_id in option_type_ids}
+        if not option_type_ids:
+            return quantities
+        rows = session.exec(
+            select(OptionStock.option_type_id, OptionStock.quantity)
+            .where(
+                OptionStock.option_type_id.in_(option_type_ids),  # type: ignore[attr-defined]
+                OptionStock.item_status_id == item_status_id
+            )
+        ).all()
+        quantities.update({option_type_id: quantity for option_type_id, quantity in rows})
+        return quantities
+
+    def rebuild(self, session: Session) -> None:
+        """option 테이블을 GROUP BY 집계하여 카운터 전체를 다시 계산합니다."""
+        session.execute(delete(OptionStock))
+        rows = session.exec(
+            select(Option.option_type_id, Option.item_status_id, func.count())
+            .where(Option.deleted_at == None)
+            .group_by(Option.option_type_id, Option.item_status_id)
+        ).all()
+        session.add_all([
+            OptionStock(option_type_id=option_type_id, item_status_id=item_status_id, quantity=quantity)
+            for option_type_id, item_status_id, quantity in rows
+        ])
+        session.flush()
+
+option_stock_crud = OptionStockCRUD()
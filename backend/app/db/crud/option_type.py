@@ -1,12 +1,79 @@
 from sqlmodel import Session, select
+from app.core.catalog_version import Catalog, catalog_versions
 from app.db.models.option_type import OptionType
 from app.db.crud.base import CRUDBase
-from typing import Optional
+from app.db.crud.async_base import AsyncCRUDBase
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Optional, Tuple
+import threading
+
+
+class OptionTypeCatalogEntry(NamedTuple):
+    option_type_name: str
+    option_type_cost: float
+    option_type_size: str
+
+
+class OptionTypeCatalog:
+    """옵션 타입 id → (이름, 비용, 크기) 인메모리 카탈로그.
+
+    version은 catalog_versions의 옵션 타입 카탈로그(Catalog.OPTION_TYPES) version을 그대로 사용합니다.
+    관리자 옵션 타입 변경이 커밋되어 version이 바뀌면 스냅샷이 오래된 것으로 간주되어
+    다음 조회 시 한 번의 쿼리로 다시 적재됩니다. 이후 조회는 SQL 없이 처리됩니다.
+    """
+    def __init__(self):
+        # (적재 시점 version, 스냅샷)
+        self._snapshot: Optional[Tuple[int, Mapping[int, OptionTypeCatalogEntry]]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> int:
+        return catalog_versions.version(Catalog.OPTION_TYPES)
+
+    def _current(self) -> Optional[Mapping[int, OptionTypeCatalogEntry]]:
+        """현재 version의 스냅샷을 반환합니다. (없거나 오래되었으면 None)"""
+        snapshot = self._snapshot
+        if snapshot is None or snapshot[0] != self.version:
+            return None
+        return snapshot[1]
+
+    def _load(self, session: Session) -> Mapping[int, OptionTypeCatalogEntry]:
+        version = self.version
+        rows = session.exec(
+            select(
+                OptionType.option_type_id,
+                OptionType.option_type_name,
+                OptionType.option_type_cost,
+                OptionType.option_type_size
+            )
+        ).all()
+        entries = MappingProxyType({
+            option_type_id: OptionTypeCatalogEntry(name, cost, size)
+            for option_type_id, name, cost, size in rows
+        })
+        with self._lock:
+            # 적재 중 version이 바뀌었다면 이미 오래된 데이터이므로 저장하지 않음
+            if self.version == version:
+                self._snapshot = (version, entries)
+        return entries
+
+    def get(self, session: Session, option_type_id: int) -> Optional[OptionTypeCatalogEntry]:
+        """옵션 타입 정보를 조회합니다. 현재 스냅샷에 없는 ID는 None을 반환합니다."""
+        entries = self._current()
+        if entries is None:
+            entries = self._load(session)
+        return entries.get(option_type_id)
+
+    def snapshot(self, session: Session) -> Mapping[int, OptionTypeCatalogEntry]:
+        """전체 카탈로그 스냅샷을 반환합니다. (적재되지 않았거나 오래되었으면 적재)"""
+        entries = self._current()
+        return entries if entries is not None else self._load(session)
 
 
 class OptionTypeCRUD(CRUDBase[OptionType]):
     def __init__(self):
         super().__init__(OptionType)
+        self.catalog = OptionTypeCatalog()
         
     def get_by_id(self, session: Session, option_type_id: int) -> Optional[OptionType]:
         """옵션 타입 ID에 해당하는 옵션 타입을 조회합니다."""
@@ -14,15 +81,16 @@ class OptionTypeCRUD(CRUDBase[OptionType]):
         return option_type 
 
     def get_option_name_by_id(self, session: Session, option_type_id: int) -> Optional[str]:
-        """옵션 타입 ID에 해당하는 옵션 이름을 조회합니다.""" 
-        option = session.exec(select(OptionType).where(OptionType.option_type_id == option_type_id)).first()
-        return option.option_type_name if option else None
+        """옵션 타입 ID에 해당하는 옵션 이름을 조회합니다. (카탈로그 사용)""" 
+        entry = self.catalog.get(session, option_type_id)
+        return entry.option_type_name if entry else None
 
 
     def get_option_cost_by_id(self, session: Session, option_type_id: int) -> Optional[int]:
-        """옵션 타입 ID에 해당하는 옵션 비용을 조회합니다."""
-        option = session.exec(select(OptionType).where(OptionType.option_type_id == option_type_id)).first()
-        return int(option.option_type_cost) if option else None
+        """옵션 타입 ID에 해당하는 옵션 비용을 조회합니다. (카탈로그 사용)"""
+        entry = self.catalog.get(session, option_type_id)
+        return int(entry.option_type_cost) if entry else None
 
 
 option_type_crud = OptionTypeCRUD()
+async_option_type_crud = AsyncCRUDBase(OptionType)
@@ -2,6 +2,7 @@ from typing import Any, Dict, Optional, List
 from sqlmodel import Session, select
 from app.db.models.rent_history import RentHistory
 from app.db.crud.base import CRUDBase
+from app.db.crud.async_base import AsyncCRUDBase
 
 class RentHistoryCRUD(CRUDBase[RentHistory]):
     def __init__(self):
@@ -23,4 +24,5 @@ class RentHistoryCRUD(CRUDBase[RentHistory]):
     def get_by_id(self, session: Session, rent_id: int) -> Optional[RentHistory]:
         return self.get_by_field(session, rent_id, "rent_id")
 
-rent_history_crud = RentHistoryCRUD()
\ No newline at end of file
+rent_history_crud = RentHistoryCRUD()
+async_rent_history_crud = AsyncCRUDBase(RentHistory)
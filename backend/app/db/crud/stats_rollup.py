@@ -0,0 +1,151 @@
+from collections import defaultdict
+from datetime import date, datetime
+from sqlmodel import Session, select, delete
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from app.db.models.maintenance_history import MaintenanceHistory
+from app.db.models.maintenance_daily_stat import MaintenanceDailyStat
+from app.db.models.module import Module
+from app.db.models.option import Option
+from app.db.models.option_usage_daily_stat import OptionUsageDailyStat
+from app.db.models.rent_daily_stat import RentDailyStat
+from app.db.models.rent_history import RentHistory
+from app.db.models.usage_history import UsageHistory
+from app.db.crud.base import CRUDBase, T
+from app.utils.lut_constants import ItemType
+
+# 모듈 사용 기록이 없는 렌트의 module_type_id
+UNKNOWN_MODULE_TYPE_ID = 0
+
+
+class RollupCRUD(CRUDBase[T]):
+    """일별 집계 테이블 공통 CRUD.
+
+    원본 테이블에 쓰는 트랜잭션 안에서 해당 날짜 행의 카운터를 증감하고,
+    rebuild()는 원본 테이블 전체를 다시 집계합니다. (통계 API는 집계 테이블만 조회)
+    """
+    def increment(self, session: Session, key: Dict[str, Any], deltas: Dict[str, Any]) -> None:
+        """key 행의 카운터를 deltas만큼 증감합니다. 행이 없으면 새로 생성합니다. (동시 첫 쓰기도 upsert로 처리)"""
+        if not any(deltas.values()):
+            return
+        self.increment_counter(session, key, deltas)
+
+    def replace_all(self, session: Session, rows: Iterable[Dict[str, Any]]) -> None:
+        """집계 테이블 전체를 rows로 교체합니다."""
+        session.execute(delete(self.model))
+        session.add_all([self.model(**row) for row in rows])
+        session.flush()
+
+
+class RentDailyStatCRUD(RollupCRUD[RentDailyStat]):
+    def __init__(self):
+        super().__init__(RentDailyStat)
+
+    def record(self, session: Session, rent: RentHistory, module_type_id: int) -> None:
+        """새 렌트를 대여 시작일/모듈 타입별 건수와 매출에 반영합니다."""
+        if rent.rent_start_date is None:
+            return
+        self.increment(
+            session,
+            {"stat_date": rent.rent_start_date.date(), "module_type_id": module_type_id},
+            {"rent_count": 1, "revenue": rent.cost}
+        )
+
+    def rebuild(self, session: Session) -> None:
+        """rent_history를 대여 시작일/모듈 타입별로 다시 집계합니다."""
+        rows = session.exec(
+            select(RentHistory.rent_start_date, RentHistory.cost, Module.module_type_id)
+            .outerjoin(
+                UsageHistory,
+                (UsageHistory.rent_id == RentHistory.rent_id) & (UsageHistory.item_type_id == ItemType.MODULE.ID)
+            )
+            .outerjoin(Module, Module.module_id == UsageHistory.item_id)
+            .where(RentHistory.rent_start_date != None)
+        ).all()
+        totals: Dict[Tuple[date, int], List[float]] = defaultdict(lambda: [0, 0.0])
+        for rent_start_date, cost, module_type_id in rows:
+            total = totals[(rent_start_date.date(), module_type_id or UNKNOWN_MODULE_TYPE_ID)]
+            total[0] += 1
+            total[1] += cost
+        self.replace_all(session, [
+            {"stat_date": stat_date, "module_type_id": module_type_id, "rent_count": count, "revenue": revenue}
+            for (stat_date, module_type_id), (count, revenue) in totals.items()
+        ])
+
+
+class MaintenanceDailyStatCRUD(RollupCRUD[MaintenanceDailyStat]):
+    def __init__(self):
+        super().__init__(MaintenanceDailyStat)
+
+    def apply_change(
+        self,
+        session: Session,
+        old: Optional[Tuple[Optional[datetime], float]],
+        new: Optional[Tuple[Optional[datetime], float]]
+    ) -> None:
+        """정비 기록의 (예정일, 비용)이 old에서 new로 바뀐 만큼 반영합니다. (None은 기록 없음)"""
+        if old == new:
+            return
+        if old is not None and old[0] is not None:
+            self.increment(session, {"stat_date": old[0].date()}, {"maintenance_count": -1, "cost": -old[1]})
+        if new is not None and new[0] is not None:
+            self.increment(session, {"stat_date": new[0].date()}, {"maintenance_count": 1, "cost": new[1]})
+
+    def rebuild(self, session: Session) -> None:
+        """maintenance_history를 정비 예정일별로 다시 집계합니다."""
+        rows = session.exec(
+            select(MaintenanceHistory.scheduled_at, MaintenanceHistory.cost)
+            .where(MaintenanceHistory.scheduled_at != None)
+        ).all()
+        totals: Dict[date, List[float]] = defaultdict(lambda: [0, 0.0])
+        for scheduled_at, cost in rows:
+            total = totals[scheduled_at.date()]
+            total[0] += 1
+            total[1] += cost
+        self.replace_all(session, [
+            {"stat_date": stat_date, "maintenance_count": count, "cost": cost}
+            for stat_date, (count, cost) in totals.items()
+        ])
+
+
+class OptionUsageDailyStatCRUD(RollupCRUD[OptionUsageDailyStat]):
+    def __init__(self):
+        super().__init__(OptionUsageDailyStat)
+
+    def record(self, session: Session, used_at: datetime, options: Iterable[Option]) -> None:
+        """렌트된 옵션을 사용일/옵션 타입별 건수에 반영합니다. (옵션 타입당 UPDATE 한 번)"""
+        counts: Dict[int, int] = defaultdict(int)
+        for option in options:
+            counts[option.option_type_id] += 1
+        for option_type_id, count in counts.items():
+            self.increment(
+                session,
+                {"stat_date": used_at.date(), "option_type_id": option_type_id},
+                {"usage_count": count}
+            )
+
+    def rebuild(self, session: Session) -> None:
+        """usage_history의 옵션 사용 기록을 사용일/옵션 타입별로 다시 집계합니다."""
+        rows = session.exec(
+            select(UsageHistory.created_at, Option.option_type_id)
+            .join(Option, Option.option_id == UsageHistory.item_id)
+            .where(UsageHistory.item_type_id == ItemType.OPTION.ID)
+        ).all()
+        totals: Dict[Tuple[date, int], int] = defaultdict(int)
+        for created_at, option_type_id in rows:
+            totals[(created_at.date(), option_type_id)] += 1
+        self.replace_all(session, [
+            {"stat_date": stat_date, "option_type_id": option_type_id, "usage_count": count}
+            for (stat_date, option_type_id), count in totals.items()
+        ])
+
+
+rent_daily_stat_crud = RentDailyStatCRUD()
+maintenance_daily_stat_crud = MaintenanceDailyStatCRUD()
+option_usage_daily_stat_crud = OptionUsageDailyStatCRUD()
+
+
+def rebuild_rollups(session: Session) -> None:
+    """모든 일별 집계 테이블을 원본 테이블 기준으로 다시 계산합니다. (기존 데이터 백필)"""
+    rent_daily_stat_crud.rebuild(session)
+    maintenance_daily_stat_crud.rebuild(session)
+    option_usage_daily_stat_crud.rebuild(session)
@@ -1,4 +1,4 @@
-from sqlmodel import Session, select, update
+from sqlmodel import Session, insert, select, update
 from app.db.models.usage_history import UsageHistory
 from app.db.crud.base import CRUDBase
 from sqlalchemy.exc import SQLAlchemyError
@@ -80,6 +80,25 @@ class UsageHistoryCRUD(CRUDBase[UsageHistory]):
 
         return list(usage_entries)
 
+    def get_usage_entries_by_rent_ids(
+        self,
+        session: Session,
+        rent_ids: List[int]
+    ) -> Dict[int, List[UsageHistory]]:
+        """여러 렌트의 사용 기록을 한 번에 조회하여 rent_id별로 묶어 반환합니다."""
+        entries_by_rent: Dict[int, List[UsageHistory]] = {rent_id: [] for rent_id in rent_ids}
+        if not rent_ids:
+            return entries_by_rent
+
+        usage_entries = session.exec(
+            select(UsageHistory)
+            .where(UsageHistory.rent_id.in_(rent_ids))  # type: ignore[attr-defined]
+        ).all()
+
+        for entry in usage_entries:
+            entries_by_rent[entry.rent_id].append(entry)
+        return entries_by_rent
+
     def create_usage_entries(
         self,
         session: Session,
@@ -114,17 +133,13 @@ class UsageHistoryCRUD(CRUDBase[UsageHistory]):
 
             # 사용 기록 생성
             items = [(ItemType.VEHICLE.ID, vehicle_id), (ItemType.MODULE.ID, module_id)] + [(ItemType.OPTION.ID, oid) for oid in option_ids]
-            usage_entries = [
-                UsageHistory(rent_id=rent_id, item_id=item, item_type_id=item_type, usage_status_id=UsageStatus.IN_USE.ID)
+            rows = [
+                {"rent_id": rent_id, "item_id": item, "item_type_id": item_type, "usage_status_id": UsageStatus.IN_USE.ID}
                 for item_type, item in items if item > 0
             ]
 
-
-            # DB에 일괄 저장
-            session.add_all(usage_entries)
-            session.flush()
-
-            return usage_entries
+            # DB에 일괄 저장 (INSERT ... RETURNING 한 번으로 생성된 ID와 created_at까지 조회, 반환 순서는 보장하지 않음)
+            return list(session.scalars(insert(UsageHistory).returning(UsageHistory), rows).all())
 
         except SQLAlchemyError as e:
             raise DatabaseError(
@@ -177,6 +192,31 @@ class UsageHistoryCRUD(CRUDBase[UsageHistory]):
                 }
             )
 
+    def update_status_by_rent_id(
+        self,
+        session: Session,
+        rent_id: int,
+        usage_status_id: int
+    ) -> int:
+        """렌트의 모든 사용 기록 상태를 UPDATE 한 번으로 변경하고 변경된 행 수를 반환합니다."""
+        try:
+            result = session.execute(
+                update(UsageHistory)
+                .where(UsageHistory.rent_id == rent_id)
+                .values(usage_status_id=usage_status_id)
+                .execution_options(synchronize_session="evaluate")
+            )
+            return result.rowcount
+        except SQLAlchemyError as e:
+            raise DatabaseError(
+                message="Failed to update usage entries status",
+                detail={
+                    "error": str(e),
+                    "rent_id": rent_id,
+                    "usage_status_id": usage_status_id
+                }
+            )
+
     def exists_item_usage_history(
         self, session: Session, item_id: int, item_type: int, usage_status: int
     ) -> bool:
@@ -4,10 +4,13 @@ from typing import List, Optional
 from sqlalchemy.exc import SQLAlchemyError
 from app.db.models.vehicle import Vehicle
 from app.db.crud.base import CRUDBase
+from app.db.crud.free_pool import FreePoolCRUDMixin
 from app.utils.exceptions import DatabaseError, NotFoundError
-from app.utils.lut_constants import ItemStatus
+from app.utils.lut_constants import ItemStatus, ItemType
+
+class VehicleCRUD(FreePoolCRUDMixin, CRUDBase[Vehicle]):
+    pool_item_type = ItemType.VEHICLE.ID
 
-class VehicleCRUD(CRUDBase[Vehicle]):
     def __init__(self):
         super().__init__(Vehicle)
 
@@ -0,0 +1,129 @@
+"""버전 기반 스키마 마이그레이션.
+
+create_all은 새 테이블만 생성하므로, 기존 DB 파일에 인덱스 등 스키마 변경을 적용할 때 사용합니다.
+적용된 버전은 schema_migrations 테이블에 기록되며 아직 적용되지 않은 버전만 순서대로 실행됩니다.
+
+    python -m app.db.migrations          # 미적용 마이그레이션 실행
+    python -m app.db.migrations --check  # 누락된 인덱스 확인
+    python -m app.db.migrations --rebuild-rollups  # 일별 통계 집계 테이블 재계산
+"""
+from dataclasses import dataclass
+from typing import Callable, List, Tuple
+import logging
+import sys
+from sqlalchemy import Index, inspect
+from sqlalchemy.engine import Connection, Engine
+from sqlmodel import Session, SQLModel, select
+from app.db.models import (
+    MaintenanceDailyStat, Option, OptionUsageDailyStat, RentDailyStat, RentHistory, SchemaMigration,
+    UsageHistory, Vehicle
+)
+
+logger = logging.getLogger(__name__)
+
+
+# 조회 조건에 자주 사용되는 컬럼 조합 인덱스
+HOT_PATH_INDEXES: List[Index] = [
+    Index("ix_usage_history_rent_id", UsageHistory.rent_id),
+    Index("ix_usage_history_item_status", UsageHistory.item_id, UsageHistory.item_type_id, UsageHistory.usage_status_id),
+    Index("ix_option_type_status", Option.option_type_id, Option.item_status_id, Option.deleted_at),
+    Index("ix_vehicle_status", Vehicle.item_status_id, Vehicle.deleted_at),
+    Index("ix_rent_history_user_status", RentHistory.user_pk, RentHistory.rent_status_id),
+    Index("ix_rent_history_status_created", RentHistory.rent_status_id, RentHistory.created_at),
+]
+
+
+def _create_indexes(indexes: List[Index]) -> Callable[[Connection], None]:
+    def _upgrade(connection: Connection) -> None:
+        for index in indexes:
+            index.create(bind=connection, checkfirst=True)
+    return _upgrade
+
+
+def _create_rollup_tables(connection: Connection) -> None:
+    """일별 통계 집계 테이블을 생성하고 기존 렌트/정비/사용 기록으로 채웁니다."""
+    from app.db.crud.stats_rollup import rebuild_rollups
+
+    SQLModel.metadata.create_all(
+        bind=connection,
+        tables=[RentDailyStat.__table__, MaintenanceDailyStat.__table__, OptionUsageDailyStat.__table__],  # type: ignore[attr-defined]
+        checkfirst=True
+    )
+    with Session(bind=connection) as session:
+        rebuild_rollups(session)
+        session.flush()
+
+
+def _create_search_indexes(connection: Connection) -> None:
+    """목록 검색용 전문 검색 인덱스(SQLite FTS5 / PostgreSQL pg_trgm)를 생성하고 기존 행을 색인합니다."""
+    from app.db.search_index import create_search_indexes
+
+    create_search_indexes(connection)
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    upgrade: Callable[[Connection], None]
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "add_hot_path_indexes", _create_indexes(HOT_PATH_INDEXES)),
+    Migration(2, "add_stats_rollup_tables", _create_rollup_tables),
+    Migration(3, "add_search_indexes", _create_search_indexes),
+]
+
+
+def run_migrations(engine: Engine) -> List[int]:
+    """미적용 마이그레이션을 버전 순으로 각각 별도 트랜잭션에서 실행하고, 적용한 버전 목록을 반환합니다."""
+    SchemaMigration.__table__.create(bind=engine, checkfirst=True)  # type: ignore[attr-defined]
+    with engine.connect() as connection:
+        applied = set(connection.execute(select(SchemaMigration.version)).scalars().all())
+
+    newly_applied = []
+    for migration in sorted(MIGRATIONS, key=lambda m: m.version):
+        if migration.version in applied:
+            continue
+        logger.info(f"🔹 마이그레이션 적용 중: {migration.version} {migration.name}")
+        with engine.begin() as connection:
+            migration.upgrade(connection)
+            connection.execute(
+                SchemaMigration.__table__.insert().values(version=migration.version, name=migration.name)  # type: ignore[attr-defined]
+            )
+        newly_applied.append(migration.version)
+    return newly_applied
+
+
+def find_missing_indexes(engine: Engine) -> List[Tuple[str, str]]:
+    """HOT_PATH_INDEXES 중 DB에 존재하지 않는 (테이블, 인덱스) 목록을 반환합니다."""
+    inspector = inspect(engine)
+    missing = []
+    for index in HOT_PATH_INDEXES:
+        table_name = index.table.name  # type: ignore[union-attr]
+        existing = {idx["name"] for idx in inspector.get_indexes(table_name)}
+        if index.name not in existing:
+            missing.append((table_name, str(index.name)))
+    return missing
+
+
+if __name__ == "__main__":
+    from app.core.database import engine
+
+    if "--check" in sys.argv:
+        missing_indexes = find_missing_indexes(engine)
+        for table_name, index_name in missing_indexes:
+            print(f"❌ missing index {index_name} on {table_name}")
+        sys.exit(1 if missing_indexes else 0)
+
+    if "--rebuild-rollups" in sys.argv:
+        from app.db.crud.stats_rollup import rebuild_rollups
+
+        with Session(engine) as session:
+            rebuild_rollups(session)
+            session.commit()
+        print("✅ rebuilt stats rollup tables")
+        sys.exit(0)
+
+    versions = run_migrations(engine)
+    print(f"✅ applied migrations: {versions or 'none'}")
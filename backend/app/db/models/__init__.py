@@ -9,12 +9,17 @@ from .module import Module
 from .module_set import ModuleSet
 from .option import Option
 from .option_type import OptionType
+from .option_stock import OptionStock
 from .module_set_option_types import ModuleSetOptionTypes
 from .usage_history import UsageHistory
 from .maintenance_history import MaintenanceHistory
 from .rent_history import RentHistory
 from .video_storage import VideoStorage
 from .payment import Payment
+from .schema_migration import SchemaMigration
+from .rent_daily_stat import RentDailyStat
+from .maintenance_daily_stat import MaintenanceDailyStat
+from .option_usage_daily_stat import OptionUsageDailyStat
 
 __all__ = [
     # Look-up Tables
@@ -29,10 +34,17 @@ __all__ = [
     "ModuleSet",
     "Option",
     "OptionType",
+    "OptionStock",
     "ModuleSetOptionTypes",
     "MaintenanceHistory",
     "UsageHistory",
     "RentHistory",
     "VideoStorage",
-    "Payment"
+    "Payment",
+    "SchemaMigration",
+
+    # Rollups
+    "RentDailyStat",
+    "MaintenanceDailyStat",
+    "OptionUsageDailyStat"
 ]
\ No newline at end of file
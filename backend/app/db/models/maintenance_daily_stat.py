@@ -0,0 +1,9 @@
+from sqlmodel import SQLModel, Field
+from datetime import date
+
+class MaintenanceDailyStat(SQLModel, table=True):
+    __tablename__ = "maintenance_daily_stat"
+
+    stat_date: date = Field(primary_key=True, description="Scheduled maintenance date")
+    maintenance_count: int = Field(default=0, nullable=False, description="Number of maintenance records")
+    cost: float = Field(default=0, nullable=False, description="Sum of maintenance cost")
@@ -31,3 +31,5 @@ class MaintenanceHistory(SQLModel, table=True):
     deleted_at: Optional[datetime] = Field(
         sa_column=Column(DateTime, nullable=True)
     )
+
+    __mapper_args__ = {"eager_defaults": True}
@@ -27,3 +27,5 @@ class ModuleSet(SQLModel, table=True):
     deleted_at: Optional[datetime] = Field(
         sa_column=Column(DateTime, nullable=True)
     )
+
+    __mapper_args__ = {"eager_defaults": True}
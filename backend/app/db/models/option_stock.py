@@ -0,0 +1,8 @@
+from sqlmodel import SQLModel, Field
+
+class OptionStock(SQLModel, table=True):
+    __tablename__ = "option_stock"
+
+    option_type_id: int = Field(foreign_key="option_type.option_type_id", primary_key=True, nullable=False, description="Option Type ID")
+    item_status_id: int = Field(foreign_key="lut_item_status.item_status_id", primary_key=True, nullable=False, description="Option status")
+    quantity: int = Field(default=0, nullable=False, description="Number of non-deleted options in this type and status")
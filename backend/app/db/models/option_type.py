@@ -28,3 +28,5 @@ class OptionType(SQLModel, table=True):
     deleted_at: Optional[datetime] = Field(
         sa_column=Column(DateTime, nullable=True), description="Soft delete timestamp"
     )
+
+    __mapper_args__ = {"eager_defaults": True}
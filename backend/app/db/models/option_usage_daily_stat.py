@@ -0,0 +1,9 @@
+from sqlmodel import SQLModel, Field
+from datetime import date
+
+class OptionUsageDailyStat(SQLModel, table=True):
+    __tablename__ = "option_usage_daily_stat"
+
+    stat_date: date = Field(primary_key=True, description="Usage date")
+    option_type_id: int = Field(foreign_key="option_type.option_type_id", primary_key=True, description="Option Type ID")
+    usage_count: int = Field(default=0, nullable=False, description="Number of rented options of this type")
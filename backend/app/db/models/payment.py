@@ -19,3 +19,5 @@ class Payment(SQLModel, table=True):
     updated_at: datetime = Field(
         sa_column=Column(DateTime, nullable=False, server_default=text("CURRENT_TIMESTAMP"), onupdate=datetime.now)
     )
+
+    __mapper_args__ = {"eager_defaults": True}
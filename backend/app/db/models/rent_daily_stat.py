@@ -0,0 +1,11 @@
+from sqlmodel import SQLModel, Field
+from datetime import date
+
+class RentDailyStat(SQLModel, table=True):
+    __tablename__ = "rent_daily_stat"
+
+    stat_date: date = Field(primary_key=True, description="Rental start date")
+    # 모듈 사용 기록이 없는 렌트는 0으로 집계
+    module_type_id: int = Field(primary_key=True, description="Module type of the rented module (0 if unknown)")
+    rent_count: int = Field(default=0, nullable=False, description="Number of rents started on this date")
+    revenue: float = Field(default=0, nullable=False, description="Sum of rent cost")
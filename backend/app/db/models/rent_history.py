@@ -26,3 +26,5 @@ class RentHistory(SQLModel, table=True):
     updated_at: datetime = Field(
         sa_column=Column(DateTime, nullable=False, server_default=text("CURRENT_TIMESTAMP"), onupdate=datetime.now)
     )
+
+    __mapper_args__ = {"eager_defaults": True}
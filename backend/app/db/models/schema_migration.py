@@ -0,0 +1,12 @@
+from sqlalchemy import text
+from sqlmodel import SQLModel, Field, Column, DateTime
+from datetime import datetime
+
+class SchemaMigration(SQLModel, table=True):
+    __tablename__ = "schema_migrations"
+
+    version: int = Field(primary_key=True, description="Migration version")
+    name: str = Field(nullable=False, max_length=255, description="Migration name")
+    applied_at: datetime = Field(
+        sa_column=Column(DateTime, nullable=False, server_default=text("CURRENT_TIMESTAMP"))
+    )
@@ -18,4 +18,6 @@ class UsageHistory(SQLModel, table=True):
     )
     updated_at: datetime = Field(
         sa_column=Column(DateTime, nullable=False, server_default=text("CURRENT_TIMESTAMP"), onupdate=datetime.now())
-    )
\ No newline at end of file
+    )
+
+    __mapper_args__ = {"eager_defaults": True}
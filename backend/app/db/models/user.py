@@ -38,6 +38,7 @@ class User(SQLModel, table=True):
     )
 
     __table_args__ = {"sqlite_autoincrement": True}
+    __mapper_args__ = {"eager_defaults": True}
 
 
 # ✅ 자동으로 created_by를 user_pk로 설정하는 이벤트 핸들러
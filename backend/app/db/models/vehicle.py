@@ -37,3 +37,4 @@ class Vehicle(SQLModel, table=True):
     )
 
     __table_args__ = {"sqlite_autoincrement": True}
+    __mapper_args__ = {"eager_defaults": True}
@@ -16,3 +16,5 @@ class VideoStorage(SQLModel, table=True):
     created_at: datetime = Field(
         sa_column=Column(DateTime, nullable=False, server_default=text("CURRENT_TIMESTAMP"))
     )
+
+    __mapper_args__ = {"eager_defaults": True}
@@ -0,0 +1,134 @@
+"""목록 검색용 전문 검색(full-text search) 인덱스.
+
+CRUDBase.get_list(search=...)는 아래 SEARCH_INDEXES에 등록된 컬럼을 인덱스로 검색합니다.
+
+- SQLite: FTS5 trigram 외부 콘텐츠 테이블(<table>_fts)을 트리거로 원본 테이블과 동기화하고,
+  MATCH 결과를 bm25 관련도(rank) 순으로 정렬합니다.
+- PostgreSQL: pg_trgm GIN 인덱스로 ILIKE '%검색어%'를 인덱스 조회하고, similarity() 순으로 정렬합니다.
+
+trigram은 3글자 이상이어야 인덱스를 사용할 수 있으므로 짧은 검색어와 인덱스가 없는 컬럼은 기존 ILIKE 검색으로 처리합니다.
+인덱스 테이블/트리거는 원본 테이블 생성(create_all) 시 함께 만들어지며, 기존 DB는 마이그레이션으로 생성 후 재색인합니다.
+"""
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence, Tuple, Type
+from sqlalchemy import DDL, column, event, func, or_, table
+from sqlalchemy.engine import Connection
+from sqlmodel import SQLModel
+from app.db.models import ModuleSet, Module, OptionType, User, Vehicle
+
+# trigram 토크나이저가 인덱스를 사용할 수 있는 최소 검색어 길이
+MIN_TRIGRAM_LENGTH = 3
+
+
+@dataclass(frozen=True)
+class SearchIndex:
+    model: Type[SQLModel]
+    columns: Tuple[str, ...]
+
+    @property
+    def table_name(self) -> str:
+        return self.model.__tablename__  # type: ignore[return-value]
+
+    @property
+    def name(self) -> str:
+        return f"{self.table_name}_fts"
+
+    @property
+    def pk_name(self) -> str:
+        return list(self.model.__table__.primary_key.columns)[0].name  # type: ignore[attr-defined]
+
+    def sqlite_ddl(self) -> List[str]:
+        """FTS5 외부 콘텐츠 테이블과 동기화 트리거 생성 문 (검색 컬럼이 바뀔 때만 색인 갱신)"""
+        columns = ", ".join(self.columns)
+        new_values = ", ".join(f"new.{c}" for c in self.columns)
+        old_values = ", ".join(f"old.{c}" for c in self.columns)
+        insert_new = f"INSERT INTO {self.name}(rowid, {columns}) VALUES (new.{self.pk_name}, {new_values});"
+        delete_old = (
+            f"INSERT INTO {self.name}({self.name}, rowid, {columns}) "
+            f"VALUES ('delete', old.{self.pk_name}, {old_values});"
+        )
+        return [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.name} USING fts5("
+            f"{columns}, content='{self.table_name}', content_rowid='{self.pk_name}', tokenize='trigram')",
+            f"CREATE TRIGGER IF NOT EXISTS {self.name}_ai AFTER INSERT ON {self.table_name} BEGIN {insert_new} END",
+            f"CREATE TRIGGER IF NOT EXISTS {self.name}_ad AFTER DELETE ON {self.table_name} BEGIN {delete_old} END",
+            f"CREATE TRIGGER IF NOT EXISTS {self.name}_au AFTER UPDATE OF {columns} ON {self.table_name} "
+            f"BEGIN {delete_old} {insert_new} END",
+        ]
+
+    def postgresql_ddl(self) -> List[str]:
+        """pg_trgm GIN 인덱스 생성 문"""
+        return ["CREATE EXTENSION IF NOT EXISTS pg_trgm"] + [
+            f"CREATE INDEX IF NOT EXISTS ix_{self.table_name}_{c}_trgm ON {self.table_name} USING gin ({c} gin_trgm_ops)"
+            for c in self.columns
+        ]
+
+    def ddl(self, dialect: str) -> List[str]:
+        if dialect == "sqlite":
+            return self.sqlite_ddl()
+        if dialect == "postgresql":
+            return self.postgresql_ddl()
+        return []
+
+    def apply(self, query: Any, search: str, fields: Sequence[str], dialect: Optional[str]) -> Optional[Tuple[Any, Any]]:
+        """인덱스로 검색 조건을 적용한 (쿼리, 관련도 정렬식)을 반환합니다. 인덱스를 쓸 수 없으면 None."""
+        if len(search) < MIN_TRIGRAM_LENGTH or not set(fields) <= set(self.columns):
+            return None
+        if dialect == "sqlite":
+            fts = table(self.name, column("rowid"), column("rank"), column(self.name))
+            # 검색어는 구문(phrase)으로 감싸 FTS5 연산자로 해석되지 않도록 하고, 지정한 컬럼에서만 검색
+            phrase = '"' + search.replace('"', '""') + '"'
+            match = "{" + " ".join(fields) + "} : " + phrase
+            query = (
+                query.join(fts, fts.c.rowid == getattr(self.model, self.pk_name))
+                .where(fts.c[self.name].op("MATCH")(match))
+            )
+            return query, fts.c.rank.asc()
+        if dialect == "postgresql":
+            columns = [getattr(self.model, field) for field in fields]
+            query = query.where(or_(*[col.ilike(f"%{search}%") for col in columns]))
+            similarity = func.greatest(*[func.similarity(col, search) for col in columns])
+            return query, similarity.desc()
+        return None
+
+
+SEARCH_INDEXES: List[SearchIndex] = [
+    SearchIndex(Vehicle, ("vin", "vehicle_number")),
+    SearchIndex(Module, ("module_nfc_tag_id",)),
+    SearchIndex(User, ("user_id", "user_email", "user_name")),
+    SearchIndex(OptionType, ("option_type_name",)),
+    SearchIndex(ModuleSet, ("module_set_name",)),
+]
+
+_INDEX_BY_MODEL = {index.model: index for index in SEARCH_INDEXES}
+
+
+def get_search_index(model: Type[SQLModel]) -> Optional[SearchIndex]:
+    """모델의 전문 검색 인덱스를 반환합니다. (등록되지 않았으면 None)"""
+    return _INDEX_BY_MODEL.get(model)
+
+
+def create_search_indexes(connection: Connection, rebuild: bool = True) -> None:
+    """현재 DB 방언에 맞는 검색 인덱스를 생성하고, rebuild=True이면 기존 행을 다시 색인합니다."""
+    dialect = connection.dialect.name
+    for index in SEARCH_INDEXES:
+        for statement in index.ddl(dialect):
+            connection.exec_driver_sql(statement)
+        if rebuild and dialect == "sqlite":
+            connection.exec_driver_sql(f"INSERT INTO {index.name}({index.name}) VALUES ('rebuild')")
+
+
+def _register_ddl_events() -> None:
+    """원본 테이블 생성/삭제 시 검색 인덱스도 함께 생성/삭제되도록 DDL 이벤트를 등록합니다."""
+    for index in SEARCH_INDEXES:
+        sa_table = index.model.__table__  # type: ignore[attr-defined]
+        for dialect in ("sqlite", "postgresql"):
+            for statement in index.ddl(dialect):
+                event.listen(sa_table, "after_create", DDL(statement).execute_if(dialect=dialect))
+        # 트리거는 테이블과 함께 삭제되지만 FTS 테이블은 별도로 삭제
+        event.listen(
+            sa_table, "before_drop", DDL(f"DROP TABLE IF EXISTS {index.name}").execute_if(dialect="sqlite")
+        )
+
+
+_register_ddl_events()
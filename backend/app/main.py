@@ -5,8 +5,11 @@ from contextlib import asynccontextmanager
 from fastapi.responses import RedirectResponse
 
 from app.core.config import settings
-from app.core.database import initialize_database
+from app.core.database import initialize_database, load_free_pool, load_lookup_tables
+from app.core.loop_monitor import loop_monitor
+from app.core.redis import async_redis_handler, redis_handler
 from app.core.middleware import setup_middlewares
+from app.core.responses import APIResponse
 from app.api.routes import api_router
 
 from app.utils.exceptions import  get_exception_handlers 
@@ -18,10 +21,22 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     # DB 초기화
     await initialize_database()
+    # LUT 캐시 적재
+    load_lookup_tables()
+    # 사용 가능 아이템 인덱스 적재
+    load_free_pool()
+    # 이벤트 루프 지연 모니터 (opt-in)
+    if settings.LOOP_MONITOR_ENABLED:
+        loop_monitor.start()
     yield
+    await loop_monitor.stop()
+    # Redis REST 연결 풀 정리
+    await async_redis_handler.aclose()
+    redis_handler.close()
 
 def create_app() -> FastAPI:
-    app = FastAPI(title="ModuCar API", lifespan=lifespan, openapi_prefix="/api")
+    # 모든 JSON 응답은 orjson으로 직렬화 (라우트별 response_class 지정이 없으면 기본값)
+    app = FastAPI(title="ModuCar API", lifespan=lifespan, openapi_prefix="/api", default_response_class=APIResponse)
 
     # 전역 예외 처리
     for exc, handler in get_exception_handlers().items():
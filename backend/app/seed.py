@@ -23,6 +23,8 @@ from app.utils.bcrypt import hash_password
 from app.db.models.rent_history import RentHistory
 from app.db.models.usage_history import UsageHistory
 from app.utils.lut_constants import ItemType as ItemTypeLUT, UsageStatus as UsageStatusLUT
+from app.db.crud.option_stock import option_stock_crud
+from app.db.crud.stats_rollup import rebuild_rollups
 
 fake = Faker()
 logging.getLogger("faker").setLevel(logging.WARNING)
@@ -1288,6 +1290,10 @@ def seed_data(session: Session) -> None:
       
         session.add_all(dummy_module_set_option_types)
         session.commit()
+
+        # 📌 옵션 재고 카운터 계산
+        option_stock_crud.rebuild(session)
+        session.commit()
         print("✅ Seed Data Inserted Successfully!")
         
         
@@ -1303,6 +1309,10 @@ def seed_data(session: Session) -> None:
             start_date = fake.date_time_between(start_date="-120d", end_date="-1d")
             end_date = start_date + timedelta(hours=random.randint(1, 24))
             create_dummy_maintenance(session, start_date, end_date)
+
+        # 📌 일별 통계 집계 계산
+        rebuild_rollups(session)
+        session.commit()
         
     except Exception as e:
         session.rollback()
@@ -1,45 +1,55 @@
 from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, Iterable, List, Tuple
 import math
-from sqlmodel import Session, select, func
+from sqlalchemy import case, literal, union_all
+from sqlmodel import select, func
+from sqlmodel.ext.asyncio.session import AsyncSession
 from app.db.models.rent_history import RentHistory
-from app.db.models.maintenance_history import MaintenanceHistory
+from app.db.models.maintenance_daily_stat import MaintenanceDailyStat
+from app.db.models.option_usage_daily_stat import OptionUsageDailyStat
+from app.db.models.rent_daily_stat import RentDailyStat
 from app.db.models.vehicle import Vehicle
 from app.db.models.module import Module
 from app.db.models.option import Option
-from app.db.crud.rent_history import rent_history_crud
-from app.db.crud.lut import item_status, item_type
-from app.db.models.usage_history import UsageHistory
-from app.utils.lut_constants import ItemType, RentStatus
-from app.db.crud.option_type import option_type_crud
+from app.db.models.option_type import OptionType
+from app.db.models.lut import ItemStatus
+from app.db.crud.rent_history import async_rent_history_crud
+from app.utils.lut_constants import RentStatus
+
+def _sum_by_month(rows: Iterable[Tuple[date, Any]]) -> List[Tuple[str, Any]]:
+    """(날짜, 값) 행을 "YYYY-MM" 월별 합계로 묶어 월 순서로 반환합니다. (DB 방언별 날짜 함수를 쓰지 않기 위함)"""
+    totals: Dict[str, Any] = {}
+    for stat_date, value in rows:
+        month = stat_date.strftime("%Y-%m")
+        totals[month] = totals.get(month, 0) + value
+    return sorted(totals.items())
 
 class DashboardService:
+    """관리자 대시보드 집계 서비스 (AsyncSession 사용)"""
     # 차량 관련 데이터
     @staticmethod
-    def get_today_rented_vehicles_count(session: Session) -> int:
+    async def get_today_rented_vehicles_count(session: AsyncSession) -> int:
         today = date.today()
         start = datetime.combine(today, time.min)
         end = datetime.combine(today, time.max)
         query = select(RentHistory).where(RentHistory.created_at >= start, RentHistory.created_at <= end, RentHistory.rent_status_id == RentStatus.IN_PROGRESS.ID)
-        paginated = rent_history_crud.paginate(session, 1, 1000, query)
-        return paginated["pagination"]["totalItems"]
+        return await async_rent_history_crud.count(session, query)
 
     @staticmethod
-    def get_currently_renting_vehicles_count(session: Session) -> int:
+    async def get_currently_renting_vehicles_count(session: AsyncSession) -> int:
         query = select(RentHistory).where(RentHistory.rent_status_id == RentStatus.IN_PROGRESS.ID)
-        results = session.exec(query).all()
-        return len(results)
+        return await async_rent_history_crud.count(session, query)
 
     @staticmethod
-    def get_today_expected_return_vehicles_count(session: Session) -> int:
+    async def get_today_expected_return_vehicles_count(session: AsyncSession) -> int:
         today = date.today()
         start = datetime.combine(today, time.min)
         end = datetime.combine(today, time.max)
         query = select(RentHistory).where(RentHistory.rent_end_date >= start, RentHistory.rent_end_date <= end)
-        results = session.exec(query).all()
-        return len(results)
+        return await async_rent_history_crud.count(session, query)
 
     @staticmethod
-    def get_today_completed_returns_count(session: Session) -> int:
+    async def get_today_completed_returns_count(session: AsyncSession) -> int:
         """ 오늘 날짜에 반납 완료된 차량 건수를 조회합니다. """
         today = date.today()
         start = datetime.combine(today, time.min)
@@ -52,100 +62,161 @@ class DashboardService:
                 RentHistory.rent_status_id == RentStatus.COMPLETED.ID
             )
         )
-        results = session.exec(query).all()
-        return len(results)
+        return await async_rent_history_crud.count(session, query)
 
     @staticmethod
-    def get_state_chart(query_model, count_field, session: Session):
-        total = session.exec(select(func.count()).select_from(query_model)).one()
-        group_query = (
-            select(getattr(query_model, "item_status_id"), func.count(count_field))
-            .group_by(getattr(query_model, "item_status_id"))
-        )
-        results = session.exec(group_query).all()
+    def _build_state_chart(rows: List[Tuple[str, int]], total: int) -> List[Dict[str, Any]]:
+        """(상태 이름, 건수) 목록을 비율이 포함된 차트 데이터로 변환합니다."""
         state_chart = []
-        for status_id, cnt in results:
-            status_obj = item_status.get_by_id(session, status_id)
+        for status_name, cnt in rows:
             ratio = (cnt / total * 100) if total > 0 else 0
             # 소수점 첫째자리에서 올림 (예: 50.1, 50.2 ... 50.9를 50.1로 올림)
             ratio = math.ceil(ratio * 10) / 10  
             state_chart.append({
-                "state": status_obj.item_status_name,
+                "state": status_name,
                 "count": cnt,
                 "ratio": ratio
             })
         return state_chart
 
     @staticmethod
-    def get_vehicle_state_chart(session: Session):
-        return DashboardService.get_state_chart(Vehicle, Vehicle.vehicle_id, session)
+    async def get_state_chart(query_model, count_field, session: AsyncSession):
+        total = (await session.exec(select(func.count()).select_from(query_model))).one()
+        status_column = getattr(query_model, "item_status_id")
+        # 상태 이름을 조인으로 함께 조회
+        group_query = (
+            select(ItemStatus.item_status_name, func.count(count_field))
+            .join(ItemStatus, ItemStatus.item_status_id == status_column)
+            .group_by(status_column, ItemStatus.item_status_name)
+        )
+        results = (await session.exec(group_query)).all()
+        return DashboardService._build_state_chart(results, total)
+
+    @staticmethod
+    async def get_vehicle_state_chart(session: AsyncSession):
+        return await DashboardService.get_state_chart(Vehicle, Vehicle.vehicle_id, session)
 
     @staticmethod
-    def get_module_state_chart(session: Session):
-        return DashboardService.get_state_chart(Module, Module.module_id, session)
+    async def get_module_state_chart(session: AsyncSession):
+        return await DashboardService.get_state_chart(Module, Module.module_id, session)
 
     @staticmethod
-    def get_option_state_chart(session: Session):
-        return DashboardService.get_state_chart(Option, Option.option_id, session)
+    async def get_option_state_chart(session: AsyncSession):
+        return await DashboardService.get_state_chart(Option, Option.option_id, session)
 
-    # 판매 통계 관련 데이터
+    # 대시보드 첫 화면 스냅샷
     @staticmethod
-    def get_rental_counts_by_date(session: Session) -> list:
-        """월별 대여 건수를 조회합니다."""
+    async def get_counters(session: AsyncSession) -> Dict[str, int]:
+        """대여 관련 카운터 4종을 rent_history 조건부 집계(SUM(CASE ...)) 한 번으로 조회합니다."""
+        today = date.today()
+        start = datetime.combine(today, time.min)
+        end = datetime.combine(today, time.max)
+        in_progress = RentHistory.rent_status_id == RentStatus.IN_PROGRESS.ID
+        completed_today = (RentHistory.rent_status_id == RentStatus.COMPLETED.ID) & RentHistory.updated_at.between(start, end)
+        conditions = {
+            "today_rented": in_progress & RentHistory.created_at.between(start, end),
+            "currently_renting": in_progress,
+            "today_expected_return": RentHistory.rent_end_date.between(start, end),
+            "today_completed_returns": completed_today,
+        }
         query = (
+            select(*[
+                func.coalesce(func.sum(case((condition, 1), else_=0)), 0).label(name)
+                for name, condition in conditions.items()
+            ])
+            # 어느 카운터에도 해당하지 않는 행은 읽지 않음
+            .where(in_progress | RentHistory.rent_end_date.between(start, end) | completed_today)
+        )
+        row = (await session.exec(query)).one()
+        return dict(zip(conditions, row))
+
+    @staticmethod
+    async def get_state_charts(session: AsyncSession) -> Dict[str, List[Dict[str, Any]]]:
+        """차량/모듈/옵션 상태 차트를 UNION ALL 그룹 쿼리 한 번으로 조회합니다."""
+        models = {"vehicle": Vehicle, "module": Module, "option": Option}
+        grouped = union_all(*[
             select(
-                func.strftime("%Y-%m", RentHistory.rent_start_date).label("year_month"),
-                func.count().label("count")
+                literal(kind).label("kind"),
+                model.item_status_id.label("item_status_id"),
+                func.count().label("cnt")
+            ).group_by(model.item_status_id)
+            for kind, model in models.items()
+        ]).subquery()
+        query = (
+            select(grouped.c.kind, ItemStatus.item_status_name, grouped.c.cnt)
+            .outerjoin(ItemStatus, ItemStatus.item_status_id == grouped.c.item_status_id)
+            .order_by(grouped.c.kind, grouped.c.item_status_id)
+        )
+        rows = (await session.exec(query)).all()
+
+        charts = {}
+        for kind in models:
+            kind_rows = [(status_name, cnt) for row_kind, status_name, cnt in rows if row_kind == kind]
+            # 전체 건수에는 LUT에 없는 상태도 포함 (개별 차트 API와 동일)
+            total = sum(cnt for _, cnt in kind_rows)
+            charts[kind] = DashboardService._build_state_chart(
+                [(status_name, cnt) for status_name, cnt in kind_rows if status_name is not None], total
             )
-            .group_by("year_month")
+        return charts
+
+    @staticmethod
+    async def get_snapshot(session: AsyncSession) -> Dict[str, Any]:
+        """대시보드 첫 화면의 카운터와 상태 차트를 SQL 두 번으로 조회합니다."""
+        return {
+            "counters": await DashboardService.get_counters(session),
+            "state_charts": await DashboardService.get_state_charts(session),
+            "generated_at": datetime.now(),
+        }
+
+    # 판매 통계 관련 데이터
+    @staticmethod
+    async def get_rental_counts_by_date(session: AsyncSession) -> list:
+        """월별 대여 건수를 조회합니다. (일별 렌트 집계 테이블 기준)"""
+        query = (
+            select(RentDailyStat.stat_date, func.sum(RentDailyStat.rent_count))
+            .group_by(RentDailyStat.stat_date)
         )
-        results = session.exec(query).all()  
+        results = (await session.exec(query)).all()  # 일 단위 행 수만큼만 조회
         monthly_counts = [
             {"month": f"{int(year_month.split('-')[1])}월", "count": count}
-            for year_month, count in results
+            for year_month, count in _sum_by_month(results)
         ]
         return monthly_counts
 
     @staticmethod
-    def get_maintenance_cost_by_month(session: Session) -> list:
-        """월별 정비 비용을 조회합니다."""
+    async def get_maintenance_cost_by_month(session: AsyncSession) -> list:
+        """월별 정비 비용을 조회합니다. (일별 정비 집계 테이블 기준)"""
         query = (
-            select(
-                func.strftime("%Y-%m", MaintenanceHistory.scheduled_at).label("year_month"),
-                func.sum(MaintenanceHistory.cost).label("cost")
-            )
-            .group_by("year_month")
+            select(MaintenanceDailyStat.stat_date, func.sum(MaintenanceDailyStat.cost))
+            .where(MaintenanceDailyStat.maintenance_count > 0)
+            .group_by(MaintenanceDailyStat.stat_date)
         )
-        results = session.exec(query).all()  # results: 리스트 형태 [(year_month, cost), ...]
-        monthly_costs = [{"month": year_month, "cost": cost} for year_month, cost in results]
+        results = (await session.exec(query)).all()  # results: 리스트 형태 [(stat_date, cost), ...]
+        monthly_costs = [{"month": year_month, "cost": cost} for year_month, cost in _sum_by_month(results)]
         return monthly_costs
 
     @staticmethod
-    def get_popular_option_types(session: Session) -> list:
+    async def get_popular_option_types(session: AsyncSession) -> list:
         """
         최근 3개월 내 대여된 옵션 기록을 기반으로 
-        옵션 타입별 사용 건수를 집계하고 상위 5개 항목을 반환합니다.
+        옵션 타입별 사용 건수를 집계하고 상위 5개 항목을 반환합니다. (일별 옵션 사용 집계 테이블 기준)
         """
-        three_months_ago = datetime.now() - timedelta(days=90)
+        three_months_ago = (datetime.now() - timedelta(days=90)).date()
+        usage_count = func.sum(OptionUsageDailyStat.usage_count)
         stmt = (
-            select(Option.option_type_id, func.count(UsageHistory.usage_id).label("cnt"))
-            .join(Option, Option.option_id == UsageHistory.item_id)
-            .where(
-                UsageHistory.item_type_id == ItemType.OPTION.ID,
-                UsageHistory.created_at >= three_months_ago
-            )
-            .group_by(Option.option_type_id)
-            .order_by(func.count(UsageHistory.usage_id).desc())
+            select(OptionUsageDailyStat.option_type_id, OptionType.option_type_name, usage_count.label("cnt"))
+            .join(OptionType, OptionType.option_type_id == OptionUsageDailyStat.option_type_id)
+            .where(OptionUsageDailyStat.stat_date >= three_months_ago)
+            .group_by(OptionUsageDailyStat.option_type_id, OptionType.option_type_name)
+            .order_by(usage_count.desc())
             .limit(5)
         )
-        results = session.exec(stmt).all()
-        popular = []
-        for opt_type_id, count in results:
-            # 조회된 옵션 타입 이름을 가져옴
-            name = option_type_crud.get_option_name_by_id(session, opt_type_id)
-            popular.append({
+        results = (await session.exec(stmt)).all()
+        return [
+            {
                 "option_type_id": opt_type_id,
                 "option_type_name": name,
                 "count": count
-            })
-        return popular
+            }
+            for opt_type_id, name, count in results
+        ]
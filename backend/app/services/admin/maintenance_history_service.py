@@ -1,5 +1,4 @@
 from sqlmodel import Session, select
-from sqlalchemy import func
 from app.db.models.maintenance_history import MaintenanceHistory  # 해당 모델이 존재한다고 가정
 from app.api.schemas.common import Pagination
 from datetime import datetime
@@ -17,11 +16,16 @@ from app.api.schemas.admin.maintenance_history_schema import (
     MaintenanceHistoryPatchResponse,
     MaintenanceHistoryDeleteResponse
 )
-from typing import Optional, Union, List, cast
+from typing import Iterator, Optional, Union, List, cast
 from app.utils.lut_constants import ItemStatus
 from app.utils.handle_transaction import handle_transaction
+from app.core.response_cache import DashboardCacheTag, dashboard_cache
+from app.utils.export import EXPORT_BATCH_SIZE
 from app.db.crud.lut import item_type
 from app.db.crud.maintenance_history import maintenance_history_crud
+from app.db.crud.vehicle import vehicle_crud
+from app.db.crud.module import module_crud
+from app.db.crud.option import option_crud
 from app.db.crud.lut import maintenance_status
 
 class MaintenanceHistoryService:
@@ -46,30 +50,14 @@ class MaintenanceHistoryService:
         return cast(Optional[Union[Vehicle, Module, Option]], session.get(model, item_id))
 
     @staticmethod
-    @handle_transaction
-    def get_maintenance_history(
-        session: Session,
-        page: int = 1,
-        pageSize: int = 10,
-        itemType: Optional[str] = None,
-        itemId: Optional[int] = None,
-    ) -> MaintenanceHistoryGetResponse:
-        """
-        지정된 조건에 따라 정비 기록을 조회하는 서비스 로직입니다.
-        
-        Args:
-            session (Session): 데이터베이스 세션.
-            page (int): 현재 페이지 (기본값: 1).
-            pageSize (int): 한 페이지당 정비 기록 수 (기본값: 10).
-            itemType (Optional[int]): 정비 대상의 타입 ID. (예: 차량, 모듈, 옵션 등)
-            itemId (Optional[int]): 특정 아이템의 고유 ID. itemType이 제공된 경우에만 사용.
-        
-        Raises:
-            ConflictError: 아이템 타입이 제공되지 않은 상태에서 아이템 아이디가 지정된 경우.
-        
-        Returns:
-            MaintenanceHistoryGetResponse: 정비 기록 조회 응답 스키마.
-        """
+    def _save_item(session: Session, item: Union[Vehicle, Module, Option]) -> None:
+        """아이템 상태 변경을 저장합니다. 옵션은 재고 카운터도 함께 갱신됩니다."""
+        crud_mapping = {Vehicle: vehicle_crud, Module: module_crud, Option: option_crud}
+        crud_mapping[type(item)].save(session, item)
+
+    @staticmethod
+    def _build_list_query(session: Session, itemType: Optional[str], itemId: Optional[int]):
+        """목록 조회/내보내기 공통 필터를 적용한 쿼리를 생성합니다."""
         # deleted_at이 없는 정비 기록만 조회
         filters = [MaintenanceHistory.deleted_at == None]
         
@@ -83,19 +71,12 @@ class MaintenanceHistoryService:
         if itemId is not None:
             filters.append(MaintenanceHistory.item_id == itemId)
         
-        stmt = select(MaintenanceHistory)
-        if filters:
-            stmt = stmt.where(*filters)
-        
-        total_query = select(func.count()).select_from(MaintenanceHistory)
-        if filters:
-            total_query = total_query.where(*filters)
-        total_items = session.exec(total_query).one()
-        
-        histories = session.exec(stmt.offset((page - 1) * pageSize).limit(pageSize)).all()
+        return select(MaintenanceHistory).where(*filters)
 
-        maintenance_items :List[MaintenanceHistoryItem] = [
-          MaintenanceHistoryItem(
+    @staticmethod
+    def _to_item(session: Session, history: MaintenanceHistory) -> MaintenanceHistoryItem:
+        """정비 기록을 응답 항목으로 변환합니다."""
+        return MaintenanceHistoryItem(
             maintenance_id = cast(int, history.maintenance_id),
             item_type_name = item_type.get_by_id(session, history.item_type_id).item_type_name,
             item_id = history.item_id,
@@ -108,17 +89,47 @@ class MaintenanceHistoryService:
             created_by = history.created_by,
             updated_at = history.updated_at,
             updated_by = history.updated_by
-          )
-          for history in histories
-        ]
-        total_pages = (total_items + pageSize - 1) // pageSize if total_items else 0
+        )
+
+    @staticmethod
+    @handle_transaction
+    def get_maintenance_history(
+        session: Session,
+        page: int = 1,
+        pageSize: int = 10,
+        itemType: Optional[str] = None,
+        itemId: Optional[int] = None,
+        after: Optional[str] = None,
+        include_total: bool = True,
+    ) -> MaintenanceHistoryGetResponse:
+        """
+        지정된 조건에 따라 정비 기록을 조회하는 서비스 로직입니다.
+        
+        Args:
+            session (Session): 데이터베이스 세션.
+            page (int): 현재 페이지 (기본값: 1).
+            pageSize (int): 한 페이지당 정비 기록 수 (기본값: 10).
+            itemType (Optional[int]): 정비 대상의 타입 ID. (예: 차량, 모듈, 옵션 등)
+            itemId (Optional[int]): 특정 아이템의 고유 ID. itemType이 제공된 경우에만 사용.
+            after (Optional[str]): 이전 페이지 응답의 nextCursor. 지정 시 page 대신 커서 기준으로 조회.
+            include_total (bool): 전체 건수(totalItems, totalPages) 집계 여부.
         
-        pagination = Pagination(
-            currentPage=page,
-            totalPages=total_pages,
-            totalItems=total_items,
-            pageSize=pageSize
+        Raises:
+            ConflictError: 아이템 타입이 제공되지 않은 상태에서 아이템 아이디가 지정된 경우.
+        
+        Returns:
+            MaintenanceHistoryGetResponse: 정비 기록 조회 응답 스키마.
+        """
+        stmt = MaintenanceHistoryService._build_list_query(session, itemType, itemId)
+        paginated_result = maintenance_history_crud.paginate(
+            session, page, pageSize, stmt, after=after, include_total=include_total
         )
+        histories: List[MaintenanceHistory] = paginated_result["items"]
+
+        maintenance_items :List[MaintenanceHistoryItem] = [
+          MaintenanceHistoryService._to_item(session, history) for history in histories
+        ]
+        pagination = Pagination(**paginated_result["pagination"])
         
         data = MaintenanceHistoryData(
             maintenance_history=maintenance_items,
@@ -130,6 +141,25 @@ class MaintenanceHistoryService:
             data=data
         )
 
+    @staticmethod
+    def export_maintenance_history(
+        session: Session,
+        itemType: Optional[str] = None,
+        itemId: Optional[int] = None
+    ) -> Iterator[List[MaintenanceHistoryItem]]:
+        """
+        목록 조회와 같은 필터로 정비 기록 전체를 배치 단위로 반환합니다.
+        필터 검증은 스트리밍 시작 전에 수행하고, 조회는 내보내기가 끝나면 닫히는 별도 세션에서 수행합니다.
+        """
+        stmt = MaintenanceHistoryService._build_list_query(session, itemType, itemId)
+
+        def _batches() -> Iterator[List[MaintenanceHistoryItem]]:
+            with Session(session.get_bind()) as export_session:
+                for histories in maintenance_history_crud.iter_batches(export_session, stmt, EXPORT_BATCH_SIZE):
+                    yield [MaintenanceHistoryService._to_item(export_session, history) for history in histories]
+
+        return _batches()
+
     @staticmethod
     @handle_transaction
     def create_maintenance_history(
@@ -179,19 +209,16 @@ class MaintenanceHistoryService:
             updated_by=user_pk
         )
         
-        session.add(new_history)
-        session.flush()  # 새 레코드를 flush하여 persistent 상태로 만듦
-        session.refresh(new_history)
+        maintenance_history_crud.save(session, new_history)
         
         # 아이템의 상태 및 정비 날짜 업데이트
         if payload.item_type_name in ("vehicle", "module", "option"):
             item.item_status_id = 3  # 예를 들어, '정비 중' 상태
             item.next_maintenance_at = payload.scheduled_at
 
-        session.add(item)
-        session.flush()  # 아이템도 flush하여 persistent 상태로 만듦
-        session.refresh(item)
+        MaintenanceHistoryService._save_item(session, item)
         
+        dashboard_cache.invalidate_on_commit(session, DashboardCacheTag.MAINTENANCE, DashboardCacheTag.ITEMS)
         return MaintenanceHistoryPostResponse.success(
             message="Maintenance history created successfully"
         )
@@ -252,10 +279,9 @@ class MaintenanceHistoryService:
             item.item_status_id = 2
             item.last_maintenance_at = history.completed_at
             item.next_maintenance_at = None
-            session.add(item)
-            session.flush()
-            session.refresh(item)
+            MaintenanceHistoryService._save_item(session, item)
             
+        dashboard_cache.invalidate_on_commit(session, DashboardCacheTag.MAINTENANCE, DashboardCacheTag.ITEMS)
         return MaintenanceHistoryPatchResponse.success(
             message="Maintenance history updated successfully"
         )
@@ -300,10 +326,9 @@ class MaintenanceHistoryService:
         item = MaintenanceHistoryService._fetch_item(session, history.item_type_id, history.item_id)
         if item:
             item.item_status_id = 2
-            session.add(item)
-            session.flush()
-            session.refresh(item) 
+            MaintenanceHistoryService._save_item(session, item)
 
+        dashboard_cache.invalidate_on_commit(session, DashboardCacheTag.MAINTENANCE, DashboardCacheTag.ITEMS)
         return MaintenanceHistoryDeleteResponse.success(
             message="Maintenance history deleted successfully"
         ) 
\ No newline at end of file
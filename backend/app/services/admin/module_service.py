@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 from sqlmodel import Session
 from app.api.schemas.admin.module_schema import ModuleItem, ModuleGetResponse, ModuleData, ModuleRegisterRequest, ModuleMessageResponse, ModuleUpdateRequest 
 from app.db.crud.module import module_crud
@@ -6,6 +6,7 @@ from app.api.schemas.common import Coordinate
 from app.db.models.module import Module
 from app.utils.exceptions import DatabaseError, ConflictError, NotFoundError
 from app.utils.handle_transaction import handle_transaction
+from app.core.response_cache import DashboardCacheTag, dashboard_cache
 from datetime import datetime
 from sqlalchemy import select
 from app.utils.lut_constants import ItemStatus, ItemType, ModuleType, UsageStatus, MaintenanceStatus
@@ -94,11 +95,19 @@ class ModuleService:
             
     @staticmethod
     @handle_transaction
-    def get_module_list(session: Session, page: int, page_size: int) -> ModuleGetResponse:
+    def get_module_list(
+        session: Session,
+        page: int,
+        page_size: int,
+        after: Optional[str] = None,
+        include_total: bool = True
+    ) -> ModuleGetResponse:
         "관리자 모듈 목록 조회 서비스"
         
         # 모듈 목록 조회
-        paginated_result = module_crud.paginate(session, page, page_size)
+        paginated_result = module_crud.paginate(
+            session, page, page_size, after=after, include_total=include_total
+        )
         modules: List[Module] = paginated_result["items"]
         
         # 모듈 데이터 변환
@@ -142,6 +151,7 @@ class ModuleService:
         )
 
         module_crud.create(session, new_module)
+        dashboard_cache.invalidate_on_commit(session, DashboardCacheTag.ITEMS)
         return ModuleMessageResponse.success(
             message="Module registered successfully"
         )
@@ -163,6 +173,7 @@ class ModuleService:
         
         module_crud.update(session, module_id, update_data, "module_id")
         
+        dashboard_cache.invalidate_on_commit(session, DashboardCacheTag.ITEMS)
         return ModuleMessageResponse.success(
             message="Module updated successfully"
         )
@@ -176,6 +187,7 @@ class ModuleService:
         
         module_crud.soft_delete(session, module_id, "module_id")
 
+        dashboard_cache.invalidate_on_commit(session, DashboardCacheTag.ITEMS)
         return ModuleMessageResponse.success(
             message="Module deleted successfully"
         )   
@@ -8,10 +8,10 @@ from app.db.models.module_set import ModuleSet
 from app.db.models.module_set_option_types import ModuleSetOptionTypes
 from app.utils.exceptions import DatabaseError, NotFoundError
 from app.utils.handle_transaction import handle_transaction
+from app.core.catalog_version import Catalog, catalog_versions
 from datetime import datetime
 from app.db.crud.lut import module_type as module_type_crud
 from app.db.crud.module_set_option_type import module_set_option_type_crud
-from app.db.crud.option_type import option_type_crud
 
 class ModuleSetService:
     
@@ -73,6 +73,11 @@ class ModuleSetService:
         paginated_result = module_set_crud.paginate(session, page, page_size)
         module_sets: List[ModuleSet] = paginated_result["items"]
         
+        # 페이지 내 모듈 세트 가격 및 옵션 타입 일괄 계산
+        pricing = module_set_crud.calculate_base_prices(
+            session, [module_set.module_set_id for module_set in module_sets if module_set.module_set_id is not None]
+        )
+        
         # 모듈 세트 데이터 리스트 생성
         module_set_items = []
         for module_set in module_sets:
@@ -84,14 +89,13 @@ class ModuleSetService:
                     detail={"module_set_id": module_set.module_set_id}
                 )
             
-            # 모듈 타입 존재 여부 확인
-            ModuleSetService._check_module_type_exists(session, module_set.module_type_id)
-            
-            # 모듈 세트 가격 계산
-            calculated_cost = module_set_crud.calculate_base_price(
-                session, 
-                module_set.module_set_id, 
-            )
+            # 모듈 타입 존재 여부 확인 (모듈 타입이 없으면 가격 계산 결과에 포함되지 않음)
+            module_set_pricing = pricing.get(module_set.module_set_id)
+            if module_set_pricing is None:
+                raise NotFoundError(
+                    message="Module type not found",
+                    detail={"module_type_id": module_set.module_type_id}
+                )
             
             # 모듈 세트 이미지 파싱
             if module_set.module_set_images:
@@ -99,13 +103,13 @@ class ModuleSetService:
             else:
                 module_set_images = []
             
-            # 모듈 세트 옵션 타입 조회
+            # 모듈 세트 옵션 타입 변환
             module_set_option_types : List[ModuleSetOptionType] = [
                 ModuleSetOptionType(
-                    option_type_id=option_type.option_type_id,
-                    option_type_name=option_type_crud.get_option_name_by_id(session, option_type.option_type_id),
-                    quantity=option_type.option_quantity
-                ) for option_type in module_set_option_type_crud.get_option_types_by_module_set(session, module_set.module_set_id)
+                    option_type_id=option_type_id,
+                    option_type_name=option_type_name,
+                    quantity=quantity
+                ) for option_type_id, option_type_name, quantity in module_set_pricing["option_types"]
             ]
             
             # 모듈 세트 데이터 변환
@@ -116,7 +120,7 @@ class ModuleSetService:
                 module_set_images=module_set_images,
                 module_set_features=module_set.module_set_features or "",
                 module_type_id=module_set.module_type_id,
-                cost=calculated_cost,
+                cost=module_set_pricing["base_price"],
                 module_set_option_types=module_set_option_types,
                 created_at=module_set.created_at,
                 created_by=module_set.created_by,
@@ -161,6 +165,7 @@ class ModuleSetService:
         # 모듈 세트 생성
         new_module_set = module_set_crud.create(session, new_module_set)
 
+        catalog_versions.bump_on_commit(session, Catalog.MODULE_SETS)
         return ModuleSetMessageResponse.success(
             message="Module set registered successfully"
         )
@@ -186,6 +191,7 @@ class ModuleSetService:
         update_data["updated_at"] = datetime.now()
 
         module_set_crud.update(session, module_set_id, update_data, "module_set_id")
+        catalog_versions.bump_on_commit(session, Catalog.MODULE_SETS)
         return ModuleSetMessageResponse.success(
             message="Module set updated successfully"
         )
@@ -205,6 +211,7 @@ class ModuleSetService:
         # 모듈 세트 삭제
         module_set_crud.soft_delete(session, module_set_id, "module_set_id")
 
+        catalog_versions.bump_on_commit(session, Catalog.MODULE_SETS)
         return ModuleSetMessageResponse.success(
             message="Module set deleted successfully"
         )
@@ -230,6 +237,7 @@ class ModuleSetService:
         
         module_set_crud.update(session, module_set_id, {"module_set_images": existing_images}, id_field="module_set_id")
 
+        catalog_versions.bump_on_commit(session, Catalog.MODULE_SETS)
         return ModuleSetMessageResponse.success(
             message="Module set image added successfully" 
         )
@@ -253,6 +261,7 @@ class ModuleSetService:
             image_urls = ",".join(existing_images)
             module_set_crud.update(session, module_set_id, {"module_set_images": image_urls}, id_field="module_set_id")
         
+        catalog_versions.bump_on_commit(session, Catalog.MODULE_SETS)
         return ModuleSetMessageResponse.success(
             message="Module set image removed successfully"
         )
@@ -270,6 +279,7 @@ class ModuleSetService:
         # 모듈 세트 옵션 추가
         module_set_option_type_crud.create(session, ModuleSetOptionTypes(module_set_id=module_set_id, option_type_id=request.option_type_id, option_quantity=request.quantity))
 
+        catalog_versions.bump_on_commit(session, Catalog.MODULE_SETS)
         return ModuleSetMessageResponse.success(
             message="Module set option added successfully"
         )
@@ -287,6 +297,7 @@ class ModuleSetService:
         # 모듈 세트 옵션 삭제
         module_set_option_type_crud.delete_by_module_set_id_and_option_type_id(session, module_set_id, option_type_id)
 
+        catalog_versions.bump_on_commit(session, Catalog.MODULE_SETS)
         return ModuleSetMessageResponse.success(
             message="Module set option removed successfully"
         )
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 from sqlmodel import Session
 from app.api.schemas.admin.option_schema import OptionMessageResponse, OptionGetResponse, OptionItem, OptionData, OptionRegisterRequest, OptionUpdateRequest 
 from app.db.crud.option import option_crud
@@ -8,6 +8,7 @@ from app.db.crud.maintenance_history import maintenance_history_crud
 from app.db.models.option import Option
 from app.utils.exceptions import DatabaseError, ConflictError, NotFoundError
 from app.utils.handle_transaction import handle_transaction
+from app.core.response_cache import DashboardCacheTag, dashboard_cache
 from datetime import datetime
 from sqlalchemy import select
 from app.utils.lut_constants import ItemStatus, ItemType, UsageStatus, MaintenanceStatus
@@ -82,11 +83,19 @@ class OptionService:
             )
             
     @staticmethod
-    def get_option_list(session: Session, page: int, page_size: int) -> OptionGetResponse:
+    def get_option_list(
+        session: Session,
+        page: int,
+        page_size: int,
+        after: Optional[str] = None,
+        include_total: bool = True
+    ) -> OptionGetResponse:
         """옵션 목록 조회 서비스"""
                 
         # 옵션 목록 조회
-        paginated_result = option_crud.paginate(session, page, page_size)
+        paginated_result = option_crud.paginate(
+            session, page, page_size, after=after, include_total=include_total
+        )
         options: List[Option] = paginated_result["items"]
         
         # 옵션 데이터 변환
@@ -127,6 +136,7 @@ class OptionService:
         )
 
         option_crud.create(session, new_option)
+        dashboard_cache.invalidate_on_commit(session, DashboardCacheTag.ITEMS)
         return OptionMessageResponse.success(
             message="Option registered successfully"
         )
@@ -149,6 +159,7 @@ class OptionService:
         
         option_crud.update(session, option_id, update_data, id_field="option_id")
         
+        dashboard_cache.invalidate_on_commit(session, DashboardCacheTag.ITEMS)
         return OptionMessageResponse.success(
             message="Option updated successfully"
         )
@@ -162,6 +173,7 @@ class OptionService:
         
         option_crud.soft_delete(session, option_id, "option_id")
 
+        dashboard_cache.invalidate_on_commit(session, DashboardCacheTag.ITEMS)
         return OptionMessageResponse.success(
             message="Option deleted successfully"
         )
\ No newline at end of file
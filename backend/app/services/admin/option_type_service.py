@@ -9,6 +9,8 @@ from app.db.crud.module_set_option_type import module_set_option_type_crud
 from app.db.crud.option import option_crud
 from app.utils.exceptions import DatabaseError, NotFoundError
 from app.utils.handle_transaction import handle_transaction
+from app.core.catalog_version import Catalog, catalog_versions
+from app.core.response_cache import DashboardCacheTag, dashboard_cache
 from datetime import datetime
 
 class OptionTypeService:
@@ -119,6 +121,7 @@ class OptionTypeService:
         # 옵션 타입 생성
         new_option_type = option_type_crud.create(session, new_option_type)
         
+        catalog_versions.bump_on_commit(session, Catalog.OPTION_TYPES)
         return OptionTypeMessageResponse.success(
             message="Option type registered successfully"
         )
@@ -140,6 +143,8 @@ class OptionTypeService:
         
         option_type_crud.update(session, option_type_id, update_data, "option_type_id")
         
+        dashboard_cache.invalidate_on_commit(session, DashboardCacheTag.ITEMS)
+        catalog_versions.bump_on_commit(session, Catalog.OPTION_TYPES)
         return OptionTypeMessageResponse.success(
             message="Option type updated successfully"
         )
@@ -170,6 +175,8 @@ class OptionTypeService:
         # 옵션 타입 삭제
         option_type_crud.soft_delete(session, option_type_id, "option_type_id")
 
+        dashboard_cache.invalidate_on_commit(session, DashboardCacheTag.ITEMS)
+        catalog_versions.bump_on_commit(session, Catalog.OPTION_TYPES)
         return OptionTypeMessageResponse.success(
             message="Option type deleted successfully"
         )   
@@ -195,6 +202,7 @@ class OptionTypeService:
         # 옵션 타입 이미지 업데이트
         option_type_crud.update(session, option_type_id, {"option_type_images": existing_images}, "option_type_id")
         
+        catalog_versions.bump_on_commit(session, Catalog.OPTION_TYPES)
         return OptionTypeMessageResponse.success(
             message="Option type image added successfully"
         ) 
@@ -218,6 +226,7 @@ class OptionTypeService:
             image_urls = ",".join(existing_images)
             option_type_crud.update(session, option_type_id, {"option_type_images": image_urls}, id_field="option_type_id")
         
+        catalog_versions.bump_on_commit(session, Catalog.OPTION_TYPES)
         return OptionTypeMessageResponse.success(
             message="Option type image removed successfully"
         )    
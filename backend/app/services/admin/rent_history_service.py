@@ -1,67 +1,78 @@
 from sqlmodel import Session
 from app.api.schemas.common import Coordinate
 from app.db.models.rent_history import RentHistory
-from app.db.models.vehicle import Vehicle
 from app.utils.exceptions import NotFoundError, DatabaseError
 from app.db.crud.usage_history import usage_history_crud
 from app.db.crud.option import option_crud
+from app.db.crud.vehicle import vehicle_crud
 from app.db.crud.rent_history import rent_history_crud
 from app.api.schemas.admin.rent_history_schema import RentHistoryResponse, RentHistoryData, RentHistoryItem, RentVideoItem, RentVideoData, RentVideoResponse
 from app.utils.lut_constants import ItemType, RentStatus, VideoType
 from datetime import datetime
-from typing import Any, Dict, cast
+from typing import Any, Dict, Iterator, List, Optional, cast
 from app.db.crud.video_storage import video_storage_crud
 from app.db.crud.option_type import option_type_crud
+from app.utils.export import EXPORT_BATCH_SIZE
 
 
 class RentHistoryService:
     @staticmethod
-    def _validate_vehicle(session: Session, vehicle_id: int) -> str:
-        vehicle = session.get(Vehicle, vehicle_id)
-        if not vehicle:
-            raise NotFoundError(
-                message="Vehicle not found",
-                detail={"vehicle_id": vehicle_id}
-            )
-        return vehicle.vehicle_number
+    def _resolve_usage_entries(session: Session, rent_ids: list[int]) -> Dict[int, tuple[str, list[str]]]:
+        """
+        페이지에 포함된 렌트들의 사용 기록을 일괄 처리합니다.
+        사용 기록, 차량, 옵션을 각각 한 번의 쿼리로 조회하고 옵션 타입 이름은 카탈로그에서 조회하므로 페이지 크기와 무관하게 쿼리 수가 일정합니다.
+        """
+        entries_by_rent = usage_history_crud.get_usage_entries_by_rent_ids(session, rent_ids)
+        for rent_id, usage_entries in entries_by_rent.items():
+            if not usage_entries:
+                raise DatabaseError(
+                    message="No usage entries found",
+                    detail={"rent_id": rent_id}
+                )
 
-    @staticmethod
-    def _validate_option(option_id: int, session: Session) -> str:
-        """옵션 정보 검증 및 조회"""
-        option = option_crud.get_by_id(session, option_id)
-        if not option:
-            raise DatabaseError(
-                message="Option not found",
-                detail={"option_id": option_id}
-            )
-        if not option.option_type_id:
-            raise DatabaseError(
-                message="Option type ID is required",
-                detail={"option_id": option_id}
-            )
-        return option_type_crud.get_option_name_by_id(session, option.option_type_id)
+        all_entries = [entry for entries in entries_by_rent.values() for entry in entries]
+        vehicle_ids = [entry.item_id for entry in all_entries if entry.item_type_id == ItemType.VEHICLE.ID]
+        option_ids = [entry.item_id for entry in all_entries if entry.item_type_id == ItemType.OPTION.ID]
 
-    @staticmethod
-    def _process_usage_entries(session: Session, rent_id: int) -> tuple[str, list[str]]:
-        """사용 기록 처리"""
-        usage_entries = usage_history_crud.get_usage_entries(session, rent_id)
-        if not usage_entries:
-            raise DatabaseError(
-                message="No usage entries found",
-                detail={"rent_id": rent_id}
-            )
+        vehicles = vehicle_crud.get_by_ids(session, vehicle_ids, "vehicle_id", include_deleted=True)
+        options = option_crud.get_by_ids(session, option_ids, "option_id")
 
-        vehicle_number = ""
-        option_type_ids: list[str] = []
-        
-        for entry in usage_entries:
-            if entry.item_type_id == ItemType.VEHICLE.ID:
-                vehicle_number = RentHistoryService._validate_vehicle(session, entry.item_id)
-            elif entry.item_type_id == ItemType.OPTION.ID:
-                option_type_id = RentHistoryService._validate_option(entry.item_id, session)
-                option_type_ids.append(option_type_id)
-                    
-        return vehicle_number, option_type_ids
+        resolved: Dict[int, tuple[str, list[str]]] = {}
+        for rent_id, usage_entries in entries_by_rent.items():
+            vehicle_number = ""
+            option_type_names: list[str] = []
+
+            for entry in usage_entries:
+                if entry.item_type_id == ItemType.VEHICLE.ID:
+                    vehicle = vehicles.get(entry.item_id)
+                    if not vehicle:
+                        raise NotFoundError(
+                            message="Vehicle not found",
+                            detail={"vehicle_id": entry.item_id}
+                        )
+                    vehicle_number = vehicle.vehicle_number
+                elif entry.item_type_id == ItemType.OPTION.ID:
+                    option = options.get(entry.item_id)
+                    if not option:
+                        raise DatabaseError(
+                            message="Option not found",
+                            detail={"option_id": entry.item_id}
+                        )
+                    if not option.option_type_id:
+                        raise DatabaseError(
+                            message="Option type ID is required",
+                            detail={"option_id": entry.item_id}
+                        )
+                    option_type_name = option_type_crud.get_option_name_by_id(session, option.option_type_id)
+                    if option_type_name is None:
+                        raise DatabaseError(
+                            message="Option type not found",
+                            detail={"option_id": entry.item_id, "option_type_id": option.option_type_id}
+                        )
+                    option_type_names.append(option_type_name)
+
+            resolved[rent_id] = (vehicle_number, option_type_names)
+        return resolved
 
     @staticmethod
     def _create_rent_history_item(rent: RentHistory, vehicle_number: str, option_type_ids: list[str]) -> RentHistoryItem:
@@ -84,19 +95,25 @@ class RentHistoryService:
         )
 
     @staticmethod
-    def get_rent_history(session: Session, page: int = 1, page_size: int = 10) -> RentHistoryResponse:
+    def get_rent_history(
+        session: Session,
+        page: int = 1,
+        page_size: int = 10,
+        after: Optional[str] = None,
+        include_total: bool = True
+    ) -> RentHistoryResponse:
         """렌트 히스토리 조회"""
-        paginated_result = rent_history_crud.paginate(session, page, page_size)
+        paginated_result = rent_history_crud.paginate(
+            session, page, page_size, after=after, include_total=include_total
+        )
         
-        rent_history_items: list[RentHistoryItem] = []
-        for rent in paginated_result["items"]:
-            if not isinstance(rent.rent_id, int):
-                continue
+        rents = [rent for rent in paginated_result["items"] if isinstance(rent.rent_id, int)]
+        usage_by_rent = RentHistoryService._resolve_usage_entries(session, [cast(int, rent.rent_id) for rent in rents])
 
-            vehicle_number, option_type_ids = RentHistoryService._process_usage_entries(session, rent.rent_id)
-            rent_history_items.append(
-                RentHistoryService._create_rent_history_item(rent, vehicle_number, option_type_ids)
-            )
+        rent_history_items: list[RentHistoryItem] = [
+            RentHistoryService._create_rent_history_item(rent, *usage_by_rent[cast(int, rent.rent_id)])
+            for rent in rents
+        ]
 
         return RentHistoryResponse.success(
             data=RentHistoryData(
@@ -106,6 +123,22 @@ class RentHistoryService:
             message="Rent logs retrieved successfully"
         )
 
+    @staticmethod
+    def export_rent_history(session: Session) -> Iterator[List[RentHistoryItem]]:
+        """렌트 히스토리 전체를 배치 단위로 반환합니다. (배치마다 사용 기록/차량/옵션을 일괄 조회)
+
+        스트리밍 응답은 요청 의존성이 정리된 뒤에도 이어지므로, 같은 엔진에 별도 세션을 열고 내보내기가 끝나면 닫습니다.
+        """
+        with Session(session.get_bind()) as export_session:
+            for rents in rent_history_crud.iter_batches(export_session, batch_size=EXPORT_BATCH_SIZE):
+                usage_by_rent = RentHistoryService._resolve_usage_entries(
+                    export_session, [cast(int, rent.rent_id) for rent in rents]
+                )
+                yield [
+                    RentHistoryService._create_rent_history_item(rent, *usage_by_rent[cast(int, rent.rent_id)])
+                    for rent in rents
+                ]
+
     @staticmethod
     def get_rent_videos(session: Session, rent_id: int, video_type_id: int) -> RentVideoResponse:
         """특정 대여(rent_id)에 대한 영상을 조회합니다."""
@@ -1,6 +1,9 @@
+from typing import Iterator, List, Optional
 from sqlmodel import Session
 from app.db.crud.usage_history import usage_history_crud
+from app.db.models.usage_history import UsageHistory
 from app.utils.lut_constants import ItemType, UsageStatus
+from app.utils.export import EXPORT_BATCH_SIZE
 from app.api.schemas.admin.usage_history_schema import (
     UsageHistoryGetResponse,
     UsageHistoryData,
@@ -9,28 +12,39 @@ from app.api.schemas.admin.usage_history_schema import (
 
 
 class UsageHistoryService:
+
+    @staticmethod
+    def _to_item(history: UsageHistory) -> UsageHistoryItem:
+        """사용 기록을 응답 항목으로 변환합니다."""
+        return UsageHistoryItem(
+            usage_id=history.usage_id,
+            rent_id=history.rent_id,
+            item_id=history.item_id,
+            item_type_name=ItemType.get_name(history.item_type_id),
+            usage_status_name=UsageStatus.get_name(history.usage_status_id),
+            created_at=history.created_at,
+            updated_at=history.updated_at
+        )
   
     @staticmethod
-    def get_usage_history(session: Session, page: int, page_size: int) -> UsageHistoryGetResponse:
+    def get_usage_history(
+        session: Session,
+        page: int,
+        page_size: int,
+        after: Optional[str] = None,
+        include_total: bool = True
+    ) -> UsageHistoryGetResponse:
         """사용 이력 데이터를 조회합니다."""
 
-        query_result = usage_history_crud.get_list(session, page=page, page_size=page_size, include_deleted=True)
+        query_result = usage_history_crud.get_list(
+            session, page=page, page_size=page_size, include_deleted=True,
+            after=after, include_total=include_total
+        )
         history_list = query_result["items"]
         pagination = query_result["pagination"]
         
         # DB 레코드를 스키마 항목으로 매핑
-        usage_history_items = [
-            UsageHistoryItem(
-                usage_id=history.usage_id,
-                rent_id=history.rent_id,
-                item_id=history.item_id,
-                item_type_name=ItemType.get_name(history.item_type_id),
-                usage_status_name=UsageStatus.get_name(history.usage_status_id),
-                created_at=history.created_at,
-                updated_at=history.updated_at
-            )
-            for history in history_list
-        ]
+        usage_history_items = [UsageHistoryService._to_item(history) for history in history_list]
 
        
         return UsageHistoryGetResponse(
@@ -40,4 +54,12 @@ class UsageHistoryService:
                 usage_history=usage_history_items,
                 pagination=pagination
             )
-        ) 
\ No newline at end of file
+        )
+
+    @staticmethod
+    def export_usage_history(session: Session) -> Iterator[List[UsageHistoryItem]]:
+        """사용 이력 전체를 배치 단위로 반환합니다. (내보내기가 끝나면 닫히는 별도 세션 사용)"""
+        with Session(session.get_bind()) as export_session:
+            query = usage_history_crud.build_list_query(include_deleted=True)
+            for histories in usage_history_crud.iter_batches(export_session, query, EXPORT_BATCH_SIZE):
+                yield [UsageHistoryService._to_item(history) for history in histories]
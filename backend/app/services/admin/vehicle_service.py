@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 from sqlmodel import Session
 from app.api.schemas.admin.vehicle_schema import VehicleItem, VehiclesData, VehicleGetResponse, VehicleCreateRequest, VehicleUpdateRequest, VehicleMessageResponse
 from app.db.crud.vehicle import vehicle_crud
@@ -8,6 +8,7 @@ from app.api.schemas.common import Coordinate
 from app.db.models.vehicle import Vehicle
 from app.utils.exceptions import DatabaseError, ConflictError, NotFoundError
 from app.utils.handle_transaction import handle_transaction
+from app.core.response_cache import DashboardCacheTag, dashboard_cache
 from datetime import datetime
 from app.utils.lut_constants import ItemStatus, ItemType, UsageStatus, MaintenanceStatus
 
@@ -93,11 +94,19 @@ class VehicleService:
             )
             
     @staticmethod
-    def get_vehicle_list(session: Session, page: int, page_size: int) -> VehicleGetResponse:
+    def get_vehicle_list(
+        session: Session,
+        page: int,
+        page_size: int,
+        after: Optional[str] = None,
+        include_total: bool = True
+    ) -> VehicleGetResponse:
         "관리자 차량 목록 조회 서비스"
         
         # 차량 목록 조회
-        paginated_result = vehicle_crud.paginate(session, page, page_size)
+        paginated_result = vehicle_crud.paginate(
+            session, page, page_size, after=after, include_total=include_total
+        )
         vehicles: List[Vehicle] = paginated_result["items"]
         
         # 차량 데이터 변환
@@ -143,6 +152,7 @@ class VehicleService:
         )
 
         vehicle_crud.create(session, new_vehicle)
+        dashboard_cache.invalidate_on_commit(session, DashboardCacheTag.ITEMS)
         return VehicleMessageResponse.success(
             message="Vehicle registered successfully"
         )
@@ -164,6 +174,7 @@ class VehicleService:
         update_data["updated_at"] = datetime.now()
 
         vehicle_crud.update(session, vehicle_id, update_data, "vehicle_id")
+        dashboard_cache.invalidate_on_commit(session, DashboardCacheTag.ITEMS)
         return VehicleMessageResponse.success(
             message="Vehicle updated successfully"
         )
@@ -176,6 +187,7 @@ class VehicleService:
         VehicleService._validate_vehicle(session, vehicle_id)
 
         vehicle_crud.soft_delete(session, vehicle_id, "vehicle_id")
+        dashboard_cache.invalidate_on_commit(session, DashboardCacheTag.ITEMS)
         return VehicleMessageResponse.success(
             message="Vehicle deleted successfully"
         )   
@@ -147,6 +147,7 @@ class AuthService:
             ) 
 
         jwt_handler.delete_refresh_token(user_pk, role_name)
+        jwt_handler.revoke_cached_tokens(user_pk, role_name)
         return auth_schema.LogoutResponse.success(
             message="Successfully logged out"
         )
\ No newline at end of file
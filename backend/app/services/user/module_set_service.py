@@ -1,14 +1,14 @@
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import List, Tuple
 from app.db.models.module_set import ModuleSet
 from app.db.models.option_type import OptionType
 from app.db.models.module_set_option_types import ModuleSetOptionTypes
-from app.db.crud.module_set import module_set_crud
+from app.db.crud.module_set import module_set_crud, async_module_set_crud
 from app.db.crud.module_set_option_type import module_set_option_type_crud
 from app.db.crud.option_type import option_type_crud
-from app.db.crud.lut import module_type
 from app.api.schemas.user import module_set_schema
-from app.utils.handle_transaction import handle_transaction
+from app.utils.handle_transaction import async_handle_transaction
 from app.utils.exceptions import (
     DatabaseError, 
 )
@@ -34,19 +34,22 @@ class ModuleSetService:
         return module_set_option_types
 
     @staticmethod
-    @handle_transaction
-    def get_all_module_sets(session: Session, page: int = 1, page_size: int = 10) -> module_set_schema.ModuleSetsResponse:
+    @async_handle_transaction
+    async def get_all_module_sets(session: AsyncSession, page: int = 1, page_size: int = 10) -> module_set_schema.ModuleSetsResponse:
 
         """ ✅ 모든 모듈 세트 목록을 조회하고, 옵션 타입 정보를 함께 반환합니다. """
 
         # ✅ 페이지네이션 적용하여 모듈 세트 조회
-        paginated_result = module_set_crud.paginate(session, page, page_size)
+        paginated_result = await async_module_set_crud.paginate(session, page, page_size)
         module_sets: List[ModuleSet] = paginated_result["items"]
 
         module_sets_data: List[module_set_schema.ModuleSet] = []
         
-        module_type_list = module_type.get_all(session)
-        module_type_dict = {module_type.module_type_id: module_type for module_type in module_type_list}
+        # ✅ 페이지 내 모듈 세트 가격 및 옵션 타입을 한 번의 조인 쿼리로 계산
+        pricing = await session.run_sync(
+            module_set_crud.calculate_base_prices,
+            [module_set.module_set_id for module_set in module_sets if module_set.module_set_id is not None]
+        )
         
         for module_set in module_sets:            
             if module_set.module_set_id is None:
@@ -55,16 +58,24 @@ class ModuleSetService:
                     detail={"module_set": module_set.dict(exclude={"created_at", "updated_at", "deleted_at"})}
                 )
 
-            module_type_info = module_type_dict.get(module_set.module_type_id)
-            if module_type_info is None:
+            module_set_pricing = pricing.get(module_set.module_set_id)
+            if module_set_pricing is None:
                 raise DatabaseError(
                     message="ModuleType ID not found",
                     detail={"module_type_id": module_set.module_type_id}
                 )
+            module_type_info = module_set_pricing["module_type"]
 
-            module_set_option_types = ModuleSetService.get_option_types(session, module_set.module_set_id)
+            module_set_option_types = [
+                module_set_schema.ModuleSetOptionType(
+                    optionTypeId=option_type_id,
+                    optionTypeName=option_type_name,
+                    quantity=quantity or 1 # `None`일 경우 기본값 `1`
+                )
+                for option_type_id, option_type_name, quantity in module_set_pricing["option_types"]
+            ]
 
-            base_price = module_set_crud.calculate_base_price(session, module_set.module_set_id)
+            base_price = module_set_pricing["base_price"]
             
             # datetime 필드를 제외하고 필요한 필드만 응답 모델로 변환
             module_sets_data.append(
@@ -1,12 +1,11 @@
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import List
 from app.db.models.option_type import OptionType 
-from app.db.crud.option_type import option_type_crud
+from app.db.crud.option_type import async_option_type_crud
 from app.api.schemas.user import option_type_schema
 from app.utils.exceptions import NotFoundError, ValidationError
-from app.utils.handle_transaction import handle_transaction
-from app.db.crud.option import option_crud
-from app.utils.lut_constants import ItemStatus
+from app.utils.handle_transaction import async_handle_transaction
+from app.db.crud.option_stock import option_stock_crud
 
 class OptionTypeServiceUtils:
 
@@ -68,18 +67,24 @@ class OptionTypeService:
     """ 🎯 옵션 타입 조회 서비스 """
 
     @staticmethod
-    @handle_transaction
-    def get_all_option_types(session: Session, page: int = 1, page_size: int = 10) -> option_type_schema.OptionTypesResponse:
+    @async_handle_transaction
+    async def get_all_option_types(session: AsyncSession, page: int = 1, page_size: int = 10) -> option_type_schema.OptionTypesResponse:
         """ ✅ 옵션 타입 목록 조회 (페이지네이션 적용) """
         
-        paginated_result = option_type_crud.paginate(session, page, page_size)
+        paginated_result = await async_option_type_crud.paginate(session, page, page_size)
         option_types: List[OptionType] = paginated_result["items"]
 
 
+        # 페이지 내 옵션 타입의 재고를 한 번에 조회
+        stock_quantities = await session.run_sync(
+            option_stock_crud.get_quantities,
+            [opt_type.option_type_id for opt_type in option_types if opt_type.option_type_id is not None]
+        )
+
         option_types_data = [
             OptionTypeServiceUtils.convert_to_schema(
                 opt_type,
-                len(option_crud.get_available_options_by_type(session, opt_type.option_type_id, ItemStatus.INACTIVE.ID))
+                stock_quantities.get(opt_type.option_type_id, 0)
             )
             for opt_type in option_types
         ]
@@ -94,8 +99,8 @@ class OptionTypeService:
         )
 
     @staticmethod
-    @handle_transaction
-    def get_option_type_by_id(session: Session, option_type_id: int) -> option_type_schema.OptionTypesResponse:
+    @async_handle_transaction
+    async def get_option_type_by_id(session: AsyncSession, option_type_id: int) -> option_type_schema.OptionTypesResponse:
         """ ✅ 특정 옵션 타입 조회 """
         if option_type_id <= 0:
             raise ValidationError(
@@ -103,16 +108,17 @@ class OptionTypeService:
                 detail={"option_type_id": option_type_id}
             )
         
-        option_type = option_type_crud.get_by_field(session, option_type_id, "option_type_id")
+        option_type = await async_option_type_crud.get_by_field(session, option_type_id, "option_type_id")
         if option_type is None:
             raise NotFoundError(
                 message="Option type not found",    
                 detail={"option_type_id": option_type_id}
             )
             
+        stock_quantities = await session.run_sync(option_stock_crud.get_quantities, [option_type_id])
         option_type_data = OptionTypeServiceUtils.convert_to_schema(
             option_type,
-            len(option_crud.get_available_options_by_type(session, option_type.option_type_id, ItemStatus.INACTIVE.ID))
+            stock_quantities[option_type_id]
         )
 
         return option_type_schema.OptionTypesResponse(
@@ -0,0 +1,155 @@
+from datetime import datetime
+from typing import Any, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+import math
+import threading
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api.schemas.user import rent_schema
+from app.db.crud.lut import module_type as module_type_crud
+from app.db.crud.option_type import option_type_crud
+from app.utils.exceptions import NotFoundError
+
+
+class CostTable(NamedTuple):
+    """모듈 타입/옵션 타입별 비용표 (옵션 타입 카탈로그 version 기준)"""
+    version: int
+    module_type_costs: Mapping[int, int]
+    option_type_costs: Mapping[int, int]
+
+
+class RentQuote(NamedTuple):
+    module_type_cost: int
+    option_cost: int
+    date_cost: int
+    total_cost: int
+
+
+class RentQuoteEngine:
+    """렌트 견적 엔진.
+
+    모듈 타입(LUT 캐시)과 옵션 타입(카탈로그) 비용을 비용표로 미리 계산해 두고, 견적은 비용표만으로 계산합니다.
+    옵션 타입이 변경되어 카탈로그 version이 바뀌면 다음 견적에서 비용표를 다시 만듭니다.
+    견적 API와 렌트 생성 시 비용 검증이 모두 이 엔진을 사용합니다.
+    """
+    # 최소 대여 시간
+    MIN_HOURS = 6
+    # 시간 당 이용료
+    HOURLY_RATE = 10000
+
+    def __init__(self):
+        self._table: Optional[CostTable] = None
+        self._module_source: Optional[Mapping[int, Any]] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def date_cost(rent_start: datetime, rent_end: datetime) -> int:
+        """대여 기간 비용을 계산합니다. (최소 대여 시간 적용, 시간 단위 올림)"""
+        total_hours = (rent_end - rent_start).total_seconds() / 3600
+        billable_hours = max(total_hours, RentQuoteEngine.MIN_HOURS)
+        return int(math.ceil(billable_hours) * RentQuoteEngine.HOURLY_RATE)
+
+    def cost_table(self, session: Session) -> CostTable:
+        """현재 비용표를 반환합니다. 카탈로그 version이나 LUT 스냅샷이 바뀌었으면 다시 계산합니다."""
+        version = option_type_crud.catalog.version
+        module_source = module_type_crud.snapshot(session)
+        table = self._table
+        if table is not None and table.version == version and self._module_source is module_source:
+            return table
+
+        table = CostTable(
+            version=version,
+            module_type_costs={
+                module_type_id: int(row.module_type_cost) for module_type_id, row in module_source.items()
+            },
+            option_type_costs={
+                option_type_id: int(entry.option_type_cost)
+                for option_type_id, entry in option_type_crud.catalog.snapshot(session).items()
+            }
+        )
+        with self._lock:
+            # 계산 중 카탈로그가 바뀌었다면 저장하지 않음
+            if option_type_crud.catalog.version == version:
+                self._table = table
+                self._module_source = module_source
+        return table
+
+    @staticmethod
+    def price(
+        table: CostTable,
+        module_type_id: int,
+        selected_option_types: Sequence[rent_schema.SelectedOptionType],
+        rent_start: datetime,
+        rent_end: datetime
+    ) -> RentQuote:
+        """비용표로 견적 한 건을 계산합니다."""
+        module_type_cost = table.module_type_costs.get(module_type_id)
+        if module_type_cost is None:
+            raise NotFoundError(
+                message="Module type not found",
+                detail={"module_type_id": module_type_id}
+            )
+        option_cost = 0
+        for opt_type in selected_option_types:
+            unit_cost = table.option_type_costs.get(opt_type.optionTypeId)
+            if unit_cost is None:
+                raise NotFoundError(
+                    message="Option type not found",
+                    detail={"option_type_id": opt_type.optionTypeId}
+                )
+            option_cost += unit_cost * opt_type.quantity
+        date_cost = RentQuoteEngine.date_cost(rent_start, rent_end)
+        return RentQuote(
+            module_type_cost=module_type_cost,
+            option_cost=option_cost,
+            date_cost=date_cost,
+            total_cost=module_type_cost + option_cost + date_cost
+        )
+
+    def quote(
+        self,
+        session: Session,
+        module_type_id: int,
+        selected_option_types: Sequence[rent_schema.SelectedOptionType],
+        rent_start: datetime,
+        rent_end: datetime
+    ) -> RentQuote:
+        """견적 한 건을 계산합니다."""
+        return self.price(self.cost_table(session), module_type_id, selected_option_types, rent_start, rent_end)
+
+    def quote_many(self, session: Session, items: Sequence[rent_schema.RentQuoteItem]) -> Tuple[int, List[RentQuote]]:
+        """같은 비용표로 여러 견적을 계산하고 (비용표 version, 견적 목록)을 반환합니다."""
+        table = self.cost_table(session)
+        return table.version, [
+            self.price(table, item.moduleTypeId, item.selectedOptionTypes, item.rentStartDate, item.rentEndDate)
+            for item in items
+        ]
+
+
+quote_engine = RentQuoteEngine()
+
+
+class QuoteService:
+
+    @staticmethod
+    async def get_quotes(
+        session: AsyncSession,
+        quote_request: rent_schema.RentQuoteRequest
+    ) -> rent_schema.RentQuoteResponse:
+        """여러 (모듈 타입, 옵션, 기간) 조합의 견적을 한 번에 계산합니다."""
+        version, quotes = await session.run_sync(quote_engine.quote_many, quote_request.quotes)
+        return rent_schema.RentQuoteResponse.success(
+            message="Rent quotes calculated successfully",
+            data=rent_schema.RentQuoteResponseData(
+                catalogVersion=version,
+                quotes=[
+                    rent_schema.RentQuoteResponseItem(
+                        moduleTypeCost=quote.module_type_cost,
+                        optionCost=quote.option_cost,
+                        dateCost=quote.date_cost,
+                        totalCost=quote.total_cost
+                    )
+                    for quote in quotes
+                ]
+            )
+        )
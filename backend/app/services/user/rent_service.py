@@ -1,41 +1,41 @@
 from datetime import datetime, timedelta
-from typing import List, Tuple
+from typing import Any, Dict, List, Tuple
+import asyncio
 import json
-import math
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.db.models.module import Module
 from app.db.models.option import Option
 from app.db.models.rent_history import RentHistory
+from app.db.models.usage_history import UsageHistory
 from app.api.schemas.user import rent_schema
 from app.utils.exceptions import BadRequestError, ConflictError, ForbiddenError, NotFoundError, DatabaseError
-from app.utils.handle_transaction import handle_transaction
-from app.db.crud.rent_history import rent_history_crud
+from app.utils.handle_transaction import async_handle_transaction
+from app.core.response_cache import DashboardCacheTag, dashboard_cache
+from app.db.crud.rent_history import async_rent_history_crud
 from app.db.crud.vehicle import vehicle_crud
 from app.db.crud.module import module_crud
 from app.db.crud.option import option_crud
 from app.db.crud.usage_history import usage_history_crud
+from app.db.crud.stats_rollup import rent_daily_stat_crud, option_usage_daily_stat_crud
 from app.utils.lut_constants import ItemType, ItemStatus, RentStatus, UsageStatus
-from app.db.crud.lut import module_type as module_type_crud
-from app.db.crud.option_type import option_type_crud
-from app.core.redis import redis_handler
+from app.core.vehicle_presence import vehicle_presence
+from app.services.user.quote_service import RentQuoteEngine, quote_engine
 from app.websocket.websocket import WebSocketService
 
 class RentService:
     # 최소 대여 시간
-    MIN_HOURS = 6
+    MIN_HOURS = RentQuoteEngine.MIN_HOURS
     # 시간 당 이용료
-    HOURLY_RATE = 10000
+    HOURLY_RATE = RentQuoteEngine.HOURLY_RATE
+    # 아이템 선점 최대 시도 횟수 / 재시도 간격(초)
+    CLAIM_MAX_ATTEMPTS = 3
+    CLAIM_RETRY_DELAY = 0.02
   
     @staticmethod
     def calculate_rental_cost(rent_start: datetime, rent_end: datetime) -> int:
-        total_seconds = (rent_end - rent_start).total_seconds()
-        total_hours = total_seconds / 3600
-
-        # 최소 대여 시간 적용
-        billable_hours = max(total_hours, RentService.MIN_HOURS)
-        cost = math.ceil(billable_hours) * RentService.HOURLY_RATE
-        
-        return int(cost)
+        return RentQuoteEngine.date_cost(rent_start, rent_end)
 
     @staticmethod
     def get_options_for_rent(
@@ -104,32 +104,49 @@ class RentService:
             )
 
     @staticmethod
-    def _activate_items(
+    def _set_items_status(
         session: Session,
-        vehicle,
-        module,
-        options: List[Option]
+        vehicle_id: int,
+        module_id: int,
+        option_ids: List[int],
+        item_status_id: int
     ) -> None:
-        """렌트 시작 시 아이템의 상태를 ACTIVE로 업데이트합니다."""
-        vehicle_crud.update(
-            session,
-            vehicle.vehicle_id,
-            {"item_status_id": ItemStatus.ACTIVE.ID},
-            id_field="vehicle_id"
-        )
-        module_crud.update(
-            session,
-            module.module_id,
-            {"item_status_id": ItemStatus.ACTIVE.ID},
-            id_field="module_id"
+        """차량/모듈/옵션의 상태를 아이템 종류별 UPDATE 한 번씩으로 변경합니다. (옵션 수와 무관한 쿼리 수)"""
+        vehicle_crud.bulk_update(session, [vehicle_id], {"item_status_id": item_status_id}, id_field="vehicle_id")
+        module_crud.bulk_update(session, [module_id], {"item_status_id": item_status_id}, id_field="module_id")
+        option_crud.bulk_update(session, option_ids, {"item_status_id": item_status_id}, id_field="option_id")
+
+    @staticmethod
+    async def _claim_items(
+        session: AsyncSession,
+        crud,
+        filters: Dict[str, Any],
+        count: int,
+        item_name: str
+    ) -> List[Any]:
+        """
+        조건에 맞는 INACTIVE 아이템 count개를 원자적으로 선점하여 ACTIVE로 변경합니다.
+
+        PostgreSQL에서는 다른 트랜잭션이 잠근 행을 건너뛰므로(SKIP LOCKED), 부족하면 잠시 후 부족분만 다시 선점합니다.
+        SQLite는 쓰기가 직렬화되어 부족분이 곧 재고 부족이므로 재시도하지 않습니다.
+
+        Raises:
+            NotFoundError: 재시도 후에도 선점한 아이템이 부족한 경우.
+        """
+        filters = {**filters, "item_status_id": ItemStatus.INACTIVE.ID}
+        values = {"item_status_id": ItemStatus.ACTIVE.ID}
+        max_attempts = 1 if session.get_bind().dialect.name == "sqlite" else RentService.CLAIM_MAX_ATTEMPTS
+        claimed: List[Any] = []
+        for attempt in range(max_attempts):
+            if attempt:
+                await asyncio.sleep(RentService.CLAIM_RETRY_DELAY * attempt)
+            claimed += await session.run_sync(crud.claim, filters, values, count - len(claimed))
+            if len(claimed) == count:
+                return claimed
+        raise NotFoundError(
+            message=f"No available {item_name} found",
+            detail={**filters, "required": count, "available": len(claimed)}
         )
-        for option in options:
-            option_crud.update(
-                session,
-                option.option_id,
-                {"item_status_id": ItemStatus.ACTIVE.ID},
-                id_field="option_id"
-            )
 
     @staticmethod
     def _deactivate_items(
@@ -139,29 +156,11 @@ class RentService:
         option_ids: List[int]
     ) -> None:
         """렌트 취소/완료 시 아이템의 상태를 INACTIVE로 업데이트합니다."""
-        vehicle_crud.update(
-            session,
-            vehicle_id,
-            {"item_status_id": ItemStatus.INACTIVE.ID},
-            id_field="vehicle_id"
-        )
-        module_crud.update(
-            session,
-            module_id,
-            {"item_status_id": ItemStatus.INACTIVE.ID},
-            id_field="module_id"
-        )
-        for option_id in option_ids:
-            option_crud.update(
-                session,
-                option_id,
-                {"item_status_id": ItemStatus.INACTIVE.ID},
-                id_field="option_id"
-            )
+        RentService._set_items_status(session, vehicle_id, module_id, option_ids, ItemStatus.INACTIVE.ID)
 
     @staticmethod
-    def _validate_rent_history(
-        session: Session,
+    async def _validate_rent_history(
+        session: AsyncSession,
         rent_id: int,
         user_pk: int,
         check_status: bool = True
@@ -181,7 +180,7 @@ class RentService:
         Raises:
             NotFoundError, ForbiddenError, ConflictError
         """
-        rent_history = rent_history_crud.get_by_id(session, rent_id)
+        rent_history = await async_rent_history_crud.get_by_field(session, rent_id, "rent_id")
         if not rent_history:
             raise NotFoundError(
                 message="Rent history not found",
@@ -239,62 +238,74 @@ class RentService:
         return vehicle_id, module_id, option_ids
 
     @staticmethod
-    @handle_transaction
-    def create_rent(
-        session: Session, 
+    def _verify_rent_cost(
+        session: Session,
+        rent_request: rent_schema.RentRequest
+    ) -> None:
+        """요청된 비용이 견적 엔진이 계산한 모듈 타입/옵션/대여 기간 비용의 합과 일치하는지 검증합니다."""
+        quote = quote_engine.quote(
+            session,
+            rent_request.moduleTypeId,
+            rent_request.selectedOptionTypes,
+            rent_request.rentStartDate,
+            rent_request.rentEndDate
+        )
+        if rent_request.cost != quote.total_cost:
+            raise BadRequestError(
+                message="Invalid cost",
+                detail=quote._asdict()
+            )
+
+    @staticmethod
+    def _record_rent_stats(
+        session: Session,
+        rent_history: RentHistory,
+        module: Module,
+        selected_options: List[Option],
+        usage_entries: List[UsageHistory]
+    ) -> None:
+        """새 렌트를 일별 렌트 집계와 옵션 사용 집계에 반영합니다."""
+        rent_daily_stat_crud.record(session, rent_history, module.module_type_id)
+        option_entry = next((entry for entry in usage_entries if entry.item_type_id == ItemType.OPTION.ID), None)
+        if option_entry is not None:
+            option_usage_daily_stat_crud.record(session, option_entry.created_at, selected_options)
+
+    @staticmethod
+    @async_handle_transaction
+    async def create_rent(
+        session: AsyncSession, 
         rent_request: rent_schema.RentRequest, 
         user_pk: int
     ) -> rent_schema.RentResponse:
         """새로운 렌트 프로세스를 생성합니다."""
-        # 차량 및 모듈 가용성 검증
-        vehicle = vehicle_crud.get_first_available_vehicle(session)
-        module = module_crud.get_module_by_module_type(session, rent_request.moduleTypeId)
+        # 1. 가격 검증 (조회만 수행하므로 아이템 선점 전에 처리)
+        await session.run_sync(RentService._verify_rent_cost, rent_request)
+
+        # 2. 차량 및 모듈 선점 (조회와 상태 변경을 UPDATE ... RETURNING 한 번으로 처리)
+        [vehicle] = await RentService._claim_items(session, vehicle_crud, {}, 1, "vehicle")
+        [module] = await RentService._claim_items(
+            session, module_crud, {"module_type_id": rent_request.moduleTypeId}, 1, "module"
+        )
         
-        # 차량 연결 상태 검증
-        vehicle_key = f"vehicle:{vehicle.vin}"
-        vehicle_status = redis_handler.get(vehicle_key)
-        if vehicle_status != "connected":
+        # 차량 연결 상태 검증 (이 프로세스에 연결된 차량은 Redis 조회 없이 확인)
+        if not await vehicle_presence.is_connected(vehicle.vin):
             raise ConflictError(message="차량이 네트워크에 연결되지 않았습니다.")
         
-        # 2. 선택된 옵션들을 검증 및 조회
+        # 3. 선택된 옵션 선점
         selected_options : List[Option] = []
         for opt_type in rent_request.selectedOptionTypes:
-            options = option_crud.get_available_options_by_type(
-                session=session,
-                option_type_id=opt_type.optionTypeId,
-                required_quantity=opt_type.quantity
+            selected_options += await RentService._claim_items(
+                session, option_crud, {"option_type_id": opt_type.optionTypeId}, opt_type.quantity, "option"
             )
-            selected_options.extend(options)
 
-        # 3. 가격 검증
-        module_type_cost = module_type_crud.get_by_id(session, rent_request.moduleTypeId).module_type_cost
-        option_cost = sum(option_type_crud.get_option_cost_by_id(session, option.option_type_id) for option in selected_options)
-        date_cost = RentService.calculate_rental_cost(rent_request.rentStartDate, rent_request.rentEndDate)
-        
-        # 총 비용 검증
-        total_cost = module_type_cost + option_cost + date_cost
-        if rent_request.cost != total_cost:
-            raise BadRequestError(
-                message="Invalid cost",
-                detail={
-                    "module_type_cost": module_type_cost,
-                    "option_cost": option_cost,
-                    "date_cost": date_cost,
-                    "total_cost": total_cost
-                }
-            )
-
-        # 3. 렌트 기록 생성
-        rent_history = rent_history_crud.create(
+        # 4. 렌트 기록 생성
+        rent_history = await async_rent_history_crud.create(
             session,
-            RentService.create_rent_history(rent_request, user_pk, len(selected_options))
+            RentService.create_rent_history(rent_request, user_pk, len(selected_options)),
+            refresh=False
         )
-        session.refresh(rent_history)
         RentService._check_required_ids(rent_history, vehicle, module)
 
-        # 4. 아이템 상태 업데이트 (ACTIVE)
-        RentService._activate_items(session, vehicle, module, selected_options)
-
         # 5. 사용 기록 생성
         option_ids = [option.option_id for option in selected_options if option.option_id is not None]
         if len(option_ids) != len(selected_options):
@@ -319,16 +330,20 @@ class RentService:
                 detail={"module": module.dict()}
             )
 
-        usage_history_crud.create_usage_entries(
-            session=session,
+        usage_entries = await session.run_sync(
+            usage_history_crud.create_usage_entries,
             rent_id=rent_history.rent_id,
             vehicle_id=vehicle.vehicle_id,
             module_id=module.module_id,
             option_ids=option_ids
         )
+
+        # 6. 일별 통계 집계 반영
+        await session.run_sync(RentService._record_rent_stats, rent_history, module, selected_options, usage_entries)
         
         WebSocketService.trigger_send_rent_request_message(vehicle.vin, rent_history.rent_id, module.module_nfc_tag_id)
         
+        dashboard_cache.invalidate_on_commit(session, DashboardCacheTag.RENT, DashboardCacheTag.ITEMS)
         return rent_schema.RentResponse(
             data=rent_schema.RentResponseData(
                 rent_id=rent_history.rent_id,
@@ -337,43 +352,37 @@ class RentService:
         )
 
     @staticmethod
-    @handle_transaction
-    def cancel_rent(
-        session: Session, 
+    @async_handle_transaction
+    async def cancel_rent(
+        session: AsyncSession, 
         rent_id: int, 
         user_pk: int
     ) -> rent_schema.CancelRentResponse:
         """진행 중인 렌트를 취소합니다."""
         # 1. 렌트 기록 및 사용자 권한 검증
-        rent_history = RentService._validate_rent_history(session, rent_id, user_pk)
+        rent_history = await RentService._validate_rent_history(session, rent_id, user_pk)
         
         # 2. 사용 기록에서 아이템 ID 추출
-        usage_entries = usage_history_crud.get_usage_entries(session, rent_id)
+        usage_entries = await session.run_sync(usage_history_crud.get_usage_entries, rent_id)
         vehicle_id, module_id, option_ids = RentService._extract_usage_ids(usage_entries)
 
         # 3. 사용 기록 및 아이템 상태 업데이트 (비활성화)
-        usage_history_crud.update_usage_entries_status(
-            session,
-            rent_id,
-            vehicle_id,
-            module_id,
-            option_ids,
-            UsageStatus.COMPLETED.ID
-        )
-        RentService._deactivate_items(session, vehicle_id, module_id, option_ids)
+        await session.run_sync(usage_history_crud.update_status_by_rent_id, rent_id, UsageStatus.COMPLETED.ID)
+        await session.run_sync(RentService._deactivate_items, vehicle_id, module_id, option_ids)
 
         # 4. 렌트 상태 업데이트 (CANCELED)
-        rent_history_crud.update(
+        await async_rent_history_crud.update(
             session,
             rent_id,
             obj_in={"rent_status_id": RentStatus.CANCELED.ID},
             id_field="rent_id"
         )
         
-        vehicle = vehicle_crud.get_by_id(session, vehicle_id)
-        module = module_crud.get_by_id(session, module_id)
+        vehicle = await session.run_sync(vehicle_crud.get_by_id, vehicle_id)
+        module = await session.run_sync(module_crud.get_by_id, module_id)
         WebSocketService.trigger_send_return_message(vehicle.vin, rent_id, module.module_nfc_tag_id)
         
+        dashboard_cache.invalidate_on_commit(session, DashboardCacheTag.RENT, DashboardCacheTag.ITEMS)
         return rent_schema.CancelRentResponse(
             message="Rent canceled successfully",
             data=rent_schema.CancelRentResponseData(
@@ -382,14 +391,14 @@ class RentService:
         )
 
     @staticmethod
-    def get_rent_status(
-        session: Session,
+    async def get_rent_status(
+        session: AsyncSession,
         rent_id: int,
         user_pk: int
     ) -> rent_schema.RentStatusResponse:
         """진행 중인 렌트의 상태 정보를 조회합니다."""
         # 렌트 기록 및 사용자 권한 검증
-        rent_history = RentService._validate_rent_history(session, rent_id, user_pk)
+        rent_history = await RentService._validate_rent_history(session, rent_id, user_pk)
         
         # 예시를 위한 더미 데이터 구성
         current_location = rent_schema.Coordinate(x=12.3123, y=32.3232)
@@ -424,30 +433,23 @@ class RentService:
         )
 
     @staticmethod
-    @handle_transaction
-    def complete_rent(
-        session: Session,
+    @async_handle_transaction
+    async def complete_rent(
+        session: AsyncSession,
         rent_id: int,
         user_pk: int
     ) -> rent_schema.CompleteRentResponse:
         """진행 중인 렌트를 완료합니다."""
         # 1. 렌트 기록 및 사용자 권한 검증
-        rent_history = RentService._validate_rent_history(session, rent_id, user_pk)
+        rent_history = await RentService._validate_rent_history(session, rent_id, user_pk)
         
         # 2. 사용 기록에서 아이템 ID 추출
-        usage_entries = usage_history_crud.get_usage_entries(session, rent_id)
+        usage_entries = await session.run_sync(usage_history_crud.get_usage_entries, rent_id)
         vehicle_id, module_id, option_ids = RentService._extract_usage_ids(usage_entries)
 
         # 3. 사용 기록 및 아이템 상태 업데이트 (비활성화)
-        usage_history_crud.update_usage_entries_status(
-            session,
-            rent_id,
-            vehicle_id,
-            module_id,
-            option_ids,
-            UsageStatus.COMPLETED.ID
-        )
-        RentService._deactivate_items(session, vehicle_id, module_id, option_ids)
+        await session.run_sync(usage_history_crud.update_status_by_rent_id, rent_id, UsageStatus.COMPLETED.ID)
+        await session.run_sync(RentService._deactivate_items, vehicle_id, module_id, option_ids)
 
         # 4. 사용 기간, 주행 거리 및 페이백 계산
         usage_duration = int((datetime.now() - rent_history.created_at).total_seconds() / 60)
@@ -455,7 +457,7 @@ class RentService:
         estimated_payback = rent_history.cost * 0.05  # TODO: 실제 페이백 계산 로직 구현
 
         # 5. 렌트 기록 업데이트 (COMPLETED)
-        rent_history_crud.update(
+        await async_rent_history_crud.update(
             session,
             rent_id,
             obj_in={
@@ -466,10 +468,11 @@ class RentService:
             id_field="rent_id"
         )
         
-        vehicle = vehicle_crud.get_by_id(session, vehicle_id)
-        module = module_crud.get_by_id(session, module_id)
+        vehicle = await session.run_sync(vehicle_crud.get_by_id, vehicle_id)
+        module = await session.run_sync(module_crud.get_by_id, module_id)
         WebSocketService.trigger_send_return_message(vehicle.vin, rent_id, module.module_nfc_tag_id)
         
+        dashboard_cache.invalidate_on_commit(session, DashboardCacheTag.RENT, DashboardCacheTag.ITEMS)
         return rent_schema.CompleteRentResponse(
             message="Rental completed successfully",
             data=rent_schema.CompleteRentResponseData(
@@ -1,5 +1,5 @@
 from fastapi import HTTPException
-from fastapi.responses import JSONResponse
+from app.core.responses import APIResponse
 from fastapi.exceptions import RequestValidationError
 from app.api.schemas.common import ResponseBase
 from typing import Dict, Any, Optional
@@ -85,7 +85,7 @@ class ConfigError(InternalServerError):
 def get_exception_handlers():
     """전역 예외 처리기들 반환"""
     async def validation_exception_handler(request, exc: RequestValidationError):
-        return JSONResponse(
+        return APIResponse(
             status_code=422,
             content=ResponseBase(
                 resultCode="FAILURE",
@@ -98,13 +98,13 @@ def get_exception_handlers():
     async def http_exception_handler(request, exc: HTTPException):
         if isinstance(exc, BaseAPIException):
             # BaseAPIException은 이미 ResponseBase.error()를 사용중
-            return JSONResponse(
+            return APIResponse(
                 status_code=exc.status_code, 
                 content=exc.detail
             )
             
         # 일반 HTTPException의 경우
-        return JSONResponse(
+        return APIResponse(
             status_code=exc.status_code,
             content=ResponseBase.error(
                 error_code="HTTP_ERROR",
@@ -114,7 +114,7 @@ def get_exception_handlers():
 
     async def global_exception_handler(request, exc: Exception):
         """예상치 못한 예외 처리"""
-        return JSONResponse(
+        return APIResponse(
             status_code=500,
             content=ResponseBase.error(
                 error_code="INTERNAL_SERVER_ERROR",
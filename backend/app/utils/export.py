@@ -0,0 +1,69 @@
+import csv
+import io
+from datetime import datetime
+from enum import Enum
+from typing import Any, Iterable, Iterator, List, Type
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+# 서버 측 커서에서 한 번에 가져오는 행 수 (내보내기 메모리 사용량의 상한)
+EXPORT_BATCH_SIZE = 500
+
+
+class ExportFormat(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+_MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+    ExportFormat.NDJSON: "application/x-ndjson",
+}
+
+
+def _csv_value(value: Any) -> Any:
+    """CSV 셀 값으로 변환합니다. (중첩 모델은 JSON 문자열, 날짜는 ISO 8601)"""
+    if value is None:
+        return ""
+    if isinstance(value, BaseModel):
+        return value.json()
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def iter_export_chunks(
+    batches: Iterable[List[BaseModel]],
+    item_model: Type[BaseModel],
+    export_format: ExportFormat
+) -> Iterator[str]:
+    """항목 배치를 CSV/NDJSON 문자열 청크로 변환합니다. (배치 하나당 청크 하나, CSV는 헤더 먼저)"""
+    columns = list(item_model.__fields__)
+    if export_format == ExportFormat.CSV:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(columns)
+        yield buffer.getvalue()
+        for batch in batches:
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows([_csv_value(getattr(item, column)) for column in columns] for item in batch)
+            yield buffer.getvalue()
+    else:
+        for batch in batches:
+            yield "".join(item.json(ensure_ascii=False) + "\n" for item in batch)
+
+
+def export_response(
+    batches: Iterable[List[BaseModel]],
+    item_model: Type[BaseModel],
+    export_format: ExportFormat,
+    filename: str
+) -> StreamingResponse:
+    """항목 배치를 스트리밍하는 내보내기 응답을 생성합니다."""
+    return StreamingResponse(
+        iter_export_chunks(batches, item_model, export_format),
+        media_type=_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format.value}"'}
+    )
@@ -1,11 +1,39 @@
 from functools import wraps
 from sqlmodel import Session
-from typing import Callable, TypeVar, Any
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import Awaitable, Callable, Dict, Set, TypeVar, Any, Union
 from app.utils.exceptions import DatabaseError, ValidationError
+from sqlalchemy import event
 from sqlalchemy.exc import SQLAlchemyError
 
 T = TypeVar("T")
 
+_ON_COMMIT_PENDING_KEY = "on_commit_pending"
+_ON_COMMIT_LISTENING_KEY = "on_commit_listening"
+
+
+def _run_on_commit_callbacks(session: Session) -> None:
+    pending: Dict[Callable[..., Any], Set[Any]] = session.info.pop(_ON_COMMIT_PENDING_KEY, None) or {}
+    for callback, items in pending.items():
+        callback(*items)
+
+
+def _discard_on_commit_callbacks(session: Session) -> None:
+    session.info.pop(_ON_COMMIT_PENDING_KEY, None)
+
+
+def on_commit(session: Union[Session, AsyncSession], callback: Callable[..., Any], *items: Any) -> None:
+    """현재 트랜잭션이 커밋되면 callback(*items)를 실행하도록 예약합니다. (롤백 시 취소)
+
+    같은 트랜잭션에서 같은 callback을 여러 번 예약하면 items를 합쳐 커밋 시 한 번만 호출합니다.
+    """
+    sync_session = session.sync_session if isinstance(session, AsyncSession) else session
+    if not sync_session.info.get(_ON_COMMIT_LISTENING_KEY):
+        sync_session.info[_ON_COMMIT_LISTENING_KEY] = True
+        event.listen(sync_session, "after_commit", _run_on_commit_callbacks)
+        event.listen(sync_session, "after_rollback", _discard_on_commit_callbacks)
+    sync_session.info.setdefault(_ON_COMMIT_PENDING_KEY, {}).setdefault(callback, set()).update(items)
+
 def handle_transaction(func: Callable[..., T]) -> Callable[..., T]:
     """ SQLAlchemy 세션 트랜잭션 관리 데코레이터 """
     @wraps(func)
@@ -44,3 +72,34 @@ def handle_transaction(func: Callable[..., T]) -> Callable[..., T]:
             session.rollback()  
             raise e
     return wrapper
+
+
+def async_handle_transaction(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """ AsyncSession 트랜잭션 관리 데코레이터 (handle_transaction의 비동기 버전) """
+    @wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> T:
+        session: AsyncSession = kwargs.get("session") or (args[0] if args else None)
+        if not isinstance(session, AsyncSession):
+            raise DatabaseError(
+                message="First argument must be AsyncSession",
+                detail={
+                    "function": func.__name__,
+                    "argument_type": type(session).__name__
+                }
+            )
+        try:
+            result = await func(*args, **kwargs)  # 함수 실행
+            await session.commit()  # 트랜잭션 커밋
+            return result
+
+        except SQLAlchemyError as db_err:
+            await session.rollback()
+            raise DatabaseError(
+                message="Database commit error",
+                detail={"origin": str(db_err)}
+            ) from db_err
+
+        except Exception as e:
+            await session.rollback()
+            raise e
+    return wrapper
@@ -25,6 +25,13 @@ class BaseConstant:
             cls._initialize_mappings()
         return cls._NAME_TO_ID[name]
 
+    @classmethod
+    def as_dict(cls) -> Dict[int, str]:
+        """ID → NAME 전체 매핑을 반환합니다."""
+        if not cls._ID_TO_NAME:
+            cls._initialize_mappings()
+        return dict(cls._ID_TO_NAME)
+
 class Role(BaseConstant):
     _ID_TO_NAME: ClassVar[Dict[int, str]] = {}
     _NAME_TO_ID: ClassVar[Dict[str, int]] = {}
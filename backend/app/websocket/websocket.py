@@ -13,7 +13,8 @@ from app.core import s3_storage
 from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect
 from fastapi.responses import HTMLResponse
 
-from app.core.redis import redis_handler
+from app.core.redis import async_redis_handler
+from app.core.vehicle_presence import vehicle_presence
 from app.services.video_service import VideoService
 from app.core.database import get_session
 from app.utils.lut_constants import VideoType
@@ -69,11 +70,12 @@ manager = ConnectionManager()
 # 서비스 핸들러 함수
 async def handle_connect_vehicle(client_id: str, payload: dict) -> dict:
     try:
-        redis_handler.set(f"vehicle:{client_id}", "connected")
+        await async_redis_handler.set(vehicle_presence.redis_key(client_id), "connected")
     except Exception as e:
         return {"success": False, "message": f"Redis 저장 실패: {str(e)}"}
     
     manager.vehicle_statuses[client_id]["connected"] = True
+    vehicle_presence.mark_connected(client_id)
     return {"success": True, "message": "Vehicle connected successfully", "vehicle_id": client_id}
 
 async def handle_rent_request(client_id: str, payload: dict) -> dict:
@@ -169,6 +171,8 @@ async def get_chat():
 @router.websocket("/ws/{client_id}")
 async def websocket_endpoint(websocket: WebSocket, client_id: str):
     await manager.connect(client_id, websocket)
+    # 재연결된 차량의 미연결 캐시 폐기 (연결 완료는 /vehicle/connect 처리 시 기록)
+    vehicle_presence.forget(client_id)
     try:
         while True:
             data = await websocket.receive_text()
@@ -187,8 +191,9 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
                 await manager.send_personal_message(error_msg, client_id)
     except WebSocketDisconnect:
         manager.disconnect(client_id)
+        vehicle_presence.mark_disconnected(client_id)
         try:
-            redis_handler.delete(f"vehicle:{client_id}")
+            await async_redis_handler.delete(vehicle_presence.redis_key(client_id))
         except Exception as e:
             print(f"Redis 삭제 실패: {e}")
         await manager.broadcast_topic(
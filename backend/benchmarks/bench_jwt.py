@@ -0,0 +1,43 @@
+"""access 토큰 검증 처리량 벤치마크 (검증 토큰 캐시 없음 vs 있음)
+
+같은 access 토큰으로 JWTHandler.validate_token을 반복 호출하여 초당 검증 횟수를 비교합니다.
+캐시가 없으면 매 호출마다 jwt.decode(HMAC-SHA256)와 역할 복호화(Fernet)를 수행합니다.
+backend 디렉토리에서 아래처럼 직접 실행합니다.
+
+    python -m benchmarks.bench_jwt [반복 횟수]
+"""
+import asyncio
+import sys
+import time
+from typing import List, Tuple
+
+from app.core.jwt import JWTHandler, VerifiedTokenCache
+
+
+async def _validate(handler: JWTHandler, tokens: List[str], number: int) -> float:
+    """number번 검증하는 데 걸린 시간(초)"""
+    started = time.perf_counter()
+    for i in range(number):
+        await handler.validate_token(tokens[i % len(tokens)], allowed_roles=["master", "semi"])
+    return time.perf_counter() - started
+
+
+def run(number: int = 20000, token_count: int = 50) -> List[Tuple[str, float]]:
+    """(이름, 초당 검증 횟수) 목록을 반환합니다. token_count명의 관리자가 번갈아 요청하는 상황을 가정합니다."""
+    results = []
+    for name, cache_size in (("no cache", 0), ("verified-token cache", 1024)):
+        handler = JWTHandler()
+        handler.token_cache = VerifiedTokenCache(max_size=cache_size)
+        tokens = [handler._create_access_token(pk, handler.encrypt_role("master")) for pk in range(1, token_count + 1)]
+        elapsed = asyncio.run(_validate(handler, tokens, number))
+        results.append((name, number / elapsed))
+    return results
+
+
+if __name__ == "__main__":
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    results = run(number)
+    baseline = results[0][1]
+    print(f"{'validate_token':<24}{'ops/s':>12}{'speedup':>10}")
+    for name, ops in results:
+        print(f"{name:<24}{ops:>12,.0f}{ops / baseline:>9.1f}x")
@@ -0,0 +1,109 @@
+"""응답 직렬화 마이크로 벤치마크 (stdlib JSONResponse vs orjson APIResponse)
+
+가장 큰 목록 응답(모듈 세트 목록, 렌트 히스토리 페이지)을 FastAPI와 같은 순서(jsonable_encoder → render)로 직렬화하여
+렌더링 단계만의 시간과 전체 시간을 비교합니다. backend 디렉토리에서 아래처럼 직접 실행합니다.
+
+    python -m benchmarks.bench_serialization [반복 횟수]
+"""
+import sys
+import timeit
+from datetime import datetime, timedelta
+from typing import Callable, List, Tuple
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from app.api.schemas.admin.rent_history_schema import RentHistoryData, RentHistoryItem, RentHistoryResponse
+from app.api.schemas.common import Coordinate, Pagination
+from app.api.schemas.user.module_set_schema import ModuleSet, ModuleSetData, ModuleSetOptionType, ModuleSetsResponse
+from app.core.responses import APIResponse
+
+
+def module_set_page(size: int = 100) -> ModuleSetsResponse:
+    return ModuleSetsResponse.success(
+        message="Module sets retrieved successfully",
+        data=ModuleSetData(
+            moduleSets=[
+                ModuleSet(
+                    moduleSetId=i,
+                    moduleSetName=f"캠핑카 모듈 세트 {i}",
+                    description="캠핑에 최적화된 모듈 세트입니다.",
+                    basePrice=25000.0 + i,
+                    moduleTypeId=3,
+                    moduleTypeName="large",
+                    moduleTypeSize="3x3",
+                    moduleTypeCost=5000,
+                    imgUrls=[f"https://example.com/module_sets/{i}/{n}.jpg" for n in range(3)],
+                    moduleSetOptionTypes=[
+                        ModuleSetOptionType(optionTypeId=n, optionTypeName=f"옵션 {n}", quantity=n % 3 + 1)
+                        for n in range(8)
+                    ]
+                )
+                for i in range(1, size + 1)
+            ],
+            pagination=Pagination(currentPage=1, totalPages=1, totalItems=size, pageSize=size)
+        )
+    )
+
+
+def rent_history_page(size: int = 100) -> RentHistoryResponse:
+    base_date = datetime(2025, 2, 1, 10, 0, 0)
+    return RentHistoryResponse.success(
+        message="Rent logs retrieved successfully",
+        data=RentHistoryData(
+            rent_history=[
+                RentHistoryItem(
+                    rent_id=i,
+                    user_pk=i % 7 + 1,
+                    vehicle_number=f"PBV-{i:05d}",
+                    option_types="1,2,3",
+                    departure_location=Coordinate(x=127.0 + i / 1000, y=37.5),
+                    arrival_location=Coordinate(x=127.1, y=37.5 + i / 1000),
+                    cost=150000.0,
+                    mileage=450.5,
+                    rent_status_name="in_progress",
+                    created_at=base_date + timedelta(hours=i),
+                    updated_at=base_date + timedelta(hours=i, minutes=30)
+                )
+                for i in range(1, size + 1)
+            ],
+            pagination=Pagination(currentPage=1, totalPages=10, totalItems=1000, pageSize=size)
+        )
+    )
+
+
+def _measure(fn: Callable[[], object], number: int) -> float:
+    """number번 실행한 평균 시간(ms)"""
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1000
+
+
+def run(number: int = 200) -> List[Tuple[str, float, float, float, float]]:
+    """페이로드별 (이름, stdlib 렌더, orjson 렌더, stdlib 전체, orjson 전체) 평균 시간(ms)을 반환합니다."""
+    results = []
+    payloads: List[Tuple[str, BaseModel]] = [
+        ("module set list (100)", module_set_page()),
+        ("rent history page (100)", rent_history_page()),
+    ]
+    for name, payload in payloads:
+        encoded = jsonable_encoder(payload)
+        # 두 응답 클래스가 같은 JSON을 생성하는지 확인
+        assert APIResponse(encoded).body.decode() == JSONResponse(encoded).body.decode()
+        results.append((
+            name,
+            _measure(lambda: JSONResponse(encoded), number),
+            _measure(lambda: APIResponse(encoded), number),
+            _measure(lambda: JSONResponse(jsonable_encoder(payload)), number),
+            _measure(lambda: APIResponse(jsonable_encoder(payload)), number),
+        ))
+    return results
+
+
+if __name__ == "__main__":
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    print(f"{'payload':<26}{'render stdlib':>15}{'render orjson':>15}{'speedup':>9}{'total stdlib':>14}{'total orjson':>14}")
+    for name, std_render, orjson_render, std_total, orjson_total in run(number):
+        print(
+            f"{name:<26}{std_render:>13.3f}ms{orjson_render:>13.3f}ms{std_render / orjson_render:>8.1f}x"
+            f"{std_total:>12.3f}ms{orjson_total:>12.3f}ms"
+        )
@@ -1,3 +1,6 @@
+import csv
+import io
+import json
 from datetime import datetime
 import pytest
 from sqlmodel import Session
@@ -171,3 +174,39 @@ def test_create_dummy_maintenance_histories(session: Session, create_dummy_maint
     assert len(records) == count
     assert records[0].item_id == start_item_id
     assert records[0].item_type_id == item_type_id
+
+def test_export_maintenance_history_filters(client, session, create_dummy_maintenance_histories, master_token, clear_maintenance_histories):
+    # GIVEN: DB 초기화 후, 차량 2건 / 모듈 3건의 정비 기록 생성
+    clear_maintenance_histories()
+    create_dummy_maintenance_histories(count=2, start_item_id=1, item_type_id=1)
+    create_dummy_maintenance_histories(count=3, start_item_id=10, item_type_id=2)
+
+    # WHEN: 필터 없이 CSV로 내보내기
+    response = client.get(
+        "/api/admin/maintenance-history/export?format=csv",
+        headers={"Authorization": f"Bearer {master_token}"}
+    )
+    # THEN: 헤더 + 5건
+    assert response.status_code == 200
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert len(rows) == 6
+    assert "item_type_name" in rows[0]
+
+    # WHEN: 목록 조회와 같은 item_type/item_id 필터로 NDJSON 내보내기
+    response = client.get(
+        "/api/admin/maintenance-history/export?format=ndjson&item_type=module&item_id=11",
+        headers={"Authorization": f"Bearer {master_token}"}
+    )
+    assert response.status_code == 200
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert len(records) == 1
+    assert records[0]["item_id"] == 11
+    assert records[0]["item_type_name"].lower() == "module"
+
+def test_export_maintenance_history_item_id_without_type(client, master_token):
+    # 아이템 타입 없이 아이템 ID만 지정하면 스트리밍 전에 409 Conflict 반환
+    response = client.get(
+        "/api/admin/maintenance-history/export?item_id=1",
+        headers={"Authorization": f"Bearer {master_token}"}
+    )
+    assert response.status_code == 409
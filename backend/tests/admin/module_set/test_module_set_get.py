@@ -166,3 +166,20 @@ def test_module_set_field_conversion(client, session, create_dummy_module_sets,
     module_sets = data["data"]["module_sets"]
     assert len(module_sets) > 0
     module_set = module_sets[0]
+
+def test_get_module_set_list_price_matches_calculate_base_price(client, session, master_token):
+    # GIVEN: 시드된 모듈 세트(옵션 타입 포함)
+    from app.db.crud.module_set import module_set_crud
+
+    # WHEN: 관리자 토큰으로 모듈 세트 목록 조회
+    response = client.get(
+        "/api/admin/module-sets?page=1&pageSize=50",
+        headers={"Authorization": f"Bearer {master_token}"}
+    )
+
+    # THEN: 일괄 계산된 가격이 단건 계산 결과와 동일해야 함
+    assert response.status_code == 200
+    module_sets = response.json()["data"]["module_sets"]
+    assert module_sets
+    for module_set in module_sets:
+        assert module_set["cost"] == module_set_crud.calculate_base_price(session, module_set["module_set_id"])
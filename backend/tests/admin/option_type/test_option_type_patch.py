@@ -129,3 +129,42 @@ def test_update_option_type_without_token(client, session, test_option_type):
     assert data["resultCode"] == "FAILURE"
     assert "Authentication" in data["message"]
 
+
+def test_update_option_type_refreshes_catalog(client, session, master_token, test_option_type):
+    """옵션 타입 수정 시 카탈로그 version이 증가하고 새 이름/비용이 반영되는지 테스트"""
+    from app.db.crud.option_type import option_type_crud
+
+    # Given: 카탈로그에 기존 옵션 타입 정보가 적재됨
+    option_type_id = test_option_type.option_type_id
+    assert option_type_crud.get_option_cost_by_id(session, option_type_id) == 10000
+    version = option_type_crud.catalog.version
+
+    # When: 관리자가 옵션 타입 비용과 이름을 수정
+    response = client.patch(
+        f"/api/admin/option-types/{option_type_id}",
+        json={"option_type_name": "Catalog Option Type", "option_type_cost": 25000},
+        headers={"Authorization": f"Bearer {master_token}"}
+    )
+
+    # Then: 커밋 후 카탈로그가 갱신됨
+    assert response.status_code == 200
+    assert option_type_crud.catalog.version > version
+    assert option_type_crud.get_option_cost_by_id(session, option_type_id) == 25000
+    assert option_type_crud.get_option_name_by_id(session, option_type_id) == "Catalog Option Type"
+
+
+def test_catalog_miss_does_not_reload(session, test_option_type, sql_statements):
+    """현재 스냅샷에 없는 옵션 타입 ID는 카탈로그를 다시 적재하지 않고 None을 반환하는지 테스트"""
+    from app.db.crud.option_type import option_type_crud
+
+    # Given: 카탈로그가 현재 version으로 적재됨
+    assert option_type_crud.get_option_cost_by_id(session, test_option_type.option_type_id) == 10000
+    sql_statements.clear()
+
+    # When: 존재하지 않는 옵션 타입 ID 조회
+    missing_id = test_option_type.option_type_id + 1000
+
+    # Then: SQL 없이 None 반환
+    assert option_type_crud.get_option_cost_by_id(session, missing_id) is None
+    assert option_type_crud.get_option_name_by_id(session, missing_id) is None
+    assert sql_statements == []
@@ -0,0 +1,288 @@
+import asyncio
+from collections import Counter
+from datetime import date, datetime, timedelta
+
+from sqlalchemy.dialects import postgresql
+from sqlmodel import select
+
+from app.core.response_cache import ResponseCache
+from app.db.crud.stats_rollup import rebuild_rollups
+from app.db.models.lut import ModuleType
+from app.db.models.maintenance_daily_stat import MaintenanceDailyStat
+from app.db.models.maintenance_history import MaintenanceHistory
+from app.db.models.option import Option
+from app.db.models.option_type import OptionType
+from app.db.models.option_usage_daily_stat import OptionUsageDailyStat
+from app.db.models.rent_daily_stat import RentDailyStat
+from app.db.models.rent_history import RentHistory
+from app.db.models.usage_history import UsageHistory
+from app.services.admin.dashboard_service import DashboardService
+from app.services.user.quote_service import RentQuoteEngine
+from app.utils.lut_constants import ItemType, RentStatus
+from tests.helpers import master_token, user_token
+
+
+def _get(client, token: str, path: str):
+    return client.get(f"/api/admin/dashboard{path}", headers={"Authorization": f"Bearer {token}"})
+
+
+def test_snapshot_matches_individual_endpoints(client, session, master_token, sql_statements):
+    """스냅샷의 카운터/상태 차트가 개별 API 결과와 같고, SQL 두 번으로 조회되어야 합니다."""
+    # Given: 오늘 생성된 진행 중 렌트와 오늘 완료된 렌트
+    rents = session.exec(select(RentHistory).limit(2)).all()
+    now = datetime.now()
+    rents[0].rent_status_id = RentStatus.IN_PROGRESS.ID
+    rents[0].created_at = now
+    rents[0].rent_end_date = now
+    rents[1].rent_status_id = RentStatus.COMPLETED.ID
+    rents[1].updated_at = now
+    session.add_all(rents)
+    session.commit()
+
+    # When: 스냅샷 조회
+    sql_statements.clear()
+    response = _get(client, master_token, "/snapshot")
+
+    # Then: 집계 SQL은 두 번만 실행됨
+    assert response.status_code == 200, response.json()
+    assert len([statement for statement in sql_statements if statement.lstrip().startswith("SELECT")]) == 2
+    snapshot = response.json()["data"]
+
+    # Then: 개별 API와 결과가 일치
+    counters = {
+        "today_rented": "/vehicles/today-rented-count",
+        "currently_renting": "/vehicles/currently-renting-count",
+        "today_expected_return": "/vehicles/today-expected-return-count",
+        "today_completed_returns": "/vehicles/today-completed-return-count",
+    }
+    for name, path in counters.items():
+        assert snapshot["counters"][name] == _get(client, master_token, path).json()["data"], name
+    assert snapshot["counters"]["today_rented"] >= 1
+    assert snapshot["counters"]["today_completed_returns"] >= 1
+
+    charts = {"vehicle": "/vehicles/state-chart", "module": "/modules/state-chart", "option": "/options/state-chart"}
+    for kind, path in charts.items():
+        expected = sorted(_get(client, master_token, path).json()["data"], key=lambda item: item["state"])
+        assert sorted(snapshot["state_charts"][kind], key=lambda item: item["state"]) == expected, kind
+
+
+def _rollup_rows(session) -> dict:
+    """집계 테이블 전체 행을 비교 가능한 형태로 반환합니다."""
+    session.expire_all()
+    return {
+        "rent": sorted(
+            (row.stat_date, row.module_type_id, row.rent_count, row.revenue)
+            for row in session.exec(select(RentDailyStat)).all() if row.rent_count
+        ),
+        "maintenance": sorted(
+            (row.stat_date, row.maintenance_count, row.cost)
+            for row in session.exec(select(MaintenanceDailyStat)).all() if row.maintenance_count
+        ),
+        "option": sorted(
+            (row.stat_date, row.option_type_id, row.usage_count)
+            for row in session.exec(select(OptionUsageDailyStat)).all() if row.usage_count
+        ),
+    }
+
+
+def test_sales_stats_match_raw_tables(client, session, master_token):
+    """집계 테이블 기반 매출 통계가 원본 테이블을 직접 집계한 결과와 같아야 합니다."""
+    # Given: 시드 데이터의 렌트/정비/옵션 사용 기록을 직접 집계
+    rents = session.exec(select(RentHistory)).all()
+    rent_months = Counter(rent.rent_start_date.strftime("%Y-%m") for rent in rents)
+    maintenance_costs = Counter()
+    for history in session.exec(select(MaintenanceHistory)).all():
+        maintenance_costs[history.scheduled_at.strftime("%Y-%m")] += history.cost
+    cutoff = (datetime.now() - timedelta(days=90)).date()
+    option_usage = Counter(
+        option_type_id
+        for created_at, option_type_id in session.exec(
+            select(UsageHistory.created_at, Option.option_type_id)
+            .join(Option, Option.option_id == UsageHistory.item_id)
+            .where(UsageHistory.item_type_id == ItemType.OPTION.ID)
+        ).all()
+        if created_at.date() >= cutoff
+    )
+
+    # When: 통계 API 조회
+    rental_counts = _get(client, master_token, "/sales/rental-counts").json()["data"]
+    maintenance_cost = _get(client, master_token, "/sales/maintenance-cost").json()["data"]
+    popular = _get(client, master_token, "/options/popular").json()["data"]
+
+    # Then: 월별 건수/비용과 인기 옵션 사용 건수가 일치
+    assert rental_counts == [
+        {"month": f"{int(month.split('-')[1])}월", "count": count} for month, count in sorted(rent_months.items())
+    ]
+    assert [(item["month"], item["cost"]) for item in maintenance_cost] == [
+        (month, maintenance_costs[month]) for month in sorted(maintenance_costs)
+    ]
+    assert len(popular) == min(5, len(option_usage))
+    for item in popular:
+        assert item["count"] == option_usage[item["option_type_id"]]
+    assert [item["count"] for item in popular] == sorted(option_usage.values(), reverse=True)[:len(popular)]
+
+
+def test_rollups_follow_writes_and_match_rebuild(client, session, master_token, user_token, mocker):
+    """렌트 생성과 정비 기록 생성/수정이 집계 테이블에 바로 반영되고, 재계산 결과와 같아야 합니다."""
+    mocker.patch("app.services.user.rent_service.vehicle_presence.is_connected", return_value=True)
+    mocker.patch("app.services.user.rent_service.WebSocketService")
+    before = _rollup_rows(session)
+
+    # When: 옵션 2개를 포함한 렌트 생성
+    module_type = session.exec(select(ModuleType)).first()
+    option_type = session.exec(select(OptionType)).first()
+    start = datetime.now() + timedelta(hours=1)
+    end = start + timedelta(hours=6)
+    cost = int(module_type.module_type_cost) + int(option_type.option_type_cost) * 2 + RentQuoteEngine.date_cost(start, end)
+    response = client.post(
+        "/api/user/rent",
+        json={
+            "selectedOptionTypes": [{"optionTypeId": option_type.option_type_id, "quantity": 2}],
+            "autonomousArrivalPoint": {"x": 12.313, "y": 32.3232},
+            "autonomousDeparturePoint": {"x": 11.512, "y": 30.4531},
+            "moduleTypeId": module_type.module_type_id,
+            "cost": cost,
+            "rentStartDate": start.isoformat(),
+            "rentEndDate": end.isoformat(),
+        },
+        headers={"Authorization": f"Bearer {user_token}"}
+    )
+    assert response.status_code == 200, response.json()
+
+    # When: 정비 기록 생성 후 비용과 예정일 수정
+    item_id = session.exec(select(Option.option_id).where(Option.item_status_id == 2)).first()
+    headers = {"Authorization": f"Bearer {master_token}"}
+    response = client.post(
+        "/api/admin/maintenance-history",
+        json={"item_type_name": "option", "item_id": item_id, "issue": "ROLLUP", "cost": 1000, "scheduled_at": "2025-01-01T00:00:00Z"},
+        headers=headers
+    )
+    assert response.status_code == 200, response.json()
+    maintenance_id = session.exec(select(MaintenanceHistory.maintenance_id).where(MaintenanceHistory.issue == "ROLLUP")).one()
+    response = client.patch(
+        f"/api/admin/maintenance-history/{maintenance_id}",
+        json={"cost": 2500, "scheduled_at": "2025-02-01T00:00:00Z"},
+        headers=headers
+    )
+    assert response.status_code == 200, response.json()
+
+    # Then: 렌트 1건, 옵션 사용 2건, 정비 1건(수정된 날짜/비용)이 증분 반영됨
+    after = _rollup_rows(session)
+    assert sum(row[2] for row in after["rent"]) == sum(row[2] for row in before["rent"]) + 1
+    assert sum(row[2] for row in after["option"]) == sum(row[2] for row in before["option"]) + 2
+    assert (datetime(2025, 2, 1).date(), 1, 2500) in after["maintenance"]
+    assert not any(row[0] == datetime(2025, 1, 1).date() for row in after["maintenance"])
+
+    # Then: 원본 테이블 기준 재계산 결과와 동일하고, 재계산은 멱등
+    rebuild_rollups(session)
+    session.commit()
+    assert _rollup_rows(session) == after
+    rebuild_rollups(session)
+    session.commit()
+    assert _rollup_rows(session) == after
+
+
+def test_repeated_dashboard_loads_within_ttl_skip_database(client, master_token, sql_statements):
+    """TTL 안의 반복 조회는 DB를 조회하지 않고, 적중/미적중 횟수가 집계되어야 합니다."""
+    paths = ["/snapshot", "/sales/rental-counts", "/sales/maintenance-cost", "/options/popular"]
+
+    # Given: 첫 조회로 캐시 적재
+    first = [_get(client, master_token, path).json()["data"] for path in paths]
+
+    # When: 같은 엔드포인트를 다시 조회
+    sql_statements.clear()
+    second = [_get(client, master_token, path).json()["data"] for path in paths]
+
+    # Then: SQL 없이 같은 응답을 반환
+    assert sql_statements == []
+    assert second == first
+    report = client.get(
+        "/api/admin/monitoring/dashboard-cache", headers={"Authorization": f"Bearer {master_token}"}
+    ).json()["data"]
+    assert (report["hits"], report["misses"]) == (len(paths), len(paths))
+    assert {item["key"] for item in report["endpoints"]} == {path.lstrip("/") for path in paths}
+
+
+def test_maintenance_write_invalidates_cached_dashboard(client, session, master_token):
+    """정비 기록이 커밋되면 캐시된 월별 정비 비용이 폐기되어 바로 반영되어야 합니다."""
+    # Given: 캐시된 월별 정비 비용
+    before = _get(client, master_token, "/sales/maintenance-cost").json()["data"]
+    assert not any(item["month"] == "2025-01" for item in before)
+
+    # When: 정비 기록 생성
+    item_id = session.exec(select(Option.option_id).where(Option.item_status_id == 2)).first()
+    response = client.post(
+        "/api/admin/maintenance-history",
+        json={"item_type_name": "option", "item_id": item_id, "issue": "CACHE", "cost": 1000, "scheduled_at": "2025-01-01T00:00:00Z"},
+        headers={"Authorization": f"Bearer {master_token}"}
+    )
+    assert response.status_code == 200, response.json()
+
+    # Then: TTL 이전이라도 새 비용이 조회됨
+    after = _get(client, master_token, "/sales/maintenance-cost").json()["data"]
+    assert {"month": "2025-01", "cost": 1000} in after
+
+
+def test_response_cache_ttl_tags_and_rollback(session):
+    """TTL 만료, 태그 단위 폐기, 롤백 시 폐기 취소가 동작해야 합니다."""
+    cache = ResponseCache(default_ttl=60)
+    calls = Counter()
+
+    def _loader(key):
+        async def _load():
+            calls[key] += 1
+            return calls[key]
+        return _load
+
+    async def _load_all():
+        return [
+            await cache.get_or_load("rent", _loader("rent"), tags=("rent",)),
+            await cache.get_or_load("items", _loader("items"), tags=("items",)),
+            await cache.get_or_load("short", _loader("short"), ttl=0),
+        ]
+
+    assert asyncio.run(_load_all()) == [1, 1, 1]
+    assert asyncio.run(_load_all()) == [1, 1, 2]
+
+    # 롤백된 트랜잭션의 폐기 예약은 취소됨
+    cache.invalidate_on_commit(session, "rent")
+    session.rollback()
+    assert asyncio.run(_load_all()) == [1, 1, 3]
+
+    # 커밋된 트랜잭션은 해당 태그 항목만 폐기
+    cache.invalidate_on_commit(session, "rent")
+    session.commit()
+    assert asyncio.run(_load_all()) == [2, 1, 4]
+
+
+def test_sales_month_buckets_are_dialect_neutral(mocker):
+    """월별 통계는 일 단위 행을 파이썬에서 월로 묶으며, DB 방언별 날짜 함수를 사용하지 않아야 합니다."""
+    # Given: 월/연도가 섞인 일 단위 집계 행 (정렬되지 않은 순서)
+    day_rows = [
+        (date(2025, 2, 3), 2),
+        (date(2024, 12, 31), 1),
+        (date(2025, 2, 28), 3),
+        (date(2025, 1, 15), 4),
+    ]
+    session = mocker.Mock()
+    session.exec = mocker.AsyncMock(return_value=mocker.Mock(all=mocker.Mock(return_value=day_rows)))
+
+    # When
+    rental_counts = asyncio.run(DashboardService.get_rental_counts_by_date(session))
+    maintenance_cost = asyncio.run(DashboardService.get_maintenance_cost_by_month(session))
+
+    # Then: 월 순서로 합산되고, 쿼리는 PostgreSQL로도 컴파일되며 strftime을 쓰지 않음
+    assert rental_counts == [
+        {"month": "12월", "count": 1},
+        {"month": "1월", "count": 4},
+        {"month": "2월", "count": 5},
+    ]
+    assert maintenance_cost == [
+        {"month": "2024-12", "cost": 1},
+        {"month": "2025-01", "cost": 4},
+        {"month": "2025-02", "cost": 5},
+    ]
+    for call in session.exec.call_args_list:
+        sql = str(call.args[0].compile(dialect=postgresql.dialect()))
+        assert "strftime" not in sql.lower()
+        assert "GROUP BY" in sql
@@ -0,0 +1,45 @@
+import asyncio
+import time
+
+from app.core.loop_monitor import LoopLagMonitor
+from tests.helpers import master_token
+
+
+def test_loop_monitor_attributes_stall_to_in_flight_path():
+    """루프를 막는 요청이 있으면 해당 경로와 스택이 지연 원인으로 집계되어야 합니다."""
+    monitor = LoopLagMonitor(interval_ms=10, threshold_ms=50)
+
+    def blocking_handler():
+        time.sleep(0.3)
+
+    async def scenario():
+        monitor.start()
+        await asyncio.sleep(0.05)
+        # Given: 요청을 처리 중인 태스크가 루프를 막음
+        monitor.track(asyncio.current_task(), "POST /api/auth/login")
+        blocking_handler()
+        monitor.untrack(asyncio.current_task())
+        await asyncio.sleep(0.05)
+        await monitor.stop()
+
+    asyncio.run(scenario())
+
+    # Then: p99 지연과 원인 경로/스택이 리포트에 포함됨
+    report = monitor.report()
+    assert report["stallCount"] >= 1
+    assert report["p99Ms"] >= 200
+    offender = report["topOffenders"][0]
+    assert offender["path"] == "POST /api/auth/login"
+    assert any("blocking_handler" in line for line in offender["stack"])
+
+
+def test_get_loop_lag_report(client, master_token):
+    """관리자는 이벤트 루프 지연 리포트를 조회할 수 있어야 합니다."""
+    response = client.get(
+        "/api/admin/monitoring/loop-lag",
+        headers={"Authorization": f"Bearer {master_token}"}
+    )
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert set(["p50Ms", "p99Ms", "stallCount", "topOffenders"]).issubset(data)
@@ -0,0 +1,50 @@
+import pytest
+from sqlalchemy import event
+
+from app.db.crud.lut import lut_registry, item_status, item_type, maintenance_status
+from app.utils.lut_constants import ItemStatus, ItemType, MaintenanceStatus
+from tests.conftest import test_engine
+
+
+@pytest.fixture
+def loaded_registry(session):
+    lut_registry.load(session)
+    yield lut_registry
+    lut_registry.clear()
+
+
+def test_lut_lookup_uses_cache_without_sql(session, loaded_registry):
+    """
+    LUT 캐시 적재 후에는 ID/이름 조회 시 SQL이 실행되지 않아야 합니다.
+    """
+    statements = []
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(test_engine, "before_cursor_execute", _record)
+    try:
+        assert item_status.get_by_id(session, ItemStatus.ACTIVE.ID).item_status_name == ItemStatus.ACTIVE.NAME
+        assert item_type.get_by_name(session, ItemType.OPTION.NAME).item_type_id == ItemType.OPTION.ID
+        assert maintenance_status.get_by_id(session, MaintenanceStatus.COMPLETED.ID).maintenance_status_name == MaintenanceStatus.COMPLETED.NAME
+        assert item_status.get_by_id(session, 999) is None
+    finally:
+        event.remove(test_engine, "before_cursor_execute", _record)
+
+    assert statements == []
+
+
+def test_lut_registry_reports_constant_mismatch(session, loaded_registry):
+    """
+    DB 값이 lut_constants와 다르면 refresh 시 불일치 내역이 보고되어야 합니다.
+    """
+    from app.db.models.lut import ItemStatus as ItemStatusModel
+
+    row = session.get(ItemStatusModel, ItemStatus.MAINTENANCE.ID)
+    row.item_status_name = "repair"
+    session.add(row)
+    session.commit()
+
+    mismatches = loaded_registry.refresh(session)
+
+    assert any("lut_item_status" in mismatch and "repair" in mismatch for mismatch in mismatches)
+    assert item_status.get_by_name(session, "repair").item_status_id == ItemStatus.MAINTENANCE.ID
@@ -1,6 +1,9 @@
+import csv
+import io
+import json
 import pytest
 from datetime import datetime, timedelta
-from sqlmodel import Session
+from sqlmodel import Session, func, select
 
 from app.core.jwt import jwt_handler
 from app.db.models.rent_history import RentHistory
@@ -112,3 +115,63 @@ def test_get_rent_history_authentication(client, session, auth_header, expected_
     
     # Then: 예상된 상태 코드가 반환됨
     assert response.status_code == expected_status
+
+def test_get_rent_history_query_count_constant(client, master_token, sql_statements):
+    """
+    페이지 크기와 관계없이 렌트 로그 조회 쿼리 수가 일정한지 확인합니다.
+    """
+    def count_queries(page_size: int) -> int:
+        sql_statements.clear()
+        response = client.get(
+            f"/api/admin/rent-history?page=1&page_size={page_size}",
+            headers={"Authorization": f"Bearer {master_token}"}
+        )
+        assert response.status_code == 200
+        assert len(response.json()["data"]["rent_history"]) == page_size
+        return len(sql_statements)
+
+    # Given: 프로세스 단위 캐시(옵션 타입 카탈로그) 적재
+    count_queries(5)
+
+    # When: 시드 데이터로 작은 페이지와 큰 페이지를 각각 조회함.
+    # Then: 실행된 쿼리 수가 동일함.
+    small_page_queries = count_queries(5)
+    assert small_page_queries > 0
+    assert small_page_queries == count_queries(50)
+
+def test_export_rent_history_csv_matches_table(client, session, master_token, sql_statements):
+    """
+    렌트 로그 CSV 내보내기가 테이블 전체 행을 헤더와 함께 스트리밍하는지 확인합니다.
+    """
+    # When: 관리자 토큰으로 CSV 내보내기를 요청함
+    response = client.get(
+        "/api/admin/rent-history/export?format=csv",
+        headers={"Authorization": f"Bearer {master_token}"}
+    )
+
+    # Then: 헤더 + 렌트 수만큼의 행이 반환되고, COUNT/OFFSET 쿼리는 실행되지 않음
+    assert response.status_code == 200
+    assert not any("count(" in statement.lower() or "offset" in statement.lower() for statement in sql_statements)
+    assert response.headers["content-type"].startswith("text/csv")
+    assert 'filename="rent_history.csv"' in response.headers["content-disposition"]
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert rows[0][:3] == ["rent_id", "user_pk", "vehicle_number"]
+    rent_count = session.exec(select(func.count()).select_from(RentHistory)).one()
+    assert len(rows) - 1 == rent_count
+    assert [int(row[0]) for row in rows[1:]] == sorted(int(row[0]) for row in rows[1:])
+
+def test_export_rent_history_ndjson(client, master_token):
+    """
+    NDJSON 내보내기의 각 줄이 렌트 로그 항목 JSON인지 확인합니다.
+    """
+    response = client.get(
+        "/api/admin/rent-history/export?format=ndjson",
+        headers={"Authorization": f"Bearer {master_token}"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = response.text.splitlines()
+    assert lines
+    for line in lines:
+        item = json.loads(line)
+        assert {"rent_id", "cost", "vehicle_number", "option_types"} <= item.keys()
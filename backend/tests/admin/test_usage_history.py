@@ -1,6 +1,12 @@
+import csv
+import io
+import json
 import pytest
 from fastapi.testclient import TestClient
+from sqlmodel import func, select
+from app.api.schemas.admin.usage_history_schema import UsageHistoryItem
 from app.core.jwt import jwt_handler
+from app.db.models.usage_history import UsageHistory
 
 # --- 토큰 생성용 Fixture ---
 @pytest.fixture
@@ -60,4 +66,40 @@ def test_get_usage_history_forbidden(client, non_admin_token):
         "/api/admin/usage-history?page=1&page_size=10",
         headers={"Authorization": f"Bearer {non_admin_token}"}
     )
-    assert response.status_code == 403 
\ No newline at end of file
+    assert response.status_code == 403 
+def test_export_usage_history_csv_matches_table(client, session, master_token):
+    """
+    사용 이력 CSV 내보내기가 삭제된 항목을 포함한 전체 행을 반환하는지 확인합니다.
+    """
+    response = client.get(
+        "/api/admin/usage-history/export?format=csv",
+        headers={"Authorization": f"Bearer {master_token}"}
+    )
+    assert response.status_code == 200, response.text
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert rows[0] == list(UsageHistoryItem.__fields__)
+    usage_count = session.exec(select(func.count()).select_from(UsageHistory)).one()
+    assert len(rows) - 1 == usage_count
+
+def test_export_usage_history_ndjson(client, master_token):
+    """
+    NDJSON 내보내기의 각 줄이 사용 이력 항목 JSON인지 확인합니다.
+    """
+    response = client.get(
+        "/api/admin/usage-history/export?format=ndjson",
+        headers={"Authorization": f"Bearer {master_token}"}
+    )
+    assert response.status_code == 200, response.text
+    items = [json.loads(line) for line in response.text.splitlines()]
+    assert items
+    assert all(item["item_type_name"] in ("vehicle", "module", "option") for item in items)
+
+def test_export_usage_history_forbidden(client, non_admin_token):
+    """
+    일반 사용자 토큰으로 내보내기를 요청하면 403 Forbidden 응답을 받는지 확인합니다.
+    """
+    response = client.get(
+        "/api/admin/usage-history/export",
+        headers={"Authorization": f"Bearer {non_admin_token}"}
+    )
+    assert response.status_code == 403
@@ -116,3 +116,37 @@ def test_get_vehicle_list_invalid_page_size(client, master_token):
     )
     # THEN: 유효성 검사 실패로 422 에러가 발생함
     assert response.status_code == 422
+
+def test_get_vehicle_list_cursor_pagination(client, session, create_dummy_vehicles, master_token):
+    """ 커서(after) 기반 페이지네이션 테스트"""
+    session.exec(delete(Vehicle))
+    session.commit()
+    create_dummy_vehicles(5)
+
+    # WHEN: 첫 페이지는 page로, 이후 페이지는 nextCursor로 조회
+    response1 = client.get(
+        "/api/admin/vehicles?pageSize=3&include_total=false",
+        headers={"Authorization": f"Bearer {master_token}"}
+    )
+    pagination1 = response1.json()["data"]["pagination"]
+    response2 = client.get(
+        f"/api/admin/vehicles?pageSize=3&include_total=false&after={pagination1['nextCursor']}",
+        headers={"Authorization": f"Bearer {master_token}"}
+    )
+    pagination2 = response2.json()["data"]["pagination"]
+
+    # THEN: 두 페이지가 겹치지 않고 전체 차량을 순서대로 반환하며, 전체 건수는 집계하지 않음
+    ids1 = [v["vehicle_id"] for v in response1.json()["data"]["vehicles"]]
+    ids2 = [v["vehicle_id"] for v in response2.json()["data"]["vehicles"]]
+    assert len(ids1) == 3 and len(ids2) == 2
+    assert ids1 + ids2 == sorted(ids1 + ids2)
+    assert pagination1["totalItems"] is None
+    assert pagination2["nextCursor"] is None
+
+def test_get_vehicle_list_invalid_cursor(client, master_token):
+    """ 잘못된 커서 전달 시 400 Bad Request 반환 확인"""
+    response = client.get(
+        "/api/admin/vehicles?pageSize=3&after=not-a-cursor",
+        headers={"Authorization": f"Bearer {master_token}"}
+    )
+    assert response.status_code == 400
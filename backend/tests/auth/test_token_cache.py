@@ -0,0 +1,76 @@
+import asyncio
+import time
+
+import pytest
+
+from app.core import jwt as jwt_module
+from app.core.jwt import JWTHandler, VerifiedTokenCache, jwt_handler
+from app.utils.exceptions import ForbiddenError
+from tests.helpers import user_token
+
+
+def _access_token(handler: JWTHandler, user_pk: int, role: str) -> str:
+    return handler._create_access_token(user_pk, handler.encrypt_role(role))
+
+
+def test_repeat_validation_skips_crypto(mocker):
+    """같은 토큰의 반복 검증은 jwt.decode와 역할 복호화를 다시 수행하지 않아야 합니다."""
+    handler = JWTHandler()
+    token = _access_token(handler, 1, "master")
+    decode = mocker.spy(jwt_module.jwt, "decode")
+    decrypt = mocker.spy(handler, "decrypt_role")
+
+    first = asyncio.run(handler.validate_token(token, allowed_roles=["master"]))
+    second = asyncio.run(handler.validate_token(token, allowed_roles=["master"]))
+
+    assert decode.call_count == 1
+    assert decrypt.call_count == 1
+    assert first == second
+    assert second.role == "master"
+    # 캐시된 페이로드를 수정해도 다음 검증 결과에 영향이 없어야 함
+    second.role = "user"
+    assert asyncio.run(handler.validate_token(token)).role == "master"
+
+
+def test_cached_token_still_checks_roles():
+    """캐시된 토큰도 요청마다 허용 역할을 확인해야 합니다."""
+    handler = JWTHandler()
+    token = _access_token(handler, 3, "user")
+    asyncio.run(handler.validate_token(token))
+
+    with pytest.raises(ForbiddenError):
+        asyncio.run(handler.validate_token(token, allowed_roles=["master", "semi"]))
+
+
+def test_cache_is_bounded_and_expires():
+    """캐시는 max_size개까지만 유지하고, 만료된 항목은 반환하지 않아야 합니다."""
+    cache = VerifiedTokenCache(max_size=2)
+    payload = jwt_module.JWTPayload(exp=1, user_pk=1, role="user", type="access")
+    cache.put("a", payload, time.time() + 60)
+    cache.put("b", payload, time.time() + 60)
+    assert cache.get("a") is not None  # "a"를 최근 사용으로 갱신
+    cache.put("c", payload, time.time() + 60)
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+
+    cache.put("expired", payload, time.time() - 1)
+    assert cache.get("expired") is None
+
+
+def test_logout_revokes_cached_tokens(client, user_token):
+    """로그아웃하면 해당 사용자의 캐시된 토큰이 폐기되어야 합니다."""
+    headers = {"Authorization": f"Bearer {user_token}"}
+    payload = asyncio.run(jwt_handler.validate_token(user_token))
+    assert jwt_handler.token_cache.get(user_token) is not None
+
+    response = client.post("/auth/logout", headers=headers)
+
+    assert response.status_code == 200
+    assert jwt_handler.token_cache.get(user_token) is None
+    # 다른 사용자 캐시는 유지
+    other_token = _access_token(jwt_handler, payload.user_pk + 100, "user")
+    asyncio.run(jwt_handler.validate_token(other_token))
+    jwt_handler.revoke_cached_tokens(payload.user_pk, "user")
+    assert jwt_handler.token_cache.get(other_token) is not None
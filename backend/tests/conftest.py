@@ -2,11 +2,18 @@ from typing import Callable, Optional, Type, TypeVar
 import pytest
 from fastapi.testclient import TestClient
 from sqlmodel import create_engine, SQLModel, Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
 import logging
 
 from app.main import create_app
-from app.core.database import get_session
+from app.core.database import get_session, get_async_session
 from app import seed
+from app.db.crud.free_pool import free_pool
+from app.core.response_cache import dashboard_cache
+from app.core.catalog_version import Catalog, catalog_versions
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
@@ -16,6 +23,8 @@ T = TypeVar("T")
 # 테스트용 DB 설정
 TEST_DATABASE_URL = "sqlite:///./tests/test.db"
 test_engine = create_engine(TEST_DATABASE_URL, echo=False)
+# 비동기 라우트용 엔진 (TestClient마다 이벤트 루프가 달라지므로 연결을 풀링하지 않음)
+test_async_engine = create_async_engine("sqlite+aiosqlite:///./tests/test.db", poolclass=NullPool)
 
 @pytest.fixture(scope="session", autouse=True)
 def create_test_db():
@@ -36,17 +45,51 @@ def reset_test_db():
             # 2. Insert seed data
             seed.seed_data(session)
             session.commit()
+
+            # 3. 사용 가능 아이템 인덱스를 테스트 DB 기준으로 재구성
+            free_pool.rebuild(session)
+
+            # 4. 이전 테스트의 대시보드 응답 캐시 폐기
+            dashboard_cache.clear()
+
+            # 5. DB 초기화로 바뀐 카탈로그의 이전 ETag와 옵션 타입 카탈로그 폐기
+            catalog_versions.bump(Catalog.MODULE_SETS, Catalog.OPTION_TYPES)
             logger.info("✅ Test database reset successful")
         except Exception as e:
             logger.error(f"❌ Error resetting test database: {e}")
             session.rollback()
             raise
 
+@pytest.fixture
+def sql_statements():
+    """테스트 엔진(동기/비동기)에서 실행된 SQL 문을 기록합니다.
+
+    tests.conftest를 직접 import하면 별도의 엔진 인스턴스가 생기므로 쿼리 수 검증은 이 fixture를 사용합니다.
+    """
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engines = [test_engine, test_async_engine.sync_engine]
+    for engine in engines:
+        event.listen(engine, "before_cursor_execute", _record)
+    yield statements
+    for engine in engines:
+        event.remove(engine, "before_cursor_execute", _record)
+
+@pytest.fixture
+def async_engine():
+    """비동기 테스트 엔진 제공 (요청 여러 개를 별도 AsyncSession으로 동시에 실행할 때 사용)"""
+    return test_async_engine
+
 @pytest.fixture
 def mocker(request):
-    """pytest-mock fixture"""
+    """pytest-mock fixture (테스트가 끝나면 patch를 되돌림)"""
     from pytest_mock import MockerFixture
-    return MockerFixture(request)
+    mocker = MockerFixture(request)
+    yield mocker
+    mocker.stopall()
 
 @pytest.fixture
 def get_first_record_id(session): 
@@ -69,9 +112,16 @@ def client(session):
     def _override_get_session():
         yield session
 
+    async def _override_get_async_session():
+        async with AsyncSession(test_async_engine, expire_on_commit=False) as async_session:
+            yield async_session
+
     app.dependency_overrides[get_session] = _override_get_session
+    app.dependency_overrides[get_async_session] = _override_get_async_session
     
     with TestClient(app) as c:
+        # lifespan은 운영 DB로 인덱스를 적재하므로 테스트 DB 기준으로 다시 적재
+        free_pool.rebuild(session)
         yield c
         
         
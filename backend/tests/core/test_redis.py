@@ -0,0 +1,108 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+import requests
+
+from app.core.jwt import jwt_handler
+from app.core.redis import AsyncRedisHandler, RedisHandler, redis_handler
+from app.utils.exceptions import RedisError
+
+
+def _response(body, status_code: int = 200) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(body).encode()
+    return response
+
+
+def test_redis_handler_reuses_session_with_timeout(mocker):
+    """명령은 keep-alive 세션으로 JSON 배열을 전송하고 타임아웃을 지정해야 합니다."""
+    handler = RedisHandler()
+    post = mocker.patch.object(handler.session, "post", return_value=_response({"result": "connected"}))
+
+    assert handler.get("vehicle:VIN1") == "connected"
+    handler.setex("token", "abc", 60)
+
+    assert post.call_count == 2
+    assert post.call_args_list[0].kwargs["json"] == ["GET", "vehicle:VIN1"]
+    assert post.call_args_list[1].kwargs["json"] == ["SET", "token", "abc", "EX", 60]
+    assert post.call_args.kwargs["timeout"] == handler.timeout
+
+
+def test_redis_handler_pipeline_and_multi_exec(mocker):
+    """pipeline/multi_exec는 여러 명령을 한 번의 요청으로 보내고 명령별 결과를 반환해야 합니다."""
+    handler = RedisHandler()
+    post = mocker.patch.object(handler.session, "post", return_value=_response([{"result": 1}, {"result": "OK"}]))
+    commands = [["DEL", "key"], ["SET", "key", "value"]]
+
+    assert handler.pipeline(commands) == [1, "OK"]
+    assert handler.multi_exec(commands) == [1, "OK"]
+
+    assert [call.args[0] for call in post.call_args_list] == [
+        f"{handler.base_url}/pipeline",
+        f"{handler.base_url}/multi-exec",
+    ]
+    assert post.call_args.kwargs["json"] == commands
+
+
+def test_redis_handler_raises_command_errors(mocker):
+    """Upstash 에러 응답은 RedisError로 변환되어야 합니다."""
+    handler = RedisHandler()
+    mocker.patch.object(handler.session, "post", return_value=_response({"error": "ERR wrong type"}, 400))
+    with pytest.raises(RedisError):
+        handler.get("key")
+
+    mocker.patch.object(handler.session, "post", return_value=_response([{"result": 1}, {"error": "ERR syntax"}]))
+    with pytest.raises(RedisError):
+        handler.pipeline([["DEL", "key"], ["SET", "key"]])
+
+    mocker.patch.object(handler.session, "post", side_effect=requests.exceptions.ConnectTimeout("timeout"))
+    with pytest.raises(RedisError):
+        handler.delete("key")
+
+
+def test_create_token_rotates_refresh_token_in_one_request(mocker):
+    """토큰 발급 시 기존 토큰 삭제와 새 토큰 저장이 한 번의 multi-exec 요청으로 처리되어야 합니다."""
+    post = mocker.patch.object(
+        redis_handler.session, "post", return_value=_response([{"result": 1}, {"result": "OK"}])
+    )
+
+    _, refresh_token = jwt_handler.create_token(1, role="user")
+
+    post.assert_called_once()
+    assert post.call_args.args[0].endswith("/multi-exec")
+    key = "user:user:1:refresh_token"
+    assert post.call_args.kwargs["json"] == [
+        ["DEL", key],
+        ["SET", key, refresh_token, "EX", jwt_handler.settings.REFRESH_TOKEN_EXPIRE_SECONDS],
+    ]
+
+
+def test_async_redis_handler():
+    """비동기 클라이언트도 단일 명령과 multi-exec를 같은 형식으로 전송해야 합니다."""
+    requests_seen = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        requests_seen.append((request.url.path, json.loads(request.content)))
+        if request.url.path == "/multi-exec":
+            return httpx.Response(200, json=[{"result": 1}, {"result": "OK"}])
+        return httpx.Response(200, json={"result": "connected"})
+
+    async def scenario():
+        handler = AsyncRedisHandler()
+        handler._client = httpx.AsyncClient(base_url="http://upstash", transport=httpx.MockTransport(handle))
+        try:
+            assert await handler.get("vehicle:VIN1") == "connected"
+            assert await handler.multi_exec([["DEL", "k"], ["SET", "k", "v"]]) == [1, "OK"]
+        finally:
+            await handler.aclose()
+        assert handler._client is None
+
+    asyncio.run(scenario())
+
+    assert requests_seen == [
+        ("/", ["GET", "vehicle:VIN1"]),
+        ("/multi-exec", [["DEL", "k"], ["SET", "k", "v"]]),
+    ]
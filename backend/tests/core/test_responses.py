@@ -0,0 +1,52 @@
+from datetime import datetime
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.core.responses import APIResponse
+from benchmarks.bench_serialization import module_set_page, rent_history_page
+
+
+def test_api_response_matches_stdlib_json():
+    """orjson 응답 본문이 기존 stdlib JSONResponse 본문과 같아야 합니다. (datetime 형식 포함)"""
+    for payload in (module_set_page(5), rent_history_page(5)):
+        encoded = jsonable_encoder(payload)
+        assert APIResponse(encoded).body == JSONResponse(encoded).body
+
+
+def test_api_response_serializes_raw_error_details():
+    """에러 응답 detail에 datetime, set, 정수 키, 예외 객체가 있어도 직렬화되어야 합니다."""
+    response = APIResponse({
+        "detail": {
+            "at": datetime(2025, 2, 1, 10, 0, 0, 123000),
+            "ids": {3},
+            1: "int key",
+            "error": ValueError("boom"),
+        }
+    })
+
+    assert response.media_type == "application/json"
+    assert orjson.loads(response.body) == {
+        "detail": {
+            "at": "2025-02-01T10:00:00.123000",
+            "ids": [3],
+            "1": "int key",
+            "error": "boom",
+        }
+    }
+
+
+def test_routes_and_error_handlers_use_api_response(client):
+    """성공 응답과 전역 예외 처리기 응답이 모두 JSON으로 직렬화되어야 합니다."""
+    response = client.get("/api/user/module-sets?page=1&page_size=10")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+
+    response = client.get("/api/user/module-sets?page=0")
+    assert response.status_code == 422
+    assert response.json()["error_code"] == "VALIDATION_ERROR"
+
+    response = client.get("/api/user/option-types/999999")
+    assert response.status_code == 404
+    assert response.json()["error_code"] == "NOT_FOUND"
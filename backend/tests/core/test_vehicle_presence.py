@@ -0,0 +1,58 @@
+import asyncio
+
+from app.core.vehicle_presence import VehiclePresence, vehicle_presence
+
+
+def test_local_connection_skips_redis(mocker):
+    """이 프로세스에 연결된 차량은 Redis를 조회하지 않아야 합니다."""
+    redis_get = mocker.patch("app.core.vehicle_presence.async_redis_handler.get")
+    presence = VehiclePresence(negative_ttl=60)
+    presence.mark_connected("VIN1")
+
+    assert asyncio.run(presence.is_connected("VIN1")) is True
+    redis_get.assert_not_called()
+
+
+def test_redis_fallback_and_negative_cache(mocker):
+    """로컬에 없는 차량은 Redis로 확인하고, 미연결 결과는 TTL 동안 캐시해야 합니다."""
+    redis_get = mocker.patch("app.core.vehicle_presence.async_redis_handler.get", return_value=None)
+    presence = VehiclePresence(negative_ttl=60)
+
+    assert asyncio.run(presence.is_connected("VIN2")) is False
+    assert asyncio.run(presence.is_connected("VIN2")) is False
+    redis_get.assert_called_once_with("vehicle:VIN2")
+
+    # 다른 프로세스에 연결된 차량은 캐시 폐기 후 Redis로 확인
+    redis_get.return_value = "connected"
+    presence.forget("VIN2")
+    assert asyncio.run(presence.is_connected("VIN2")) is True
+    assert asyncio.run(presence.is_connected("VIN2")) is True
+    assert redis_get.call_count == 3
+
+
+def test_negative_cache_expires(mocker):
+    """미연결 캐시가 만료되면 다시 Redis를 조회해야 합니다."""
+    redis_get = mocker.patch("app.core.vehicle_presence.async_redis_handler.get", return_value=None)
+    presence = VehiclePresence(negative_ttl=0)
+
+    asyncio.run(presence.is_connected("VIN3"))
+    asyncio.run(presence.is_connected("VIN3"))
+    assert redis_get.call_count == 2
+
+
+def test_websocket_connect_and_disconnect_feed_presence(client, mocker):
+    """WebSocket 차량 연결/해제가 near cache에 바로 반영되어야 합니다."""
+    mocker.patch("app.websocket.websocket.async_redis_handler.set", return_value=True)
+    mocker.patch("app.websocket.websocket.async_redis_handler.delete", return_value=True)
+    redis_get = mocker.patch("app.core.vehicle_presence.async_redis_handler.get", return_value=None)
+
+    with client.websocket_connect("/socket/ws/VIN-WS") as websocket:
+        websocket.send_json({"type": "service", "path": "/vehicle/connect", "payload": {}})
+        assert websocket.receive_json()["payload"]["success"] is True
+        assert asyncio.run(vehicle_presence.is_connected("VIN-WS")) is True
+    redis_get.assert_not_called()
+
+    # 연결 해제 후에는 미연결로 캐시
+    assert asyncio.run(vehicle_presence.is_connected("VIN-WS")) is False
+    redis_get.assert_not_called()
+    vehicle_presence.clear()
@@ -0,0 +1,141 @@
+from datetime import date
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlmodel import Session, or_, select
+
+from app.db.crud.stats_rollup import maintenance_daily_stat_crud
+from app.db.crud.usage_history import usage_history_crud
+from app.db.crud.user import user_crud
+from app.db.crud.vehicle import vehicle_crud
+from app.db.models.maintenance_daily_stat import MaintenanceDailyStat
+from app.db.models.rent_history import RentHistory
+from app.db.models.usage_history import UsageHistory
+from app.db.models.user import User
+from app.db.models.vehicle import Vehicle
+from app.utils.lut_constants import ItemType, UsageStatus
+
+
+def test_save_without_refresh_uses_single_insert_returning(session: Session, sql_statements):
+    """refresh=False로 저장하면 INSERT ... RETURNING 한 번으로 키와 server_default 값이 채워져야 합니다."""
+    # Given: 사용 기록을 연결할 렌트
+    rent = session.exec(select(RentHistory)).first()
+    entry = UsageHistory(
+        rent_id=rent.rent_id,
+        item_id=1,
+        item_type_id=ItemType.VEHICLE.ID,
+        usage_status_id=UsageStatus.IN_USE.ID
+    )
+    sql_statements.clear()
+
+    # When: refresh 없이 저장
+    created = usage_history_crud.save(session, entry, refresh=False)
+
+    # Then: SQL 문은 INSERT ... RETURNING 하나이며, 추가 조회 없이 값이 채워짐
+    assert len(sql_statements) == 1
+    assert sql_statements[0].startswith("INSERT") and "RETURNING" in sql_statements[0]
+    assert created.usage_id is not None
+    assert created.__dict__.get("created_at") is not None
+    assert created.__dict__.get("updated_at") is not None
+    session.rollback()
+
+
+def _ilike_vehicle_ids(session: Session, term: str) -> set:
+    """기존 ILIKE 검색 결과 (비교 기준)"""
+    return set(session.exec(
+        select(Vehicle.vehicle_id).where(or_(Vehicle.vin.ilike(f"%{term}%"), Vehicle.vehicle_number.ilike(f"%{term}%")))
+    ).all())
+
+
+@pytest.mark.parametrize("term", ["00001", "pbv-0001", "VINNUMBER0002", "1"])
+def test_get_list_search_matches_ilike(session: Session, sql_statements, term):
+    """전문 검색 인덱스 결과가 ILIKE '%검색어%' 결과와 같아야 하며, 3글자 이상이면 FTS 인덱스를 사용해야 합니다."""
+    # When: 차량 번호/VIN으로 검색
+    sql_statements.clear()
+    result = vehicle_crud.get_list(
+        session, search=term, search_fields=["vin", "vehicle_number"], page_size=100
+    )
+
+    # Then: ILIKE 결과와 동일하고, 짧은 검색어는 ILIKE로 처리됨
+    assert {vehicle.vehicle_id for vehicle in result["items"]} == _ilike_vehicle_ids(session, term)
+    assert result["pagination"]["totalItems"] == len(result["items"])
+    uses_index = any("vehicle_fts MATCH" in statement for statement in sql_statements)
+    assert uses_index == (len(term) >= 3)
+
+
+def test_search_index_follows_writes(session: Session):
+    """트리거로 검색 인덱스가 원본 테이블의 INSERT/UPDATE/DELETE를 따라가야 합니다."""
+    def search_ids(term: str) -> list:
+        result = vehicle_crud.get_list(session, search=term, search_fields=["vin"], include_deleted=True)
+        return [vehicle.vehicle_id for vehicle in result["items"]]
+
+    # Given: VIN 변경
+    vehicle = session.get(Vehicle, 1)
+    vehicle.vin = "RENAMEDVIN00001"
+    session.add(vehicle)
+    session.commit()
+
+    # Then: 새 값으로 검색되고 이전 값으로는 검색되지 않음 (대소문자 무시)
+    assert search_ids("renamedvin") == [1]
+    assert 1 not in search_ids("PBVVINNUMBER00001")
+
+    # When: 삭제하면 검색되지 않음
+    session.delete(vehicle)
+    session.commit()
+    assert search_ids("renamedvin") == []
+
+
+def test_get_list_search_orders_by_relevance(session: Session):
+    """정렬 조건 없이 검색하면 관련도 순으로 정렬되고 커서를 발급하지 않으며, sort_by를 지정하면 기존 정렬을 따라야 합니다."""
+    # Given: 아이디/이메일/이름 모두에 "example"이 들어간 사용자 (시드 사용자는 이메일 도메인만 일치)
+    session.add(User(
+        user_id="example", user_password="x", user_email="example@example.com", user_name="Example",
+        user_phone_num="010-1111-1111", user_address="Seoul", role_id=3
+    ))
+    session.commit()
+
+    # When: 정렬 조건 없이 검색
+    ranked = user_crud.get_list(session, search="example", search_fields=["user_id", "user_email", "user_name"], page_size=1)
+
+    # Then: 기본 키 순서와 관계없이 더 많이 일치하는 사용자가 먼저 조회되고, 다음 페이지는 page 번호로 조회 (커서 미발급)
+    assert ranked["pagination"]["totalItems"] > 1
+    assert ranked["items"][0].user_id == "example"
+    assert ranked["pagination"]["nextCursor"] is None
+
+    # When: 여러 사용자가 일치하는 검색어를 sort_by와 함께 조회
+    sorted_page = user_crud.get_list(
+        session, search="example", search_fields=["user_email"], sort_by="user_id", page_size=1
+    )
+
+    # Then: 지정한 정렬을 따르고 다음 페이지 커서가 발급됨
+    assert sorted_page["items"][0].user_id == "admin"
+    assert sorted_page["pagination"]["nextCursor"] is not None
+
+
+def test_increment_counter_upserts_in_one_statement(session: Session, sql_statements):
+    """카운터 증감은 행이 없을 때도 INSERT ... ON CONFLICT DO UPDATE 한 문장으로 처리되어야 합니다."""
+    stat_date = date(2099, 1, 1)
+    sql_statements.clear()
+
+    # When: 같은 날짜에 두 번 증감 (첫 번째는 행 생성)
+    maintenance_daily_stat_crud.increment_counter(session, {"stat_date": stat_date}, {"maintenance_count": 1, "cost": 100.0})
+    maintenance_daily_stat_crud.increment_counter(session, {"stat_date": stat_date}, {"maintenance_count": 2, "cost": 50.0})
+
+    # Then: 문장마다 upsert 하나이며, 값이 누적됨
+    assert len(sql_statements) == 2
+    assert all("ON CONFLICT" in statement for statement in sql_statements)
+    row = session.exec(select(MaintenanceDailyStat).where(MaintenanceDailyStat.stat_date == stat_date)).one()
+    assert (row.maintenance_count, row.cost) == (3, 150.0)
+    session.rollback()
+
+
+def test_counter_upsert_compiles_for_postgresql():
+    """PostgreSQL에서도 기본 키 충돌 시 카운터를 더하는 upsert로 컴파일되어야 합니다."""
+    statement = maintenance_daily_stat_crud.build_counter_upsert(
+        {"stat_date": date(2099, 1, 1)}, {"maintenance_count": 1, "cost": 100.0}, "postgresql"
+    )
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+
+    assert "ON CONFLICT (stat_date) DO UPDATE SET" in sql
+    assert "maintenance_count = (maintenance_daily_stat.maintenance_count + excluded.maintenance_count)" in sql
+    assert maintenance_daily_stat_crud.build_counter_upsert({"stat_date": date(2099, 1, 1)}, {"cost": 1}, "mysql") is None
@@ -0,0 +1,26 @@
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.database import create_db_engine, read_sqlite_pragmas
+
+# PRAGMA 조회 결과는 설정 이름이 아닌 정수로 반환됨
+SYNCHRONOUS_VALUES = {"OFF": 0, "NORMAL": 1, "FULL": 2, "EXTRA": 3}
+TEMP_STORE_VALUES = {"DEFAULT": 0, "FILE": 1, "MEMORY": 2}
+
+
+def test_sqlite_engine_applies_pragmas(tmp_path):
+    """SQLite 엔진은 새 연결마다 설정된 PRAGMA(WAL, synchronous, busy_timeout 등)를 적용해야 합니다."""
+    # Given: 설정 기반 SQLite 엔진
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'profile.db'}")
+
+    # When: 새 연결에서 PRAGMA 값 조회
+    with Session(engine) as session:
+        pragmas = read_sqlite_pragmas(session)
+
+    # Then: 설정값이 그대로 적용됨
+    assert pragmas["journal_mode"].upper() == settings.SQLITE_JOURNAL_MODE
+    assert pragmas["synchronous"] == SYNCHRONOUS_VALUES[settings.SQLITE_SYNCHRONOUS]
+    assert pragmas["busy_timeout"] == settings.SQLITE_BUSY_TIMEOUT_MS
+    assert pragmas["cache_size"] == -settings.SQLITE_CACHE_SIZE_KB
+    assert pragmas["temp_store"] == TEMP_STORE_VALUES[settings.SQLITE_TEMP_STORE]
+    engine.dispose()
@@ -0,0 +1,89 @@
+from sqlmodel import Session, select
+
+from app.db.crud.free_pool import free_pool
+from app.db.crud.module import module_crud
+from app.db.crud.option import option_crud
+from app.db.crud.vehicle import vehicle_crud
+from app.db.models.option import Option
+from app.db.models.vehicle import Vehicle
+from app.utils.lut_constants import ItemStatus, ItemType
+
+INACTIVE = {"item_status_id": ItemStatus.INACTIVE.ID}
+ACTIVE = {"item_status_id": ItemStatus.ACTIVE.ID}
+VEHICLE_KEY = (ItemType.VEHICLE.ID, None)
+
+
+def test_rebuild_indexes_inactive_items_by_type(session: Session):
+    """재구성 시 INACTIVE 아이템이 아이템 종류/타입별로 적재되어야 합니다."""
+    free_pool.rebuild(session)
+
+    vehicles = session.exec(select(Vehicle).where(Vehicle.item_status_id == ItemStatus.INACTIVE.ID)).all()
+    options = session.exec(select(Option).where(Option.item_status_id == ItemStatus.INACTIVE.ID)).all()
+    assert free_pool.size(VEHICLE_KEY) == len(vehicles)
+    for option in options:
+        assert ((ItemType.OPTION.ID, option.option_type_id), option.option_id) in free_pool
+
+
+def test_claim_takes_from_pool_and_release_returns_after_commit(session: Session, sql_statements):
+    """선점은 인덱스 후보의 기본 키로 처리되고, 반납은 커밋 후 인덱스에 반영되어야 합니다."""
+    free_pool.rebuild(session)
+    size = free_pool.size(VEHICLE_KEY)
+
+    # When: 차량 선점 후 커밋
+    sql_statements.clear()
+    [vehicle] = vehicle_crud.claim(session, INACTIVE, ACTIVE)
+    session.commit()
+
+    # Then: 후보 ID 조건으로 UPDATE 한 번만 실행되고, 인덱스에서 제외됨
+    assert len(sql_statements) == 1
+    assert sql_statements[0].startswith("UPDATE vehicle") and "vehicle.vehicle_id IN (?)" in sql_statements[0]
+    assert (VEHICLE_KEY, vehicle.vehicle_id) not in free_pool
+    assert free_pool.size(VEHICLE_KEY) == size - 1
+
+    # When: 반납했지만 아직 커밋 전
+    vehicle_crud.bulk_update(session, [vehicle.vehicle_id], INACTIVE, id_field="vehicle_id")
+    assert (VEHICLE_KEY, vehicle.vehicle_id) not in free_pool
+
+    # Then: 커밋 후 인덱스에 다시 추가됨
+    session.commit()
+    assert (VEHICLE_KEY, vehicle.vehicle_id) in free_pool
+
+
+def test_rollback_restores_claimed_items(session: Session):
+    """선점 후 롤백되면 꺼냈던 ID가 인덱스로 돌아와야 합니다."""
+    free_pool.rebuild(session)
+    option = session.exec(select(Option).where(Option.item_status_id == ItemStatus.INACTIVE.ID)).first()
+    key = (ItemType.OPTION.ID, option.option_type_id)
+    size = free_pool.size(key)
+
+    claimed = option_crud.claim(session, {**INACTIVE, "option_type_id": option.option_type_id}, ACTIVE, 2)
+    assert len(claimed) == 2
+    assert free_pool.size(key) == size - 2
+
+    session.rollback()
+    assert free_pool.size(key) == size
+
+
+def test_stale_pool_entries_fall_back_to_table_scan(session: Session):
+    """인덱스 후보가 이미 사용 중이면 버리고 테이블에서 사용 가능한 아이템을 선점해야 합니다."""
+    # Given: 모듈 1이 DB에서는 사용 중이지만 인덱스에는 남아 있는 상태
+    free_pool.rebuild(session)
+    module = module_crud.get_by_id(session, 1)
+    module_crud.bulk_update(session, [module.module_id], ACTIVE, id_field="module_id")
+    session.commit()
+    key = (ItemType.MODULE.ID, module.module_type_id)
+    free_pool.rebuild(session)
+    free_pool._pools[key].add(module.module_id)
+
+    # When: 같은 모듈 타입을 선점
+    claimed = module_crud.claim(session, {**INACTIVE, "module_type_id": module.module_type_id}, ACTIVE)
+
+    # Then: 오래된 후보는 버려지고, 사용 가능한 모듈이 없으므로 선점 결과는 비어 있음
+    assert claimed == []
+    assert (key, module.module_id) not in free_pool
+
+    # When: 인덱스에 없는 사용 가능한 차량도 테이블 스캔으로 선점
+    free_pool.clear()
+    [vehicle] = vehicle_crud.claim(session, INACTIVE, ACTIVE)
+    assert vehicle.item_status_id == ItemStatus.ACTIVE.ID
+    session.rollback()
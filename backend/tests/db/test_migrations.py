@@ -0,0 +1,76 @@
+from sqlmodel import Session, SQLModel, create_engine, func, select
+from sqlalchemy import inspect
+
+from app import seed
+from app.db.migrations import HOT_PATH_INDEXES, find_missing_indexes, run_migrations
+from app.db.crud.vehicle import vehicle_crud
+from app.db.models import MaintenanceDailyStat, OptionUsageDailyStat, RentDailyStat, RentHistory
+from app.db.search_index import SEARCH_INDEXES
+
+
+def test_run_migrations_adds_missing_indexes(tmp_path):
+    """인덱스가 없는 기존 DB에 마이그레이션을 적용하면 누락 인덱스가 생성되고, 재실행 시 아무것도 적용하지 않아야 합니다."""
+    # Given: 인덱스 없이 테이블만 존재하는 기존 DB
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        for index in HOT_PATH_INDEXES:
+            index.drop(bind=connection)
+    assert len(find_missing_indexes(engine)) == len(HOT_PATH_INDEXES)
+
+    # When: 마이그레이션 실행
+    applied = run_migrations(engine)
+
+    # Then: 모든 인덱스가 생성되고 재실행 시 적용할 마이그레이션이 없음
+    assert applied == [1, 2, 3]
+    assert find_missing_indexes(engine) == []
+    assert run_migrations(engine) == []
+    engine.dispose()
+
+
+def test_rollup_migration_backfills_existing_data(tmp_path):
+    """집계 테이블이 없는 기존 DB에 마이그레이션을 적용하면 기존 렌트/정비/옵션 사용 기록으로 채워져야 합니다."""
+    # Given: 데이터가 있고 집계 테이블은 없는 기존 DB
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        seed.seed_data(session)
+        session.commit()
+    rollup_tables = [RentDailyStat.__table__, MaintenanceDailyStat.__table__, OptionUsageDailyStat.__table__]
+    SQLModel.metadata.drop_all(engine, tables=rollup_tables)
+
+    # When: 마이그레이션 실행
+    run_migrations(engine)
+
+    # Then: 렌트 건수 합계가 rent_history와 일치
+    with Session(engine) as session:
+        assert session.exec(select(func.sum(RentDailyStat.rent_count))).one() == session.exec(
+            select(func.count()).select_from(RentHistory)
+        ).one()
+        assert session.exec(select(func.count()).select_from(MaintenanceDailyStat)).one() > 0
+    engine.dispose()
+
+
+def test_search_index_migration_indexes_existing_rows(tmp_path):
+    """검색 인덱스가 없는 기존 DB에 마이그레이션을 적용하면 인덱스 테이블이 생성되고 기존 행이 색인되어야 합니다."""
+    # Given: 데이터가 있고 FTS 테이블/트리거는 없는 기존 DB
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        for index in SEARCH_INDEXES:
+            connection.exec_driver_sql(f"DROP TABLE {index.name}")
+            for suffix in ("ai", "ad", "au"):
+                connection.exec_driver_sql(f"DROP TRIGGER {index.name}_{suffix}")
+    with Session(engine) as session:
+        seed.seed_data(session)
+        session.commit()
+
+    # When: 마이그레이션 실행
+    run_migrations(engine)
+
+    # Then: FTS 테이블이 생성되고 기존 차량이 검색됨
+    assert {index.name for index in SEARCH_INDEXES} <= set(inspect(engine).get_table_names())
+    with Session(engine) as session:
+        result = vehicle_crud.get_list(session, search="PBV-00001", search_fields=["vehicle_number"])
+        assert [vehicle.vehicle_number for vehicle in result["items"]] == ["PBV-00001"]
+    engine.dispose()
@@ -0,0 +1,21 @@
+from sqlmodel import Session, select
+
+from app.db.crud.option_stock import option_stock_crud
+from app.db.models.option_type import OptionType
+from app.utils.lut_constants import ItemStatus
+
+
+def test_adjust_creates_and_updates_counter_with_upsert(session: Session, sql_statements):
+    """새 (옵션 타입, 상태) 카운터 생성과 증감은 각각 upsert 한 문장이어야 합니다. (동시 첫 쓰기 충돌 방지)"""
+    option_type_id = session.exec(select(OptionType.option_type_id)).first()
+    status_id = ItemStatus.MAINTENANCE.ID
+    before = option_stock_crud.get_quantities(session, [option_type_id], status_id)[option_type_id]
+    sql_statements.clear()
+
+    option_stock_crud.adjust(session, option_type_id, status_id, 2)
+    option_stock_crud.adjust(session, option_type_id, status_id, -1)
+
+    assert len(sql_statements) == 2
+    assert all("ON CONFLICT" in statement for statement in sql_statements)
+    assert option_stock_crud.get_quantities(session, [option_type_id], status_id)[option_type_id] == before + 1
+    session.rollback()
@@ -0,0 +1,170 @@
+from datetime import datetime, timedelta
+import asyncio
+import json
+
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api.schemas.user.rent_schema import RentRequest
+from app.db.models.lut import ModuleType
+from app.db.models.module import Module
+from app.db.models.option import Option
+from app.db.models.option_type import OptionType
+from app.db.models.rent_history import RentHistory
+from app.db.models.usage_history import UsageHistory
+from app.db.models.user import User
+from app.db.models.vehicle import Vehicle
+from app.db.crud.option_stock import option_stock_crud
+from app.services.user.rent_service import RentService
+from app.utils.exceptions import NotFoundError
+from app.utils.lut_constants import ItemStatus, ItemType, RentStatus, UsageStatus
+from tests.helpers import user_token
+
+
+def _build_rent_request(session, quantity: int = 1) -> dict:
+    """시드 데이터 기준으로 비용이 맞는 렌트 요청을 구성합니다."""
+    module_type = session.exec(select(ModuleType)).first()
+    option_type = session.exec(select(OptionType)).first()
+    start = datetime.now() + timedelta(hours=1)
+    end = start + timedelta(hours=6)
+    cost = (
+        int(module_type.module_type_cost)
+        + int(option_type.option_type_cost) * quantity
+        + RentService.calculate_rental_cost(start, end)
+    )
+    return {
+        "selectedOptionTypes": [{"optionTypeId": option_type.option_type_id, "quantity": quantity}],
+        "autonomousArrivalPoint": {"x": 12.313, "y": 32.3232},
+        "autonomousDeparturePoint": {"x": 11.512, "y": 30.4531},
+        "moduleTypeId": module_type.module_type_id,
+        "cost": cost,
+        "rentStartDate": start.isoformat(),
+        "rentEndDate": end.isoformat(),
+    }
+
+
+def test_create_and_cancel_rent_with_async_session(client, session, user_token, mocker):
+    """AsyncSession 기반 렌트 생성/취소가 한 트랜잭션으로 커밋되어야 합니다."""
+    # Given: 차량이 네트워크에 연결된 상태
+    mocker.patch("app.services.user.rent_service.vehicle_presence.is_connected", return_value=True)
+    mocker.patch("app.services.user.rent_service.WebSocketService")
+    headers = {"Authorization": f"Bearer {user_token}"}
+
+    # When: 렌트 생성
+    response = client.post("/api/user/rent", json=_build_rent_request(session), headers=headers)
+
+    # Then: 렌트 기록, 사용 기록, 차량 상태가 커밋됨
+    assert response.status_code == 200, response.json()
+    rent_id = response.json()["data"]["rent_id"]
+    session.expire_all()
+    rent = session.get(RentHistory, rent_id)
+    assert rent.rent_status_id == RentStatus.IN_PROGRESS.ID
+    usage_entries = session.exec(select(UsageHistory).where(UsageHistory.rent_id == rent_id)).all()
+    assert len(usage_entries) == 3
+    vehicle_id = next(entry.item_id for entry in usage_entries if entry.item_type_id == ItemType.VEHICLE.ID)
+    vehicle = session.get(Vehicle, vehicle_id)
+    assert vehicle.item_status_id == ItemStatus.ACTIVE.ID
+
+    # When: 렌트 취소
+    response = client.delete(f"/api/user/rent/{rent_id}", headers=headers)
+
+    # Then: 렌트 상태와 사용 기록이 갱신되고 차량이 반납됨
+    assert response.status_code == 200, response.json()
+    session.expire_all()
+    assert session.get(RentHistory, rent_id).rent_status_id == RentStatus.CANCELED.ID
+    usage_entries = session.exec(select(UsageHistory).where(UsageHistory.rent_id == rent_id)).all()
+    assert all(entry.usage_status_id == UsageStatus.COMPLETED.ID for entry in usage_entries)
+    assert session.get(Vehicle, vehicle_id).item_status_id == ItemStatus.INACTIVE.ID
+
+
+def test_rent_write_path_statement_count_is_independent_of_option_count(client, session, user_token, mocker, sql_statements):
+    """옵션 수가 늘어나도 렌트 생성/취소의 SQL 문 수는 같아야 하고, 옵션 재고 카운터는 정확해야 합니다."""
+    mocker.patch("app.services.user.rent_service.vehicle_presence.is_connected", return_value=True)
+    mocker.patch("app.services.user.rent_service.WebSocketService")
+    headers = {"Authorization": f"Bearer {user_token}"}
+
+    counts = []
+    # 첫 렌트는 오늘 날짜의 일별 집계 행을 생성(INSERT)하므로 측정에서 제외
+    for quantity in (1, 1, 3):
+        # When: 옵션 수량만 다른 렌트를 생성 후 취소
+        rent_request = _build_rent_request(session, quantity)
+        sql_statements.clear()
+        response = client.post("/api/user/rent", json=rent_request, headers=headers)
+        assert response.status_code == 200, response.json()
+        create_count = len(sql_statements)
+        rent_id = response.json()["data"]["rent_id"]
+
+        sql_statements.clear()
+        response = client.delete(f"/api/user/rent/{rent_id}", headers=headers)
+        assert response.status_code == 200, response.json()
+        counts.append((create_count, len(sql_statements)))
+
+    # Then: SQL 문 수가 동일하고, 카운터가 option 테이블 집계와 일치함
+    assert counts[1][0] > 0 and counts[1][1] > 0
+    assert counts[1] == counts[2]
+    option_type = session.exec(select(OptionType)).first()
+    session.expire_all()
+    counters = option_stock_crud.get_quantities(session, [option_type.option_type_id])
+    option_stock_crud.rebuild(session)
+    assert option_stock_crud.get_quantities(session, [option_type.option_type_id]) == counters
+    session.rollback()
+
+
+def test_concurrent_rents_never_claim_the_same_item(session, async_engine, mocker):
+    """동시에 들어온 렌트 요청이 같은 차량/모듈/옵션을 선점하지 않아야 합니다."""
+    mocker.patch("app.services.user.rent_service.vehicle_presence.is_connected", return_value=True)
+    mocker.patch("app.services.user.rent_service.WebSocketService")
+
+    # Given: 모듈은 충분하고, 차량 2대 / 옵션 3개가 병목인 상태
+    module_type = session.exec(select(ModuleType)).first()
+    session.add_all([
+        Module(
+            module_nfc_tag_id=f"CLAIMTEST{index:05d}",
+            module_type_id=module_type.module_type_id,
+            current_location=json.dumps({"x": 0, "y": 0}),
+            item_status_id=ItemStatus.INACTIVE.ID,
+            created_by=1,
+            updated_by=1
+        )
+        for index in range(4)
+    ])
+    session.commit()
+    rent_request = RentRequest.parse_obj(_build_rent_request(session))
+    user_pk = session.exec(select(User)).first().user_pk
+    option_type_id = rent_request.selectedOptionTypes[0].optionTypeId
+
+    async def _rent():
+        async with AsyncSession(async_engine, expire_on_commit=False) as async_session:
+            return await RentService.create_rent(async_session, rent_request, user_pk)
+
+    async def _rent_concurrently(count: int):
+        return await asyncio.gather(*[_rent() for _ in range(count)], return_exceptions=True)
+
+    # When: 렌트 8건을 동시에 요청
+    results = asyncio.run(_rent_concurrently(8))
+
+    # Then: 차량 수만큼만 성공하고, 나머지는 재고 부족으로 실패
+    succeeded = [result for result in results if not isinstance(result, Exception)]
+    failed = [result for result in results if isinstance(result, Exception)]
+    assert len(succeeded) == 2
+    assert all(isinstance(error, NotFoundError) for error in failed), failed
+
+    # Then: 성공한 렌트끼리 아이템이 겹치지 않고, 모두 ACTIVE 상태
+    session.expire_all()
+    rent_ids = [result.data.rent_id for result in succeeded]
+    usage_entries = session.exec(select(UsageHistory).where(UsageHistory.rent_id.in_(rent_ids))).all()
+    items = [(entry.item_type_id, entry.item_id) for entry in usage_entries]
+    assert len(items) == 2 * 3
+    assert len(set(items)) == len(items)
+    vehicle_ids = [item_id for item_type_id, item_id in items if item_type_id == ItemType.VEHICLE.ID]
+    assert all(session.get(Vehicle, vehicle_id).item_status_id == ItemStatus.ACTIVE.ID for vehicle_id in vehicle_ids)
+
+    # Then: 옵션 재고 카운터가 option 테이블 집계와 일치
+    active_options = session.exec(
+        select(Option).where(Option.option_type_id == option_type_id, Option.item_status_id == ItemStatus.ACTIVE.ID)
+    ).all()
+    assert len(active_options) == 2
+    counters = option_stock_crud.get_quantities(session, [option_type_id])
+    option_stock_crud.rebuild(session)
+    assert option_stock_crud.get_quantities(session, [option_type_id]) == counters
+    session.rollback()
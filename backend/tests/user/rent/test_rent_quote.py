@@ -0,0 +1,90 @@
+from datetime import datetime, timedelta
+
+from sqlmodel import select
+
+from app.core.catalog_version import Catalog, catalog_versions
+from app.db.models.lut import ModuleType
+from app.db.models.option_type import OptionType
+from app.services.user.rent_service import RentService
+
+
+def _quote_item(module_type_id: int, option_types, hours: int) -> dict:
+    start = datetime.now() + timedelta(hours=1)
+    return {
+        "moduleTypeId": module_type_id,
+        "selectedOptionTypes": [
+            {"optionTypeId": option_type_id, "quantity": quantity} for option_type_id, quantity in option_types
+        ],
+        "rentStartDate": start.isoformat(),
+        "rentEndDate": (start + timedelta(hours=hours)).isoformat(),
+    }
+
+
+def test_quotes_price_many_configurations_in_one_request(client, session, sql_statements):
+    """여러 조합의 견적을 한 번에 계산하고, 이후 견적은 SQL 없이 비용표로 계산되어야 합니다."""
+    module_type = session.exec(select(ModuleType)).first()
+    option_types = session.exec(select(OptionType).limit(2)).all()
+    items = [
+        _quote_item(module_type.module_type_id, [], 3),
+        _quote_item(module_type.module_type_id, [(option_types[0].option_type_id, 2)], 10),
+        _quote_item(module_type.module_type_id, [(option_type.option_type_id, 1) for option_type in option_types], 25),
+    ]
+
+    # When: 견적 일괄 요청
+    response = client.post("/api/user/rent/quotes", json={"quotes": items})
+
+    # Then: 요청 순서대로 모듈/옵션/기간 비용이 계산됨
+    assert response.status_code == 200, response.json()
+    quotes = response.json()["data"]["quotes"]
+    module_cost = int(module_type.module_type_cost)
+    first_option_cost = int(option_types[0].option_type_cost)
+    assert quotes[0] == {
+        "moduleTypeCost": module_cost,
+        "optionCost": 0,
+        "dateCost": RentService.MIN_HOURS * RentService.HOURLY_RATE,
+        "totalCost": module_cost + RentService.MIN_HOURS * RentService.HOURLY_RATE,
+    }
+    assert quotes[1]["optionCost"] == first_option_cost * 2
+    assert quotes[1]["dateCost"] == 10 * RentService.HOURLY_RATE
+    assert quotes[2]["optionCost"] == sum(int(option_type.option_type_cost) for option_type in option_types)
+    assert all(quote["totalCost"] == quote["moduleTypeCost"] + quote["optionCost"] + quote["dateCost"] for quote in quotes)
+
+    # When: 같은 카탈로그 version으로 다시 요청
+    sql_statements.clear()
+    response = client.post("/api/user/rent/quotes", json={"quotes": items})
+
+    # Then: 비용표를 재사용하여 SQL이 실행되지 않음
+    assert response.status_code == 200
+    assert response.json()["data"]["quotes"] == quotes
+    assert sql_statements == []
+
+
+def test_quotes_follow_option_type_cost_changes(client, session):
+    """옵션 타입 비용이 바뀌어 카탈로그 version이 올라가면 새 비용으로 견적해야 합니다."""
+    module_type = session.exec(select(ModuleType)).first()
+    option_type = session.exec(select(OptionType)).first()
+    item = _quote_item(module_type.module_type_id, [(option_type.option_type_id, 1)], 6)
+    before = client.post("/api/user/rent/quotes", json={"quotes": [item]}).json()["data"]
+
+    # When: 옵션 타입 비용 변경 후 카탈로그 갱신
+    option_type.option_type_cost += 5000
+    session.add(option_type)
+    session.commit()
+    catalog_versions.bump(Catalog.OPTION_TYPES)
+
+    # Then: 새 version과 비용으로 견적
+    after = client.post("/api/user/rent/quotes", json={"quotes": [item]}).json()["data"]
+    assert after["catalogVersion"] > before["catalogVersion"]
+    assert after["catalogVersion"] == catalog_versions.version(Catalog.OPTION_TYPES)
+    assert after["quotes"][0]["optionCost"] == before["quotes"][0]["optionCost"] + 5000
+
+
+def test_quotes_reject_unknown_option_type(client, session):
+    """존재하지 않는 옵션 타입이 포함되면 404를 반환해야 합니다."""
+    module_type = session.exec(select(ModuleType)).first()
+    response = client.post(
+        "/api/user/rent/quotes",
+        json={"quotes": [_quote_item(module_type.module_type_id, [(99999, 1)], 6)]}
+    )
+    assert response.status_code == 404
+    assert response.json()["detail"] == {"option_type_id": 99999}
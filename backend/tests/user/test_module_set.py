@@ -1,5 +1,6 @@
 import pytest
 from sqlmodel import SQLModel
+from tests.helpers import master_token
 
 def test_get_module_sets_success(client):
     """✅ 정상적인 모듈 세트 목록 조회 테스트"""
@@ -86,3 +87,41 @@ def test_get_module_sets_empty_database(client, session):
     assert data["resultCode"] == "SUCCESS"
     assert isinstance(data["data"]["moduleSets"], list)
     assert len(data["data"]["moduleSets"]) == 0  # ✅ 빈 리스트 체크
+
+def test_get_module_sets_conditional_get(client, master_token, sql_statements):
+    """🏷️ ETag 재검증: 변경이 없으면 DB 조회 없이 304, 관리자 수정 후에는 새 ETag로 200"""
+    # Given: 첫 조회로 ETag 획득
+    response = client.get("/api/user/module-sets?page=1&page_size=10")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert "max-age=" in response.headers["Cache-Control"]
+    assert "stale-while-revalidate=" in response.headers["Cache-Control"]
+    module_set_id = response.json()["data"]["moduleSets"][0]["moduleSetId"]
+
+    # When: 같은 ETag로 재검증
+    sql_statements.clear()
+    response = client.get("/api/user/module-sets?page=1&page_size=10", headers={"If-None-Match": etag})
+
+    # Then: 본문 없이 304, SQL 미실행
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+    assert sql_statements == []
+
+    # Given: 다른 페이지는 다른 ETag
+    response = client.get("/api/user/module-sets?page=2&page_size=10", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+
+    # When: 관리자가 모듈 세트를 수정한 뒤 이전 ETag로 재검증
+    response = client.patch(
+        f"/api/admin/module-sets/{module_set_id}",
+        json={"module_set_name": "Renamed Module Set"},
+        headers={"Authorization": f"Bearer {master_token}"}
+    )
+    assert response.status_code == 200
+    response = client.get("/api/user/module-sets?page=1&page_size=10", headers={"If-None-Match": etag})
+
+    # Then: 새 ETag와 변경된 데이터로 200
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json()["data"]["moduleSets"][0]["moduleSetName"] == "Renamed Module Set"
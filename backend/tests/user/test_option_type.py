@@ -1,5 +1,9 @@
 import pytest
+from sqlmodel import select, func
+from app.db.models.option import Option
 from app.db.models.option_type import OptionType
+from app.utils.lut_constants import ItemStatus
+from tests.helpers import master_token
 
 # 기본 조회 테스트
 def test_get_option_types(client):
@@ -85,3 +89,75 @@ def test_get_option_type_invalid_cases(client, invalid_id, expected_status):
         assert data["error_code"] == "NOT_FOUND"
     else:
         assert data["error_code"] == "VALIDATION_ERROR"
+
+# 재고 수량 테스트
+def test_get_option_type_stock_quantity_tracks_option_status(client, session, master_token):
+    def stock_of(option_type_id: int) -> int:
+        response = client.get(f"user/option-types/{option_type_id}")
+        return response.json()["data"]["optionTypes"][0]["stockQuantity"]
+
+    def inactive_count(option_type_id: int) -> int:
+        session.expire_all()
+        return session.exec(
+            select(func.count()).select_from(Option).where(
+                Option.option_type_id == option_type_id,
+                Option.item_status_id == ItemStatus.INACTIVE.ID,
+                Option.deleted_at == None
+            )
+        ).one()
+
+    option = session.exec(select(Option).where(Option.deleted_at == None)).first()
+    option_type_id = option.option_type_id
+    headers = {"Authorization": f"Bearer {master_token}"}
+    assert stock_of(option_type_id) == inactive_count(option_type_id)
+
+    # 옵션 등록 시 재고 증가
+    before = stock_of(option_type_id)
+    response = client.post("/api/admin/options", json={"option_type_id": option_type_id}, headers=headers)
+    assert response.status_code == 200
+    assert stock_of(option_type_id) == inactive_count(option_type_id) == before + 1
+
+    # 정비 등록 시 재고 감소
+    response = client.post(
+        "/api/admin/maintenance-history",
+        json={"item_type_name": "option", "item_id": option.option_id, "issue": "TEST_ISSUE", "cost": 10000},
+        headers=headers
+    )
+    assert response.status_code == 200
+    assert stock_of(option_type_id) == inactive_count(option_type_id) == before
+
+    # 옵션 삭제 시 재고 감소
+    other = session.exec(
+        select(Option).where(
+            Option.option_type_id == option_type_id,
+            Option.item_status_id == ItemStatus.INACTIVE.ID,
+            Option.deleted_at == None
+        )
+    ).first()
+    response = client.delete(f"/api/admin/options/{other.option_id}", headers=headers)
+    assert response.status_code == 200
+    assert stock_of(option_type_id) == inactive_count(option_type_id) == before - 1
+
+# 조건부 조회(ETag) 테스트
+def test_get_option_types_conditional_get(client, session, master_token, sql_statements):
+    response = client.get("user/option-types")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    # 변경이 없으면 DB 조회 없이 304 (약한 비교, 여러 값 허용)
+    sql_statements.clear()
+    response = client.get("user/option-types", headers={"If-None-Match": f'"other", W/{etag}'})
+    assert response.status_code == 304
+    assert sql_statements == []
+
+    # 옵션 등록으로 재고가 바뀌면 ETag 변경
+    option_type_id = session.exec(select(OptionType.option_type_id)).first()
+    response = client.post(
+        "/api/admin/options",
+        json={"option_type_id": option_type_id},
+        headers={"Authorization": f"Bearer {master_token}"}
+    )
+    assert response.status_code == 200
+    response = client.get("user/option-types", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag